@@ -0,0 +1,76 @@
+"""
+Benchmark the pandas and Arrow backends stage by stage.
+
+Writes a synthetic product-level Harvard export and times loading,
+merging, filling and clipping, name cleaning, summary statistics and
+extremes with each backend. The Arrow backend parses the CSV and runs
+column kernels on several threads, so its advantage grows with the
+number of cores; ``--threads`` caps Arrow's CPU pool for comparison.
+
+Usage::
+
+    python benchmarks/bench_backends.py --countries 250 --years 30 --products 100
+    python benchmarks/bench_backends.py --threads 1
+"""
+import argparse
+import tempfile
+import time
+
+import pyarrow as pa
+
+from econ_analysis_gbm2118.backends import get_backend
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST
+from econ_analysis_gbm2118.synthetic import write_synthetic_sources
+
+
+def run_stages(engine, harvard_csv: str, qog_xlsx: str) -> dict:
+    """Run every stage once with ``engine`` and return wall times by stage."""
+    timings = {}
+
+    def stage(name, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[name] = time.perf_counter() - start
+        return result
+
+    harvard = stage("load_harvard", engine.load_harvard, harvard_csv, year=None)
+    qog = stage("load_qog", engine.load_qog, qog_xlsx)
+    merged = stage("merge", engine.merge, harvard, qog)
+    merged = stage("fill_clip", engine.fill_and_clip, merged)
+    merged = stage("clean_names", engine.clean_names, merged)
+    stage("summary", engine.summary_statistics, merged, VARS_OF_INTEREST)
+    stage("extremes", engine.extreme_rank_countries, merged, "eci_rank_sitc", "bti_ep")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=250)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--extra-columns", type=int, default=20)
+    parser.add_argument("--threads", type=int, help="size of Arrow's CPU thread pool")
+    args = parser.parse_args()
+
+    if args.threads:
+        pa.set_cpu_count(args.threads)
+    print(f"arrow threads={pa.cpu_count()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        harvard_csv, qog_xlsx = write_synthetic_sources(
+            tmp, countries=args.countries, years=args.years, products=args.products,
+            extra_columns=args.extra_columns, seed=0,
+        )
+        print(f"rows={args.countries * args.years * args.products:,}")
+
+        results = {name: run_stages(get_backend(name), str(harvard_csv), str(qog_xlsx)) for name in ["pandas", "arrow"]}
+        print(f"{'stage':<14}{'pandas':>10}{'arrow':>10}{'speedup':>9}")
+        for stage in results["pandas"]:
+            pandas_time, arrow_time = results["pandas"][stage], results["arrow"][stage]
+            print(f"{stage:<14}{pandas_time:9.3f}s{arrow_time:9.3f}s{pandas_time / arrow_time:8.1f}x")
+        totals = [sum(r.values()) for r in results.values()]
+        print(f"{'total':<14}{totals[0]:9.3f}s{totals[1]:9.3f}s{totals[0] / totals[1]:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
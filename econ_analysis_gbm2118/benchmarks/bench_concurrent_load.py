@@ -0,0 +1,54 @@
+"""
+Benchmark serial and concurrent loading of the Harvard and QoG sources.
+
+A scaled-up Harvard CSV and a QoG-shaped workbook are written once, then
+loaded with ``load_sources`` serially, on a thread pool and on a process
+pool. The wall-clock saving over the serial load is reported.
+
+Usage::
+
+    python benchmarks/bench_concurrent_load.py --rows 1000000 --columns 400
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+from bench_qog_cache import write_workbook
+from common import scale_csv, timed
+
+from econ_analysis_gbm2118.pipeline import load_sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        xlsx_path = Path(tmp) / "qog_bas_cs.xlsx"
+        scale_csv(csv_path, args.rows)
+        write_workbook(xlsx_path, args.countries, args.columns)
+
+        results = {}
+        for label, workers, executor in [
+            ("serial", 1, "thread"),
+            ("thread pool", 2, "thread"),
+            ("process pool", 2, "process"),
+        ]:
+            results[label] = timed(
+                lambda: load_sources(str(csv_path), str(xlsx_path), max_workers=workers, executor=executor),
+                args.repeat,
+            )
+
+    print(f"rows={args.rows:,} qog={args.countries} x {args.columns} columns")
+    serial = results["serial"]
+    for label, elapsed in results.items():
+        print(f"{label:<13}: {elapsed:7.3f} s  (saves {serial - elapsed:6.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
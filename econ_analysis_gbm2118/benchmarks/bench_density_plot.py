@@ -0,0 +1,44 @@
+"""
+Benchmark density-aggregated scatterplots on large panels.
+
+Times rendering one PNG with ``render_plots`` as a marker scatter and as a
+NumPy 2-D histogram for growing row counts. Scatter time grows with the
+number of rows; density time stays roughly flat and depends on the grid.
+
+Usage::
+
+    python benchmarks/bench_density_plot.py --rows 10000 100000 1000000 --gridsize 200
+"""
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from common import timed
+
+from econ_analysis_gbm2118.visualization import render_plots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--gridsize", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            x = rng.normal(size=rows)
+            df = pd.DataFrame({"eci_sitc": x, "wef_gci": 4 + x + rng.normal(size=rows)})
+            pairs = [("eci_sitc", "wef_gci")]
+
+            scatter = timed(lambda: render_plots(df, pairs, tmp, max_workers=1, density_threshold=None))
+            density = timed(lambda: render_plots(
+                df, pairs, tmp, max_workers=1, density_threshold=0, gridsize=args.gridsize
+            ))
+            print(f"rows={rows:>10,}  scatter: {scatter:7.2f} s  density: {density:7.2f} s  ({scatter / density:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
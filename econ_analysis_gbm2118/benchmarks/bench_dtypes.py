@@ -0,0 +1,70 @@
+"""
+Benchmark the memory footprint of the cleaned data before and after dtype optimization.
+
+Writes a synthetic multi-year Harvard export, loads it with object and with
+Arrow-backed text columns, and shrinks the loaded panel with
+``optimize_dtypes`` before cleaning, as ``run_pipeline`` does with
+``dtype_optimization``. Reports the ``memory_usage(deep=True)`` of each
+frame, the time spent optimizing and summarizing, and whether the summary
+statistics of the cleaned data are unchanged.
+
+Usage::
+
+    python benchmarks/bench_dtypes.py --countries 200 --years 30 --products 20
+"""
+import argparse
+import tempfile
+
+import pandas as pd
+from common import timed
+
+from econ_analysis_gbm2118.analysis import summary_statistics
+from econ_analysis_gbm2118.cleaning import clean_merged_data, optimize_dtypes
+from econ_analysis_gbm2118.data import ARROW_STRING_DTYPE, load_harvard_data, load_qog_data
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST
+from econ_analysis_gbm2118.synthetic import write_synthetic_sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--products", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        harvard_csv, qog_xlsx = write_synthetic_sources(
+            tmp, countries=args.countries, years=args.years, products=args.products, seed=0
+        )
+        qog = load_qog_data(qog_xlsx)
+        harvard = load_harvard_data(harvard_csv, year=None)
+        arrow_harvard = load_harvard_data(harvard_csv, year=None, string_dtype=ARROW_STRING_DTYPE)
+
+    mib = lambda df: df.memory_usage(deep=True).sum() / 2**20
+    print(f"rows={len(harvard):,}")
+    print(f"loaded, object strings : {mib(harvard):8.1f} MiB")
+    print(f"loaded, Arrow strings  : {mib(arrow_harvard):8.1f} MiB")
+
+    optimized, report = optimize_dtypes(arrow_harvard)
+    print(f"loaded, optimized      : {mib(optimized):8.1f} MiB")
+    print(f"optimize_dtypes        : {timed(lambda: optimize_dtypes(arrow_harvard), args.repeat) * 1e3:8.1f} ms")
+
+    merged = clean_merged_data(arrow_harvard, qog)
+    optimized_merged = clean_merged_data(optimized, qog)
+    print(f"cleaned                : {mib(merged):8.1f} MiB")
+    print(f"cleaned, optimized     : {mib(optimized_merged):8.1f} MiB")
+
+    for label, df in [("cleaned", merged), ("optimized", optimized_merged)]:
+        elapsed = timed(lambda: summary_statistics(df, VARS_OF_INTEREST), args.repeat)
+        print(f"summary, {label:<14}: {elapsed * 1e3:8.1f} ms")
+
+    pd.testing.assert_frame_equal(
+        summary_statistics(optimized_merged, VARS_OF_INTEREST), summary_statistics(merged, VARS_OF_INTEREST)
+    )
+    print("summary statistics unchanged")
+    changed = report[report["dtype_before"] != report["dtype_after"]]
+    print(changed.to_string())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark cold and warm loads of the Harvard Atlas CSV.
+
+The bundled ``growth_proj_eci_rankings.csv`` is scaled up by repeating it
+until it reaches the requested row count, then loaded three ways:
+
+- uncached: plain ``pd.read_csv`` on every call
+- cold: first cached call, which parses the CSV and writes the Parquet copy
+- warm: later cached calls, which read straight from the Parquet copy
+
+Usage::
+
+    python benchmarks/bench_harvard_cache.py --rows 2000000
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+from common import scale_csv, timed
+
+from econ_analysis_gbm2118.data import load_harvard_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        cache_dir = Path(tmp) / "cache"
+        scale_csv(csv_path, args.rows)
+        size_mb = csv_path.stat().st_size / 1e6
+
+        uncached = timed(lambda: load_harvard_data(csv_path), args.repeat)
+        cold = timed(lambda: load_harvard_data(csv_path, cache_dir=cache_dir))
+        warm = timed(lambda: load_harvard_data(csv_path, cache_dir=cache_dir), args.repeat)
+
+    print(f"rows={args.rows:,} csv={size_mb:.1f} MB")
+    print(f"uncached read_csv : {uncached:8.3f} s")
+    print(f"cold (build cache): {cold:8.3f} s")
+    print(f"warm (cache hit)  : {warm:8.3f} s  ({uncached / warm:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark peak memory of whole-file and chunked Harvard Atlas loads.
+
+The bundled ``growth_proj_eci_rankings.csv`` is scaled up to the requested
+row count and loaded once with a full ``read_csv`` followed by the year
+filter, and once with the chunked reader that filters as it parses. Peak
+memory is measured with ``tracemalloc``.
+
+Usage::
+
+    python benchmarks/bench_harvard_streaming.py --rows 2000000 --chunksize 100000
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from common import scale_csv
+
+from econ_analysis_gbm2118.data import load_harvard_data
+
+
+def measure(func):
+    """Return ``(seconds, peak MB)`` for a single call to ``func``."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        scale_csv(csv_path, args.rows)
+
+        full_time, full_peak = measure(lambda: load_harvard_data(csv_path))
+        chunk_time, chunk_peak = measure(lambda: load_harvard_data(csv_path, chunksize=args.chunksize))
+
+    print(f"rows={args.rows:,} chunksize={args.chunksize:,}")
+    print(f"full read : {full_time:7.3f} s  peak {full_peak:8.1f} MB")
+    print(f"chunked   : {chunk_time:7.3f} s  peak {chunk_peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark cold-start import time of the package and CLI.
+
+Starts fresh interpreters for ``--help`` on the CLI and for importing the
+package and the pipeline, reports the median wall time of each, and lists
+the slowest imports seen by ``-X importtime``. Exits with status 1 when
+the CLI exceeds ``--budget`` seconds.
+
+Usage::
+
+    python benchmarks/bench_import_time.py --repeat 5 --budget 0.5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "cli --help": ["-m", "econ_analysis_gbm2118", "--help"],
+    "import package": ["-c", "import econ_analysis_gbm2118"],
+    "import pipeline": ["-c", "import econ_analysis_gbm2118.pipeline"],
+}
+
+
+def wall_time(args: list, repeat: int) -> float:
+    """Median wall time of ``repeat`` fresh interpreters running ``args``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def slowest_imports(args: list, top: int) -> list:
+    """``(cumulative_us, module)`` for the slowest top-level imports."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], check=True, capture_output=True, text=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            # Top-level entries are indented by exactly one space
+            if cumulative.strip().isdigit() and name.startswith(" ") and not name.startswith("  "):
+                rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.5)
+    args = parser.parse_args()
+
+    timings = {}
+    for label, command in COMMANDS.items():
+        timings[label] = wall_time(command, args.repeat)
+        print(f"{label:<16}: {timings[label]:6.3f} s")
+        for cumulative, name in slowest_imports(command, args.top):
+            print(f"    {cumulative / 1e6:6.3f} s  {name}")
+
+    if timings["cli --help"] > args.budget:
+        print(f"CLI cold start exceeds the {args.budget:.2f} s budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark merge_datasets against the previous string-key merge.
+
+A panel-shaped Harvard frame (countries x years x repeats) is merged with
+a QoG-shaped frame using the former ``DataFrame.merge`` implementation and
+the current indexed categorical join, both from column form and from a
+prebuilt :func:`index_qog` lookup.
+
+Usage::
+
+    python benchmarks/bench_merge.py --countries 200 --years 30 --repeats 80 --qog-columns 50
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import timed
+
+from econ_analysis_gbm2118.cleaning import index_qog, merge_datasets
+
+
+def legacy_merge(df_harvard, df_qog):
+    """The string-key merge used before the indexed join."""
+    merged = df_harvard.merge(
+        df_qog,
+        left_on="country_iso3_code",
+        right_on="ccodealp",
+        how="left",
+        suffixes=("", "_qog")
+    )
+    for col in ["bti_ep", "bti_eos"]:
+        if f"{col}_qog" in merged.columns:
+            merged[col] = merged[f"{col}_qog"]
+            merged.drop(columns=[f"{col}_qog"], inplace=True)
+    merged.drop(columns=["ccodealp"], errors="ignore", inplace=True)
+    return merged
+
+
+def make_inputs(countries, years, repeats, qog_columns, seed=0):
+    """Build Harvard and QoG frames sharing ``countries`` ISO3 codes."""
+    rng = np.random.default_rng(seed)
+    codes = np.array([f"C{i:03d}" for i in range(countries)], dtype=object)
+    rows = countries * years * repeats
+
+    harvard = pd.DataFrame({
+        "country_iso3_code": np.tile(codes, years * repeats),
+        "year": np.repeat(np.arange(2023 - years + 1, 2024), countries * repeats),
+        "eci_sitc": rng.normal(size=rows),
+        "eci_rank_sitc": rng.integers(1, countries, size=rows).astype(float),
+        "bti_ep": rng.normal(size=rows),
+    })
+
+    qog = pd.DataFrame(
+        rng.normal(size=(countries, qog_columns)),
+        columns=[f"ind_{i:03d}" for i in range(qog_columns)],
+    )
+    qog.insert(0, "ccodealp", codes)
+    qog["bti_ep"] = rng.normal(size=countries)
+    qog["bti_eos"] = rng.normal(size=countries)
+    # A tenth of the Harvard countries have no QoG row
+    return harvard, qog.iloc[: countries - countries // 10]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=80)
+    parser.add_argument("--qog-columns", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    harvard, qog = make_inputs(args.countries, args.years, args.repeats, args.qog_columns)
+    indexed = index_qog(qog)
+    pd.testing.assert_frame_equal(merge_datasets(harvard, qog), legacy_merge(harvard, qog))
+
+    legacy = timed(lambda: legacy_merge(harvard, qog), args.repeat)
+    current = timed(lambda: merge_datasets(harvard, qog), args.repeat)
+    prebuilt = timed(lambda: merge_datasets(harvard, indexed), args.repeat)
+
+    print(f"harvard rows={len(harvard):,} qog={len(qog)} x {qog.shape[1]} columns")
+    print(f"legacy DataFrame.merge : {legacy:7.3f} s")
+    print(f"indexed join           : {current:7.3f} s  ({legacy / current:.1f}x)")
+    print(f"indexed join, prebuilt : {prebuilt:7.3f} s  ({legacy / prebuilt:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
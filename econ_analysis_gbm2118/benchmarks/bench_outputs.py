@@ -0,0 +1,87 @@
+"""
+Benchmark chunked output writing against whole-frame writes.
+
+Writes a scaled-up Harvard panel with ``write_frame`` in row groups and
+with ``DataFrame.to_parquet`` / ``DataFrame.to_csv`` in one call. Each
+case runs in a fresh process that loads the frame, resets the kernel's
+peak RSS counter (Linux only) and reports how far the peak rose above
+the loaded frame during the write.
+
+Usage::
+
+    python benchmarks/bench_outputs.py --rows 2000000 --row-group-size 100000
+"""
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from common import scale_csv
+
+from econ_analysis_gbm2118.outputs import write_frame
+
+
+def rss_bytes(field: str) -> int:
+    """Read a memory field such as ``VmRSS`` or ``VmHWM`` from /proc."""
+    with open("/proc/self/status") as fh:
+        for line in fh:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def run_case(source: str, target: str, chunked: bool, row_group_size: int, queue) -> None:
+    """Load ``source``, write it to ``target`` and report time and RSS growth."""
+    df = pd.read_parquet(source)
+    # Writing "5" resets the peak RSS (VmHWM) to the current RSS
+    with open("/proc/self/clear_refs", "w") as fh:
+        fh.write("5")
+    before = rss_bytes("VmRSS")
+    start = time.perf_counter()
+    if chunked:
+        fmt = "csv" if target.endswith(".csv") else "parquet"
+        write_frame(df, target, format=fmt, row_group_size=row_group_size)
+    elif target.endswith(".csv"):
+        df.to_csv(target, index=False)
+    else:
+        df.to_parquet(target, index=False)
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, rss_bytes("VmHWM") - before))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--row-group-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        source = str(Path(tmp) / "source.parquet")
+        scale_csv(csv_path, args.rows)
+        df = pd.read_csv(csv_path)
+        df.to_parquet(source, index=False)
+        print(f"rows={len(df):,} frame={df.memory_usage(deep=True).sum() / 2**20:.0f} MiB")
+
+        for label, name, chunked in [
+            ("parquet, to_parquet ", "a.parquet", False),
+            ("parquet, write_frame", "b.parquet", True),
+            ("csv, to_csv         ", "a.csv", False),
+            ("csv, write_frame    ", "b.csv", True),
+        ]:
+            queue = ctx.Queue()
+            proc = ctx.Process(
+                target=run_case, args=(source, str(Path(tmp) / name), chunked, args.row_group_size, queue)
+            )
+            proc.start()
+            elapsed, growth = queue.get()
+            proc.join()
+            print(f"{label}: {elapsed:7.2f} s  peak RSS growth {growth / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
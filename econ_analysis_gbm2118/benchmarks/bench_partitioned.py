@@ -0,0 +1,72 @@
+"""
+Benchmark out-of-core partitioned cleaning against the in-memory path.
+
+Writes a synthetic product-level Harvard export and cleans and summarizes
+it with ``run_partitioned`` (by year and by country block) and with
+``load_harvard_data`` + ``clean_merged_data`` + ``summary_statistics``.
+Each case runs in a fresh process that resets the kernel's peak RSS
+counter (Linux only) after imports and reports how far the peak rose.
+
+Usage::
+
+    python benchmarks/bench_partitioned.py --countries 200 --years 30 --products 100
+"""
+import argparse
+import multiprocessing
+import tempfile
+import time
+
+from bench_outputs import rss_bytes
+
+from econ_analysis_gbm2118.synthetic import write_synthetic_sources
+
+
+def run_case(harvard_csv: str, qog_xlsx: str, mode: str, chunksize: int, queue) -> None:
+    """Clean and summarize the sources with one mode and report time and RSS growth."""
+    from econ_analysis_gbm2118.analysis import summary_statistics
+    from econ_analysis_gbm2118.cleaning import clean_merged_data
+    from econ_analysis_gbm2118.data import load_harvard_data, load_qog_data
+    from econ_analysis_gbm2118.partitioned import run_partitioned
+    from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST
+
+    with open("/proc/self/clear_refs", "w") as fh:
+        fh.write("5")
+    before = rss_bytes("VmRSS")
+    start = time.perf_counter()
+    if mode == "in-memory":
+        merged = clean_merged_data(load_harvard_data(harvard_csv, year=None), load_qog_data(qog_xlsx))
+        summary_statistics(merged, VARS_OF_INTEREST)
+    else:
+        by, _, blocks = mode.partition(":")
+        run_partitioned(harvard_csv, qog_xlsx, by=by, chunksize=chunksize, country_blocks=int(blocks or 16))
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, rss_bytes("VmHWM") - before))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        harvard_csv, qog_xlsx = write_synthetic_sources(
+            tmp, countries=args.countries, years=args.years, products=args.products, seed=0
+        )
+        rows = args.countries * args.years * args.products
+        print(f"rows={rows:,} csv={harvard_csv.stat().st_size / 2**20:.0f} MiB")
+
+        for mode in ["in-memory", "year", "country:16", "country:64"]:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=run_case, args=(str(harvard_csv), str(qog_xlsx), mode, args.chunksize, queue))
+            proc.start()
+            elapsed, growth = queue.get()
+            proc.join()
+            print(f"{mode:<11}: {elapsed:7.2f} s  peak RSS growth {growth / 2**20:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
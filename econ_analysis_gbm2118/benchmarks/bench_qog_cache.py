@@ -0,0 +1,65 @@
+"""
+Benchmark QoG loads from Excel against the cached Parquet copy.
+
+A synthetic workbook shaped like the QoG basic cross-section (about 200
+countries and several hundred indicator columns) is written once, then
+loaded three ways:
+
+- excel: ``pd.read_excel`` of the whole workbook on every call
+- cold: first cached call, which parses the workbook and writes Parquet
+- warm: later cached calls, which read only ``QOG_COLUMNS`` from Parquet
+
+Usage::
+
+    python benchmarks/bench_qog_cache.py --countries 200 --columns 400
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from common import timed
+
+from econ_analysis_gbm2118.data import load_qog_data, QOG_COLUMNS
+
+
+def write_workbook(target: Path, countries: int, columns: int) -> None:
+    """Write a QoG-shaped workbook with ``columns`` numeric indicators."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(size=(countries, columns)),
+        columns=[f"ind_{i:03d}" for i in range(columns)],
+    )
+    df.insert(0, "ccodealp", [f"C{i:02d}" for i in range(countries)])
+    df.insert(1, "cname", [f"Country {i}" for i in range(countries)])
+    for col in QOG_COLUMNS[2:]:
+        df[col] = rng.normal(size=countries)
+    df.to_excel(target, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx_path = Path(tmp) / "qog_bas_cs.xlsx"
+        cache_dir = Path(tmp) / "cache"
+        write_workbook(xlsx_path, args.countries, args.columns)
+
+        excel = timed(lambda: load_qog_data(str(xlsx_path), columns=QOG_COLUMNS), args.repeat)
+        cold = timed(lambda: load_qog_data(str(xlsx_path), columns=QOG_COLUMNS, cache_dir=cache_dir))
+        warm = timed(lambda: load_qog_data(str(xlsx_path), columns=QOG_COLUMNS, cache_dir=cache_dir), args.repeat)
+
+    print(f"countries={args.countries} columns={args.columns + len(QOG_COLUMNS)}")
+    print(f"excel (no cache)  : {excel:8.3f} s")
+    print(f"cold (build cache): {cold:8.3f} s")
+    print(f"warm (cache hit)  : {warm:8.3f} s  ({excel / warm:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark headless batch rendering of scatterplots.
+
+Renders every ECI variant against ``growth_proj`` for each year of the
+sample Harvard CSV (well over 100 figures) with ``render_plots``, serially
+and on a process pool, and reports throughput in figures per second.
+
+Usage::
+
+    python benchmarks/bench_render_plots.py --jobs 4 --formats png svg
+"""
+import argparse
+import tempfile
+
+import pandas as pd
+
+from common import SAMPLE_CSV, timed
+
+from econ_analysis_gbm2118.visualization import render_plots
+
+PAIRS = [
+    ("eci_sitc", "growth_proj"),
+    ("eci_hs92", "growth_proj"),
+    ("eci_hs12", "growth_proj"),
+    ("eci_sitc", "eci_hs92"),
+    ("eci_hs92", "eci_hs12"),
+    ("eci_rank_sitc", "growth_proj"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--formats", nargs="+", default=["png"])
+    args = parser.parse_args()
+
+    df = pd.read_csv(SAMPLE_CSV)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = render_plots(df, PAIRS, tmp, by_year=True, formats=args.formats, max_workers=1)
+        figures = len(manifest) // len(args.formats)
+
+        serial = timed(lambda: render_plots(df, PAIRS, tmp, by_year=True, formats=args.formats, max_workers=1))
+        pooled = timed(lambda: render_plots(df, PAIRS, tmp, by_year=True, formats=args.formats, max_workers=args.jobs))
+
+    print(f"figures={figures} files={len(manifest)} formats={','.join(args.formats)}")
+    print(f"serial       : {serial:7.2f} s  ({figures / serial:6.1f} figures/s)")
+    print(f"{args.jobs} processes  : {pooled:7.2f} s  ({figures / pooled:6.1f} figures/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Load-test the warm query service over HTTP.
+
+Starts the query service on the sample Harvard CSV and a QoG-shaped
+workbook, then sends a mix of stats, extremes and correlation queries from
+several client threads and reports throughput and latency percentiles.
+The mix repeats a fixed set of distinct queries, so after the first round
+most requests are served from the result cache.
+
+Usage::
+
+    python benchmarks/bench_service.py --requests 2000 --clients 8 --distinct 50
+"""
+import argparse
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+from bench_qog_cache import write_workbook
+from common import SAMPLE_CSV
+
+from econ_analysis_gbm2118.service import QueryService, make_server
+
+VARIABLES = ["growth_proj", "eci_sitc", "eci_hs92", "eci_hs12", "bti_ep", "wef_gci", "pwt_hci", "mad_gdppc"]
+
+
+def query_mix(distinct: int) -> list:
+    """Distinct query paths cycling through the three query types."""
+    pairs = [",".join(p) for p in combinations(VARIABLES, 2)]
+    queries = []
+    for i in range(distinct):
+        kind = i % 3
+        if kind == 0:
+            queries.append(f"/stats?variables={pairs[i % len(pairs)]}")
+        elif kind == 1:
+            queries.append(f"/extremes?rank_col2={VARIABLES[4 + i % 4]}&top_n={1 + i % 10}")
+        else:
+            method = "spearman" if i % 2 else "pearson"
+            queries.append(f"/correlation?columns={pairs[i % len(pairs)]},eci_rank_sitc&method={method}")
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--distinct", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx_path = Path(tmp) / "qog_bas_cs.xlsx"
+        write_workbook(xlsx_path, 200, 20)
+
+        start = time.perf_counter()
+        service = QueryService(str(SAMPLE_CSV), str(xlsx_path))
+        startup = time.perf_counter() - start
+
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+
+        queries = query_mix(args.distinct)
+        paths = [queries[i % len(queries)] for i in range(args.requests)]
+
+        def fetch(path: str) -> float:
+            begin = time.perf_counter()
+            with urllib.request.urlopen(base + path) as response:
+                response.read()
+            return time.perf_counter() - begin
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            latencies = np.array(list(pool.map(fetch, paths))) * 1000
+        elapsed = time.perf_counter() - start
+
+        server.shutdown()
+        server.server_close()
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"startup (load + clean once): {startup:.2f} s")
+    print(f"requests={args.requests} clients={args.clients} distinct={len(queries)}")
+    print(f"throughput: {args.requests / elapsed:8.1f} req/s")
+    print(f"latency ms: p50 {p50:6.2f}  p95 {p95:6.2f}  p99 {p99:6.2f}  max {latencies.max():6.2f}")
+    print(f"cache: {service.hits} hits, {service.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
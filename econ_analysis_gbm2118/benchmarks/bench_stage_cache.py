@@ -0,0 +1,59 @@
+"""
+Benchmark rerunning the pipeline with the stage cache.
+
+Runs ``run_pipeline`` on a scaled-up Harvard CSV and a QoG-shaped
+workbook without a cache, once more to populate the cache, and then
+again on the warm cache, where loading, cleaning, summary statistics and
+extremes are all served from disk and only the plot is redrawn.
+
+Usage::
+
+    python benchmarks/bench_stage_cache.py --rows 1000000
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from bench_qog_cache import write_workbook
+from common import scale_csv, timed
+
+from econ_analysis_gbm2118.pipeline import run_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        xlsx_path = Path(tmp) / "qog_bas_cs.xlsx"
+        cache_dir = Path(tmp) / "cache"
+        scale_csv(csv_path, args.rows)
+        write_workbook(xlsx_path, args.countries, args.columns)
+
+        def run(cache):
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_pipeline(str(csv_path), str(xlsx_path), cache_dir=cache)
+
+        uncached = timed(lambda: run(None), args.repeat)
+        populate = timed(lambda: run(str(cache_dir)))
+        warm = timed(lambda: run(str(cache_dir)), args.repeat)
+
+    print(f"rows={args.rows:,} qog={args.countries} x {args.columns} columns")
+    print(f"no cache      : {uncached:7.3f} s")
+    print(f"populate cache: {populate:7.3f} s")
+    print(f"warm cache    : {warm:7.3f} s  ({uncached / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
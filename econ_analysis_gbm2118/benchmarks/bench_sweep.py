@@ -0,0 +1,69 @@
+"""
+Benchmark a parameter sweep against rerunning the pipeline per configuration.
+
+Builds a sweep over every year of a scaled-up Harvard CSV and two rank
+pairs, then times ``run_sweep`` serially and on a process pool against
+loading, cleaning and analysing the data again for each configuration
+(timed on a few configurations and extrapolated).
+
+Usage::
+
+    python benchmarks/bench_sweep.py --rows 500000 --jobs 2
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from bench_qog_cache import write_workbook
+from common import scale_csv, timed
+
+from econ_analysis_gbm2118.analysis import summary_statistics, extreme_rank_countries
+from econ_analysis_gbm2118.cleaning import clean_merged_data
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST, load_sources
+from econ_analysis_gbm2118.sweep import run_sweep, sweep_grid
+
+
+def rerun_per_config(csv_path, xlsx_path, sweep):
+    """Reference: load and clean the sources again for every configuration."""
+    for config in sweep:
+        df_harvard, df_qog = load_sources(str(csv_path), str(xlsx_path), year=config["year"], max_workers=1)
+        merged = clean_merged_data(df_harvard, df_qog)
+        summary_statistics(merged, VARS_OF_INTEREST)
+        extreme_rank_countries(merged, "eci_rank_sitc", config["rank_col2"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--countries", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=2)
+    parser.add_argument("--rerun-sample", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "growth_proj_eci_rankings.csv"
+        xlsx_path = Path(tmp) / "qog_bas_cs.xlsx"
+        scale_csv(csv_path, args.rows)
+        write_workbook(xlsx_path, args.countries, args.columns)
+        sweep = sweep_grid(year=list(range(1995, 2024)), rank_col2=["bti_ep", "wef_gci"])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rerun_per_config(csv_path, xlsx_path, sweep[:args.rerun_sample])
+            rerun = (time.perf_counter() - start) * len(sweep) / args.rerun_sample
+
+            serial = timed(lambda: run_sweep(str(csv_path), str(xlsx_path), sweep, n_jobs=1))
+            pooled = timed(lambda: run_sweep(str(csv_path), str(xlsx_path), sweep, n_jobs=args.jobs))
+
+    print(f"rows={args.rows:,} configurations={len(sweep)}")
+    print(f"rerun per configuration (est.): {rerun:7.2f} s")
+    print(f"run_sweep, serial             : {serial:7.2f} s  ({rerun / serial:.1f}x)")
+    print(f"run_sweep, {args.jobs} processes        : {pooled:7.2f} s  ({rerun / pooled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Shared helpers for the benchmark scripts in this directory."""
+import time
+from pathlib import Path
+
+import pandas as pd
+
+SAMPLE_CSV = Path(__file__).resolve().parents[1] / "src" / "econ_analysis_gbm2118" / "growth_proj_eci_rankings.csv"
+
+
+def scale_csv(target: Path, rows: int) -> None:
+    """Write a copy of the sample CSV repeated up to ``rows`` rows."""
+    sample = pd.read_csv(SAMPLE_CSV)
+    reps = -(-rows // len(sample))
+    scaled = pd.concat([sample] * reps, ignore_index=True).iloc[:rows]
+    scaled.to_csv(target, index=False)
+
+
+def timed(func, repeat: int = 1, setup=None) -> float:
+    """
+    Return the best wall-clock time of ``repeat`` calls to ``func``.
+
+    If ``setup`` is given, it is called untimed before each call and its
+    result is passed to ``func``.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
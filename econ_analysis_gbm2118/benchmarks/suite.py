@@ -0,0 +1,257 @@
+"""
+Run the stage-level benchmark suite and compare it against a saved baseline.
+
+Every public loading, cleaning, analysis, plotting and output function,
+``run_sweep``, and ``run_pipeline`` end to end, is timed on synthetic data
+from ``econ_analysis_gbm2118.synthetic`` at several sizes. Not covered
+here: the query service and partitioned store, which hold state across
+calls and have their own ``bench_service.py`` and ``bench_partitioned.py``,
+and the alternative backends, compared in ``bench_backends.py``. Each case reports the best of ``--repeat`` runs. Results
+can be saved as a named baseline in ``benchmarks/baselines/`` and later
+runs compared against it; cases slower than ``--threshold`` times the
+baseline are flagged and the script exits with status 1.
+
+Baselines record the machine they were taken on, and ``--note`` adds a
+free-text description. Timings are absolute, so compare only against a
+baseline from the same machine, or save a fresh one first. The committed
+``default`` baseline was recorded on a single-CPU sandbox and only shows
+the relative cost of the cases.
+
+Usage::
+
+    python benchmarks/suite.py --save local --note "laptop, on battery"
+    python benchmarks/suite.py --compare local --sizes small medium
+    python benchmarks/suite.py --cases "merge|clean" --repeat 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from common import timed
+
+import econ_analysis_gbm2118
+from econ_analysis_gbm2118.analysis import (
+    bootstrap_summary_statistics,
+    correlation_matrix,
+    extreme_rank_countries,
+    rank_divergences,
+    summary_statistics,
+)
+from econ_analysis_gbm2118.cleaning import (
+    clean_country_names,
+    NumericImputer,
+    clean_merged_data,
+    fill_and_clip_numeric,
+    merge_datasets,
+    optimize_dtypes,
+)
+from econ_analysis_gbm2118.data import iter_harvard_chunks, load_harvard_data, load_harvard_panel, load_qog_data
+from econ_analysis_gbm2118.outputs import write_outputs
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST, run_pipeline
+from econ_analysis_gbm2118.regression import run_specifications, specification_grid
+from econ_analysis_gbm2118.streaming import streaming_summary_statistics
+from econ_analysis_gbm2118.sweep import run_sweep, sweep_grid
+from econ_analysis_gbm2118.synthetic import write_synthetic_sources
+from econ_analysis_gbm2118.visualization import plot_eci_vs_gci, render_plots
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Country-year panels, plus a product-level export for the largest size
+SIZES = {
+    "small": {"countries": 50, "years": 10, "products": 0, "extra_columns": 0},
+    "medium": {"countries": 200, "years": 30, "products": 0, "extra_columns": 20},
+    "large": {"countries": 250, "years": 30, "products": 40, "extra_columns": 100},
+}
+
+RANK_COLUMNS = ["eci_rank_sitc", "eci_rank_hs92", "eci_rank_hs12", "bti_ep", "wef_gci"]
+
+PLOT_PAIRS = [("eci_sitc", "wef_gci"), ("eci_sitc", "bti_ep"), ("eci_hs92", "pwt_hci")]
+
+
+def prepare(directory: Path, size: dict) -> dict:
+    """Write synthetic sources and precompute the inputs of each stage."""
+    harvard_csv, qog_xlsx = write_synthetic_sources(directory, seed=0, **size)
+    harvard = load_harvard_data(str(harvard_csv), year=None)
+    qog = load_qog_data(str(qog_xlsx))
+    merged = merge_datasets(harvard, qog)
+    # The cleaning steps modify their input; copies keep each stage's
+    # input distinct (and the merge's missing values for correlations)
+    filled = fill_and_clip_numeric(merged.copy())
+    cleaned = clean_country_names(filled.copy())
+    years = sorted(cleaned["year"].dropna().unique().tolist())
+    return {
+        "harvard_csv": str(harvard_csv),
+        "qog_xlsx": str(qog_xlsx),
+        "harvard": harvard,
+        "qog": qog,
+        "merged": merged,
+        "filled": filled,
+        "cleaned": cleaned,
+        # Latest cross-section, as analysed by run_pipeline
+        "latest": cleaned[cleaned["year"] == cleaned["year"].max()],
+        "imputer": NumericImputer().fit(merged),
+        "sweep": sweep_grid(year=years[-3:], rank_col2=["bti_ep", "wef_gci"]),
+    }
+
+
+def quiet_pipeline(data: dict, directory: Path) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_pipeline(data["harvard_csv"], data["qog_xlsx"], output_dir=str(directory / "out"))
+
+
+def quiet_sweep(data: dict, directory: Path) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_sweep(data["harvard_csv"], data["qog_xlsx"], data["sweep"], n_jobs=1)
+
+
+def plot_and_close(data: dict, directory: Path) -> None:
+    import matplotlib.pyplot as plt
+
+    plot_eci_vs_gci(data["latest"])
+    plt.close("all")
+
+
+CASES = {
+    "load_harvard_data": lambda d, tmp: load_harvard_data(d["harvard_csv"], year=None),
+    "load_harvard_panel": lambda d, tmp: load_harvard_panel(d["harvard_csv"]),
+    "load_qog_data": lambda d, tmp: load_qog_data(d["qog_xlsx"]),
+    "merge_datasets": lambda d, tmp: merge_datasets(d["harvard"], d["qog"]),
+    "fill_and_clip_numeric": lambda d, tmp: fill_and_clip_numeric(d["merged"]),
+    "numeric_imputer_fit": lambda d, tmp: NumericImputer().fit(d["merged"]),
+    "numeric_imputer_transform": lambda d, tmp: d["imputer"].transform(d["merged"]),
+    "clean_country_names": lambda d, tmp: clean_country_names(d["filled"]),
+    "clean_merged_data": lambda d, tmp: clean_merged_data(d["harvard"], d["qog"]),
+    "optimize_dtypes": lambda d, tmp: optimize_dtypes(d["harvard"]),
+    "summary_statistics": lambda d, tmp: summary_statistics(d["cleaned"], VARS_OF_INTEREST),
+    "summary_statistics_by_year": lambda d, tmp: summary_statistics(d["cleaned"], VARS_OF_INTEREST, by="year"),
+    "extreme_rank_countries": lambda d, tmp: extreme_rank_countries(d["cleaned"], "eci_rank_sitc", "bti_ep"),
+    "rank_divergences": lambda d, tmp: rank_divergences(d["cleaned"], RANK_COLUMNS),
+    "correlation_pearson": lambda d, tmp: correlation_matrix(d["merged"]),
+    "correlation_spearman": lambda d, tmp: correlation_matrix(d["merged"], method="spearman"),
+    "bootstrap_summary_statistics": lambda d, tmp: bootstrap_summary_statistics(
+        d["latest"], VARS_OF_INTEREST, n_boot=200, seed=0
+    ),
+    "streaming_summary_statistics": lambda d, tmp: streaming_summary_statistics(
+        iter_harvard_chunks(d["harvard_csv"], year=None), ["growth_proj", "eci_sitc", "eci_hs92"]
+    ),
+    "run_specifications": lambda d, tmp: run_specifications(d["cleaned"], specification_grid()),
+    "plot_eci_vs_gci": plot_and_close,
+    "render_plots": lambda d, tmp: render_plots(d["latest"], PLOT_PAIRS, str(tmp / "plots")),
+    "write_outputs": lambda d, tmp: write_outputs(str(tmp / "outputs"), {"merged": d["cleaned"]}),
+    "run_sweep": quiet_sweep,
+    "run_pipeline": quiet_pipeline,
+}
+
+# Cases that modify their input, mapped to that input; each call gets a
+# fresh copy, made outside the timed region
+COPIED_INPUTS = {
+    "fill_and_clip_numeric": "merged",
+    "numeric_imputer_transform": "merged",
+    "clean_country_names": "filled",
+}
+
+
+def machine_info() -> dict:
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "package_version": econ_analysis_gbm2118.__version__,
+    }
+
+
+def run_suite(sizes: list, pattern: str = None, repeat: int = 3) -> dict:
+    """Time every selected case at every size; keys are ``case[size]``."""
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            data = prepare(tmp, SIZES[size])
+            print(f"{size}: {len(data['harvard']):,} Harvard rows, {data['qog'].shape[1]} QoG columns")
+            for name, case in CASES.items():
+                if pattern and not re.search(pattern, name):
+                    continue
+                key = f"{name}[{size}]"
+                setup = lambda: data
+                if name in COPIED_INPUTS:
+                    setup = lambda col=COPIED_INPUTS[name]: {**data, col: data[col].copy()}
+                results[key] = timed(lambda d: case(d, tmp), repeat=repeat, setup=setup)
+                print(f"  {key:<45} {results[key] * 1000:10.2f} ms")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Print ratios against ``baseline`` and return the regressed cases."""
+    regressions = []
+    print(f"\n{'case':<45} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for key, seconds in results.items():
+        if key not in baseline:
+            print(f"{key:<45} {'-':>12} {seconds * 1000:10.2f} ms {'new':>7}")
+            continue
+        ratio = seconds / baseline[key]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<45} {baseline[key] * 1000:10.2f} ms {seconds * 1000:10.2f} ms {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--cases", help="regular expression selecting case names")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="NAME", help="save results as baselines/NAME.json")
+    parser.add_argument("--note", help="free-text description saved with the baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baselines/NAME.json")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="flag cases slower than this multiple of the baseline")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(BASELINE_DIR / f"{args.compare}.json", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if baseline["machine"] != machine_info():
+            print("Warning: baseline was recorded on a different machine or version")
+        if baseline.get("note"):
+            print(f"Baseline note: {baseline['note']}")
+
+    results = run_suite(args.sizes, args.cases, args.repeat)
+
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        document = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "machine": machine_info(),
+            "note": args.note,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(BASELINE_DIR / f"{args.save}.json", "w", encoding="utf-8") as fh:
+            json.dump(document, fh, indent=2)
+            fh.write("\n")
+        print(f"\nSaved baseline {args.save!r} with {len(results)} cases")
+
+    if baseline is not None:
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {args.threshold}x the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,10 @@
-# read version from installed package
-from importlib.metadata import version
-__version__ = version("econ_analysis_gbm2118")
\ No newline at end of file
+def __getattr__(name):
+    # Read the version from the installed package metadata on first access
+    # only; importlib.metadata is slow to import and most callers never
+    # need it
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = value = version("econ_analysis_gbm2118")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
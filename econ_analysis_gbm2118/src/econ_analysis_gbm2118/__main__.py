@@ -1,9 +1,63 @@
 import argparse
-from econ_analysis_gbm2118.pipeline import run_pipeline
+import contextlib
+import os
+import sys
+from pathlib import Path
 
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "econ_analysis_gbm2118"
 
-def main():
-    parser = argparse.ArgumentParser(description="Run economic data pipeline")
+
+def serve(argv: list) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m econ_analysis_gbm2118 serve",
+        description="Serve statistics, extremes and correlations over HTTP from a warm, cleaned dataset",
+    )
+    parser.add_argument("--harvard", required=True, help="growth_proj_eci_rankings.csv")
+    parser.add_argument("--qog", required=True, help="QoG Excel file path or URL")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8765, help="port to bind (default: %(default)s)")
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="directory for cached sources (default: %(default)s)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="do not use the source caches")
+    parser.add_argument(
+        "--query-cache-size",
+        type=int,
+        default=256,
+        help="number of query results kept in memory (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    from econ_analysis_gbm2118.service import QueryService, make_server
+
+    service = QueryService(
+        args.harvard,
+        args.qog,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_size=args.query_cache_size,
+    )
+    server = make_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv: list = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        return serve(argv[1:])
+
+    parser = argparse.ArgumentParser(
+        description="Run economic data pipeline",
+        epilog="Use 'serve --help' for the long-running query service.",
+    )
     parser.add_argument(
         "--harvard",
         required=True,
@@ -14,13 +68,97 @@ def main():
         required=True,
         help="https://www.qogdata.pol.gu.se/data/qog_bas_cs_jan23.xlsx",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="directory for cached sources and stage outputs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="neither read nor write any cache",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="remove cached entries before running",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="size bound of the stage cache in MB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="write the merged data, summary, extremes and a manifest to this directory",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="file format of the outputs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["pandas", "arrow"],
+        default="pandas",
+        help="dataframe engine running the pipeline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--object-strings",
+        action="store_true",
+        help="read Harvard text columns as Python objects instead of Arrow-backed strings",
+    )
+    parser.add_argument(
+        "--optimize-dtypes",
+        action="store_true",
+        help="shrink the loaded Harvard data to smaller dtypes before cleaning",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help=(
+            "write a per-stage JSON profiling report to PATH (stdout if omitted, "
+            "in which case the pipeline's own output goes to stderr)"
+        ),
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    run_pipeline(
-        harvard_csv=args.harvard,
-        qog_source=args.qog,
-    )
+    # Imported after argument parsing so that --help and usage errors do
+    # not wait for pandas and the rest of the pipeline to load
+    from econ_analysis_gbm2118.data import ARROW_STRING_DTYPE
+    from econ_analysis_gbm2118.pipeline import clear_cache, run_pipeline
+    from econ_analysis_gbm2118.profiling import StageProfiler
+
+    if args.clear_cache:
+        clear_cache(args.cache_dir)
+
+    profiler = StageProfiler() if args.profile else None
+    # Keep stdout parseable when the JSON report is written there
+    console = contextlib.redirect_stdout(sys.stderr) if args.profile == "-" else contextlib.nullcontext()
+    with console:
+        run_pipeline(
+            harvard_csv=args.harvard,
+            qog_source=args.qog,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            max_cache_bytes=args.cache_size << 20,
+            profiler=profiler,
+            output_dir=args.output_dir,
+            output_format=args.output_format,
+            backend=args.backend,
+            string_dtype=None if args.object_strings else ARROW_STRING_DTYPE,
+            dtype_optimization=args.optimize_dtypes,
+        )
+
+    if profiler is not None:
+        if args.profile == "-":
+            print(profiler.to_json())
+        else:
+            profiler.to_json(args.profile)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,12 @@
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 
-def summary_statistics(df: pd.DataFrame, vars_of_interest: list) -> pd.DataFrame:
+from econ_analysis_gbm2118.data import HarvardPanel
+
+def summary_statistics(df: pd.DataFrame, vars_of_interest: list, by: str = None) -> pd.DataFrame:
     """
     Compute descriptive statistics for selected variables.
 
@@ -11,30 +17,54 @@ def summary_statistics(df: pd.DataFrame, vars_of_interest: list) -> pd.DataFrame
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        Input dataset containing variables of interest.
+    df : pandas.DataFrame or HarvardPanel
+        Input dataset containing variables of interest. A
+        :class:`~econ_analysis_gbm2118.data.HarvardPanel` is summarized
+        per year unless ``by`` says otherwise.
     vars_of_interest : list of str
         List of column names for which descriptive statistics
         should be computed.
+    by : str, optional
+        Column or index level to group by, for example ``"year"``. All
+        groups are summarized in a single groupby pass.
 
     Returns
     -------
     pandas.DataFrame
         A DataFrame of descriptive statistics with variables as rows
-        and summary measures as columns.
+        and summary measures as columns. When grouped, rows are indexed
+        by ``(by, variable)``.
 
     Notes
     -----
     Columns listed in ``vars_of_interest`` that are not present in
     ``df`` are excluded from the output.
     """
+    if isinstance(df, HarvardPanel):
+        df = df.frame
+        by = "year" if by is None else by
+
     missing_vars = set(vars_of_interest) - set(df.columns)
     if missing_vars:
         print("Warning: Missing columns:", missing_vars)
     available_vars = [v for v in vars_of_interest if v in df.columns]
-    return df[available_vars].describe().T
+    narrow = [v for v in available_vars if df[v].dtype == np.float32]
+    if narrow:
+        # describe() accumulates float32 columns in float32; widen them so
+        # the statistics match those of the float64 data they came from
+        df = df.astype(dict.fromkeys(narrow, "float64"))
+    if by is None:
+        return df[available_vars].describe().T
+    return df.groupby(by)[available_vars].describe().stack(level=0, future_stack=True)
 
-def extreme_rank_countries(df: pd.DataFrame, rank_col1: str, rank_col2: str, top_n: int = 5) -> pd.DataFrame:
+def extreme_rank_countries(
+    df: pd.DataFrame,
+    rank_col1: str,
+    rank_col2: str,
+    top_n: int = 5,
+    by: str = None,
+    label: str = 'cname',
+) -> pd.DataFrame:
     """
    Identify countries with the largest rank differences between two indicators.
 
@@ -44,20 +74,30 @@ def extreme_rank_countries(df: pd.DataFrame, rank_col1: str, rank_col2: str, top
 
    Parameters
    ----------
-   df : pandas.DataFrame
-       Dataset containing country names and ranking variables.
+   df : pandas.DataFrame or HarvardPanel
+       Dataset containing country names and ranking variables. A
+       :class:`~econ_analysis_gbm2118.data.HarvardPanel` is ranked per
+       year unless ``by`` says otherwise.
    rank_col1 : str
        Name of the first ranking column (precomputed ranks).
    rank_col2 : str
        Name of the second column from which ranks will be calculated.
    top_n : int, default=5
        Number of countries with the largest rank differences to return.
+   by : str, optional
+       Column or index level to group by, for example ``"year"``. Ranks
+       are computed within each group and the top ``top_n`` countries are
+       returned per group, all in a single groupby pass.
+   label : str, default='cname'
+       Column identifying each row, typically the country name.
 
    Returns
    -------
    pandas.DataFrame
        A DataFrame containing country names, both ranking measures,
        and the calculated rank difference, sorted in descending order.
+       When grouped, the ``by`` column comes first and rows are sorted
+       by group, then by rank difference.
 
    Raises
    ------
@@ -67,12 +107,378 @@ def extreme_rank_countries(df: pd.DataFrame, rank_col1: str, rank_col2: str, top
    Notes
    -----
    The second ranking is computed in descending order, where higher
-   values receive better (lower numeric) ranks.
+   values receive better (lower numeric) ranks. Rows with a missing rank
+   difference come last, so they are only returned when fewer than
+   ``top_n`` rows have one. The input DataFrame is not modified. See
+   :func:`rank_divergences` for all pairs of several indicators at once.
    """
+    if isinstance(df, HarvardPanel):
+        df = df.frame.reset_index()
+        by = "year" if by is None else by
+
     if rank_col2 not in df.columns:
         raise ValueError(f"{rank_col2} not found in dataframe")
-    df['rank_col2_calc'] = df[rank_col2].rank(ascending=False)
-    temp = df[['cname', rank_col1, 'rank_col2_calc']].copy()
+
+    if by is not None:
+        keys = [by] if by in df.columns else []
+        temp = df[keys + [label, rank_col1]].copy()
+        temp['rank_col2_calc'] = df.groupby(by)[rank_col2].rank(ascending=False)
+        temp['rank_difference'] = temp[rank_col1] - temp['rank_col2_calc']
+        if by not in temp.columns:
+            temp = temp.reset_index(level=by)
+        temp = temp.sort_values([by, 'rank_difference'], ascending=[True, False])
+        return temp.groupby(by, sort=False).head(top_n)
+
+    temp = df[[label, rank_col1]].copy()
+    temp['rank_col2_calc'] = df[rank_col2].rank(ascending=False)
     temp['rank_difference'] = temp[rank_col1] - temp['rank_col2_calc']
-    return temp.sort_values('rank_difference', ascending=False).head(top_n)
+    # A stable full sort rather than nlargest, whose handling of missing
+    # values differs between pandas versions; ties keep their row order
+    return temp.sort_values('rank_difference', ascending=False, kind='stable').head(top_n)
+
+def rank_divergences(
+    df: pd.DataFrame,
+    columns: list,
+    top_n: int = 5,
+    label: str = 'cname',
+    ascending: list = None,
+) -> pd.DataFrame:
+    """
+    Find the largest rank divergences across every pair of indicators.
+
+    All requested columns are ranked once into a rank matrix (rank 1 is
+    the best value). Rank differences for every ordered pair of columns
+    are computed together with NumPy broadcasting, and the top ``top_n``
+    rows per pair are picked with a partial selection instead of a full
+    sort.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset containing the row label and indicator columns. It is
+        not modified.
+    columns : list of str
+        Indicator columns to compare, for example ECI variants and
+        governance indicators.
+    top_n : int, default=5
+        Number of rows with the largest divergence to return per pair.
+    label : str, default='cname'
+        Column identifying each row, typically the country name.
+    ascending : list of str, optional
+        Columns where smaller values are better, such as precomputed
+        ranks (``eci_rank_*``). All other columns are ranked so that
+        higher values receive better (lower numeric) ranks.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Long table with one row per (pair, country), and columns
+        ``indicator_1``, ``indicator_2``, ``label``, ``rank_1``,
+        ``rank_2`` and ``rank_difference`` (``rank_1 - rank_2``). Rows
+        are ordered by pair, then by descending rank difference. Pairs
+        are ordered, so both directions of every divergence appear.
+
+    Raises
+    ------
+    ValueError
+        If any of ``columns`` is not found in the DataFrame.
+
+    Notes
+    -----
+    Rows where either indicator is missing are skipped for that pair.
+    Working memory grows with ``len(df) * len(columns) ** 2``.
+    """
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"{missing} not found in dataframe")
+
+    ascending = set(ascending or [])
+    signs = np.array([1.0 if c in ascending else -1.0 for c in columns])
+    # Flip the columns where smaller is better so one descending rank
+    # call handles every column
+    ranks = (df[columns].astype("float64") * -signs).rank(ascending=False).to_numpy()
+
+    n_rows, n_cols = ranks.shape
+    diffs = ranks[:, :, None] - ranks[:, None, :]
+    pair_i, pair_j = np.nonzero(~np.eye(n_cols, dtype=bool))
+    diffs = diffs[:, pair_i, pair_j]
+
+    k = min(top_n, n_rows)
+    if k == 0 or len(pair_i) == 0:
+        return pd.DataFrame(columns=['indicator_1', 'indicator_2', label, 'rank_1', 'rank_2', 'rank_difference'])
+
+    # Ranks are multiples of 0.5, so subtracting less than 0.5 by row
+    # position breaks ties in favour of earlier rows, like nlargest
+    tie_break = np.arange(n_rows)[:, None] / (2 * (n_rows + 1))
+    scores = np.where(np.isnan(diffs), -np.inf, diffs - tie_break)
+    top = np.argpartition(-scores, k - 1, axis=0)[:k]
+    top_scores = np.take_along_axis(scores, top, axis=0)
+    order = np.argsort(-top_scores, axis=0, kind="stable")
+    top = np.take_along_axis(top, order, axis=0)
+
+    rows = top.T.ravel()
+    pairs = np.repeat(np.arange(len(pair_i)), k)
+    result = pd.DataFrame({
+        'indicator_1': np.asarray(columns, dtype=object)[pair_i[pairs]],
+        'indicator_2': np.asarray(columns, dtype=object)[pair_j[pairs]],
+        label: df[label].to_numpy()[rows],
+        'rank_1': ranks[rows, pair_i[pairs]],
+        'rank_2': ranks[rows, pair_j[pairs]],
+        'rank_difference': diffs[rows, pairs],
+    })
+    return result[result['rank_difference'].notna()].reset_index(drop=True)
+
+
+def _statistic_labels(statistics) -> list:
+    labels = []
+    for stat in statistics:
+        if stat in ("mean", "median"):
+            labels.append(stat)
+        elif isinstance(stat, float) and 0 <= stat <= 1:
+            labels.append(f"{stat:.0%}")
+        else:
+            raise ValueError(f"Unsupported statistic: {stat!r}")
+    return labels
+
+def _lane_statistics(samples: np.ndarray, statistics) -> np.ndarray:
+    """
+    Compute statistics along axis -2 of ``samples``, ignoring NaNs.
+
+    ``samples`` has shape ``(..., n, p)``; the result has shape
+    ``(..., len(statistics), p)``. Quantiles use the same linear
+    interpolation as pandas, computed for every lane at once by sorting
+    NaNs to the end and gathering the interpolation points.
+    """
+    valid = ~np.isnan(samples)
+    count = valid.sum(axis=-2)
+    out = []
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "mean" in statistics:
+            mean = np.where(valid, samples, 0).sum(axis=-2) / count
+        ordered = np.sort(samples, axis=-2)
+
+        for stat in statistics:
+            if stat == "mean":
+                out.append(mean)
+                continue
+            q = 0.5 if stat == "median" else stat
+            pos = q * (count - 1)
+            lo = np.clip(np.floor(pos).astype(np.int64), 0, None)
+            hi = np.clip(np.ceil(pos).astype(np.int64), 0, None)
+            lo_val = np.take_along_axis(ordered, lo[..., None, :], axis=-2)[..., 0, :]
+            hi_val = np.take_along_axis(ordered, hi[..., None, :], axis=-2)[..., 0, :]
+            value = lo_val + (hi_val - lo_val) * (pos - lo)
+            out.append(np.where(count > 0, value, np.nan))
+    return np.stack(out, axis=-2)
+
+def _bootstrap_block(values: np.ndarray, seed, n_boot: int, statistics) -> np.ndarray:
+    # One block of replicates: every resample index drawn as one matrix
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, values.shape[0], size=(n_boot, values.shape[0]))
+    return _lane_statistics(values[idx], statistics)
+
+def bootstrap_summary_statistics(
+    df: pd.DataFrame,
+    vars_of_interest: list,
+    statistics: tuple = ("mean", "median", 0.25, 0.75),
+    n_boot: int = 1000,
+    ci: float = 0.95,
+    seed: int = None,
+    block_size: int = 1000,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """
+    Compute bootstrap confidence intervals for summary statistics.
+
+    Rows of ``df`` are resampled with replacement. Resample indices for a
+    block of replicates are drawn as one ``(block_size, n)`` matrix and
+    the statistics are computed for every replicate and variable at once,
+    with no per-replicate Python loop. Blocks bound the working memory
+    and can be spread over a process pool.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input dataset containing variables of interest.
+    vars_of_interest : list of str
+        List of column names to bootstrap. Variables not found in the
+        DataFrame are ignored, with a warning printed to the console.
+    statistics : tuple, default=("mean", "median", 0.25, 0.75)
+        Statistics to bootstrap: ``"mean"``, ``"median"`` or a float
+        quantile between 0 and 1. Missing values are ignored.
+    n_boot : int, default=1000
+        Number of bootstrap replicates.
+    ci : float, default=0.95
+        Confidence level of the percentile intervals.
+    seed : int, optional
+        Seed for reproducible resampling. Each block gets its own child
+        seed, so results do not depend on ``n_jobs``.
+    block_size : int, default=1000
+        Replicates drawn per block.
+    n_jobs : int, default=1
+        Number of worker processes. Values above 1 spread blocks over a
+        process pool.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rows indexed by ``(variable, statistic)`` with ``estimate``,
+        ``std_error``, ``ci_lower`` and ``ci_upper`` columns.
+
+    Raises
+    ------
+    ValueError
+        If an unsupported statistic is requested.
+    """
+    labels = _statistic_labels(statistics)
+
+    missing_vars = set(vars_of_interest) - set(df.columns)
+    if missing_vars:
+        print("Warning: Missing columns:", missing_vars)
+    available_vars = [v for v in vars_of_interest if v in df.columns]
+    values = df[available_vars].to_numpy(dtype="float64", na_value=np.nan)
+
+    block_sizes = [block_size] * (n_boot // block_size)
+    if n_boot % block_size:
+        block_sizes.append(n_boot % block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+    args = [(values, block_seed, size, statistics) for block_seed, size in zip(seeds, block_sizes)]
+
+    if n_jobs > 1 and len(args) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = list(pool.map(_bootstrap_block, *zip(*args)))
+    else:
+        blocks = [_bootstrap_block(*a) for a in args]
+    replicates = np.concatenate(blocks, axis=0)
+
+    alpha = (1 - ci) / 2
+    estimate = _lane_statistics(values, statistics)
+    with warnings.catch_warnings():
+        # Variables with no observations give all-NaN replicates
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lower, upper = np.nanquantile(replicates, [alpha, 1 - alpha], axis=0)
+        std_error = np.nanstd(replicates, axis=0, ddof=1)
+
+    index = pd.MultiIndex.from_product([available_vars, labels], names=["variable", "statistic"])
+    return pd.DataFrame({
+        "estimate": estimate.T.ravel(),
+        "std_error": std_error.T.ravel(),
+        "ci_lower": lower.T.ravel(),
+        "ci_upper": upper.T.ravel(),
+    }, index=index)
+
+def _ranks_from_order(column: np.ndarray, order: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Average ranks of ``column`` over ``rows`` from its precomputed sort order."""
+    sub = order[rows[order]]
+    sorted_values = column[sub]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    ends = np.r_[starts[1:], len(sub)]
+    ranks = np.full(len(column), np.nan)
+    ranks[sub] = np.repeat((starts + ends + 1) / 2, ends - starts)
+    return ranks
+
+def _pairwise_pearson(values: np.ndarray) -> tuple:
+    """Pearson matrix and pair counts over pairwise-complete rows."""
+    present = ~np.isnan(values)
+    mask = present.astype("float64")
+    # Centering on the column means limits cancellation in the sums below
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        centered = values - np.nanmean(values, axis=0)
+    x = np.where(present, centered, 0)
+
+    counts = mask.T @ mask
+    sums = x.T @ mask              # sums[i, j]: sum of x_i where i and j are observed
+    squares = (x * x).T @ mask
+    products = x.T @ x
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = products - sums * sums.T / counts
+        var = squares - sums ** 2 / counts
+        corr = cov / np.sqrt(var * var.T)
+    return np.clip(corr, -1, 1), counts
+
+def correlation_matrix(
+    df: pd.DataFrame,
+    columns: list = None,
+    method: str = "pearson",
+    min_periods: int = 1,
+) -> tuple:
+    """
+    Compute a pairwise-complete correlation matrix and its pair counts.
+
+    Each coefficient uses only the rows where both variables are
+    observed, so it should be run on the raw merged data rather than
+    after :func:`~econ_analysis_gbm2118.cleaning.fill_and_clip_numeric`,
+    whose median imputation would bias the result. All pairs are computed
+    at once with matrix products over the missingness mask.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Input dataset, typically the output of
+        :func:`~econ_analysis_gbm2118.cleaning.merge_datasets`.
+    columns : list of str, optional
+        Columns to correlate. ``None`` uses every numeric column.
+    method : {"pearson", "spearman"}, default="pearson"
+        Correlation coefficient.
+    min_periods : int, default=1
+        Minimum number of pairwise-complete observations required for a
+        coefficient; pairs with fewer are set to NaN.
+
+    Returns
+    -------
+    tuple of pandas.DataFrame
+        ``(corr, counts)``: the correlation matrix and the number of
+        pairwise-complete observations behind each coefficient.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not ``"pearson"`` or ``"spearman"``.
+
+    Notes
+    -----
+    For Spearman, every column is sorted once and its ranks are reused
+    for all of its pairs. Pairs whose complete rows are a strict subset
+    of either column's observed rows are re-ranked on that subset by
+    filtering the cached sort order, without sorting again, so results
+    match :meth:`pandas.DataFrame.corr`.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"method must be 'pearson' or 'spearman', got {method!r}")
+
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns.tolist()
+    values = df[columns].to_numpy(dtype="float64", na_value=np.nan)
+
+    if method == "spearman":
+        present = ~np.isnan(values)
+        # Sort every column once; the orders give both the full-column
+        # ranks and, by filtering, the ranks on any subset of rows
+        orders = [np.argsort(values[:, i], kind="stable")[: present[:, i].sum()] for i in range(len(columns))]
+        ranks = np.column_stack([
+            _ranks_from_order(values[:, i], orders[i], present[:, i]) for i in range(len(columns))
+        ]) if columns else values
+        corr, counts = _pairwise_pearson(ranks)
+
+        # Pairs whose complete rows are a strict subset of a column's
+        # observed rows must be re-ranked on that subset (pairs that never
+        # overlap are already NaN)
+        observed = present.sum(axis=0)
+        partial = ((counts < observed[:, None]) | (counts < observed[None, :])) & (counts > 0)
+        for i, j in zip(*np.nonzero(np.triu(partial, k=1))):
+            both = present[:, i] & present[:, j]
+            a = _ranks_from_order(values[:, i], orders[i], both)[both]
+            b = _ranks_from_order(values[:, j], orders[j], both)[both]
+            a, b = a - a.mean(), b - b.mean()
+            with np.errstate(invalid="ignore", divide="ignore"):
+                corr[i, j] = corr[j, i] = np.clip(a @ b / np.sqrt((a @ a) * (b @ b)), -1, 1)
+    else:
+        corr, counts = _pairwise_pearson(values)
 
+    corr[counts < max(min_periods, 1)] = np.nan
+    return (
+        pd.DataFrame(corr, index=columns, columns=columns),
+        pd.DataFrame(counts.astype("int64"), index=columns, columns=columns),
+    )
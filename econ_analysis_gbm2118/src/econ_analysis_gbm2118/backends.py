@@ -0,0 +1,356 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.analysis import extreme_rank_countries, summary_statistics
+from econ_analysis_gbm2118.cleaning import (
+    COUNTRY_NAME_RULES,
+    QOG_PREFERRED_COLUMNS,
+    clean_country_names,
+    fill_and_clip_numeric,
+    merge_datasets,
+    normalize_country_name,
+)
+from econ_analysis_gbm2118.data import harvard_arrow_types, load_harvard_data, load_qog_data
+from econ_analysis_gbm2118.streaming import DESCRIBE_COLUMNS
+
+
+class Backend(ABC):
+    """
+    Dataframe engine running the load, clean and analysis stages.
+
+    A backend exposes the pipeline stages as methods over its own frame
+    type. Loading, merging and cleaning return native frames; the
+    analysis methods return pandas DataFrames shaped like the functions
+    in :mod:`econ_analysis_gbm2118.analysis`, so results can be compared
+    and written the same way whatever the engine. Subclass it, implement
+    every stage method, and call :func:`register_backend` to add an
+    engine; a subclass missing a stage cannot be instantiated.
+    """
+
+    name = None
+
+    @abstractmethod
+    def load_harvard(self, file_path: str, cache_dir: str = None, year: int = 2023):
+        """Load the Harvard Atlas CSV, like :func:`~econ_analysis_gbm2118.data.load_harvard_data`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_qog(self, file_path: str, columns: list = None, cache_dir: str = None):
+        """Load the QoG workbook, like :func:`~econ_analysis_gbm2118.data.load_qog_data`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def merge(self, harvard, qog):
+        """Merge both sources, like :func:`~econ_analysis_gbm2118.cleaning.merge_datasets`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def fill_and_clip(self, merged):
+        """Impute and clip numeric columns, like :func:`~econ_analysis_gbm2118.cleaning.fill_and_clip_numeric`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clean_names(self, merged):
+        """Standardize country names, like :func:`~econ_analysis_gbm2118.cleaning.clean_country_names`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def summary_statistics(self, merged, vars_of_interest: list) -> pd.DataFrame:
+        """Describe variables, like :func:`~econ_analysis_gbm2118.analysis.summary_statistics`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def extreme_rank_countries(
+        self, merged, rank_col1: str, rank_col2: str, top_n: int = 5, label: str = "cname"
+    ) -> pd.DataFrame:
+        """Rank differences, like :func:`~econ_analysis_gbm2118.analysis.extreme_rank_countries`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_pandas(self, frame, columns: list = None) -> pd.DataFrame:
+        """Convert a native frame to pandas, optionally keeping only ``columns``."""
+        raise NotImplementedError
+
+
+class PandasBackend(Backend):
+    """The default backend, delegating to the package's pandas functions."""
+
+    name = "pandas"
+
+    def load_harvard(self, file_path, cache_dir=None, year=2023):
+        return load_harvard_data(file_path, cache_dir=cache_dir, year=year)
+
+    def load_qog(self, file_path, columns=None, cache_dir=None):
+        return load_qog_data(file_path, columns=columns, cache_dir=cache_dir)
+
+    def merge(self, harvard, qog):
+        return merge_datasets(harvard, qog)
+
+    def fill_and_clip(self, merged):
+        return fill_and_clip_numeric(merged)
+
+    def clean_names(self, merged):
+        return clean_country_names(merged)
+
+    def summary_statistics(self, merged, vars_of_interest):
+        return summary_statistics(merged, vars_of_interest)
+
+    def extreme_rank_countries(self, merged, rank_col1, rank_col2, top_n=5, label="cname"):
+        return extreme_rank_countries(merged, rank_col1, rank_col2, top_n=top_n, label=label)
+
+    def to_pandas(self, frame, columns=None):
+        if columns is None:
+            return frame
+        return frame[[c for c in columns if c in frame.columns]]
+
+
+def _map_columns(func, columns: list) -> list:
+    # Arrow compute kernels release the GIL, so independent columns are
+    # processed on a thread pool sized to the Arrow CPU pool
+    import pyarrow as pa
+
+    if len(columns) < 2:
+        return [func(col) for col in columns]
+    with ThreadPoolExecutor(max_workers=min(pa.cpu_count(), len(columns))) as pool:
+        return list(pool.map(func, columns))
+
+
+def _as_float(column):
+    # NaN and null both mean missing in pandas; Arrow kernels only skip nulls
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    column = pc.cast(column, pa.float64())
+    return pc.if_else(pc.is_nan(column), pa.scalar(None, pa.float64()), column)
+
+
+class ArrowBackend(Backend):
+    """
+    Arrow-native backend built on :mod:`pyarrow.compute`.
+
+    The CSV is parsed by Arrow's multithreaded reader into a
+    :class:`pyarrow.Table`, and every later stage runs Arrow compute
+    kernels over its columns, several columns at a time on a thread
+    pool. Results match the pandas backend: the join keeps the Harvard
+    row order, quantiles use the same linear interpolation, average
+    ranks are derived from Arrow's ``min`` and ``max`` tie breakers, and
+    country names are normalized with
+    :func:`~econ_analysis_gbm2118.cleaning.normalize_country_name`.
+
+    Notes
+    -----
+    The QoG workbook is still parsed by pandas, since Arrow cannot read
+    Excel, and converted once. The Harvard loader ignores ``cache_dir``.
+    Grouped statistics are not supported.
+    """
+
+    name = "arrow"
+
+    def load_harvard(self, file_path, cache_dir=None, year=2023):
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+
+        table = pacsv.read_csv(
+            file_path,
+            convert_options=pacsv.ConvertOptions(column_types=harvard_arrow_types(), strings_can_be_null=True),
+        )
+        if year is not None and "year" in table.column_names:
+            table = table.filter(pc.equal(table["year"], year))
+        return table
+
+    def load_qog(self, file_path, columns=None, cache_dir=None):
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(load_qog_data(file_path, columns=columns, cache_dir=cache_dir), preserve_index=False)
+
+    def merge(self, harvard, qog):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        qog = qog.filter(pc.is_valid(qog["ccodealp"]))
+        codes = qog["ccodealp"].combine_chunks()
+        if pc.count_distinct(codes).as_py() != len(codes):
+            counts = pc.value_counts(codes)
+            duplicated = counts.field("values").filter(pc.greater(counts.field("counts"), 1)).to_pylist()
+            raise ValueError(f"Duplicate ISO3 codes in QoG data: {duplicated}")
+
+        # Positions of each Harvard code in the QoG table; unmatched codes
+        # get a null position, which ``take`` turns into a null row
+        positions = pc.index_in(harvard["country_iso3_code"], value_set=codes)
+        right = qog.drop_columns(["ccodealp"]).take(positions)
+        if positions.null_count:
+            # pandas turns integer columns with missing rows into floats
+            for i, field in enumerate(right.schema):
+                if pa.types.is_integer(field.type):
+                    right = right.set_column(i, field.name, pc.cast(right[field.name], pa.float64()))
+
+        merged = harvard
+        preferred = [c for c in QOG_PREFERRED_COLUMNS if c in merged.column_names and c in right.column_names]
+        for col in preferred:
+            merged = merged.set_column(merged.column_names.index(col), col, right[col])
+        right = right.drop_columns(preferred)
+
+        overlap = set(merged.column_names) & set(right.column_names)
+        for col in right.column_names:
+            merged = merged.append_column(f"{col}_qog" if col in overlap else col, right[col])
+        return merged
+
+    def fill_and_clip(self, merged):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        def fill_clip(col):
+            original = merged[col]
+            values = _as_float(original)
+            median = pc.quantile(values, q=0.5)[0]
+            if median.is_valid:
+                values = pc.fill_null(values, median)
+            lower, upper = pc.quantile(values, q=[0.01, 0.99]).to_pylist()
+            if lower is None:
+                return col, values
+            values = pc.min_element_wise(pc.max_element_wise(values, lower), upper)
+            # Keep integer columns whole when the bounds allow it, as pandas does
+            if pa.types.is_integer(original.type) and float(lower).is_integer() and float(upper).is_integer():
+                values = pc.cast(values, original.type)
+            return col, values
+
+        numeric = [
+            f.name for f in merged.schema if pa.types.is_integer(f.type) or pa.types.is_floating(f.type)
+        ]
+        for col, values in _map_columns(fill_clip, numeric):
+            merged = merged.set_column(merged.column_names.index(col), col, values)
+        return merged
+
+    def clean_names(self, merged, rules=COUNTRY_NAME_RULES, aliases=None, strip_diacritics=False):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if "cname" not in merged.column_names:
+            return merged
+
+        encoded = pc.dictionary_encode(pc.cast(merged["cname"], pa.string())).combine_chunks()
+        # Names are normalized once per distinct value over sorted raw
+        # names, giving the same categories as the pandas backend
+        raw = encoded.dictionary.to_pylist()
+        order = sorted(range(len(raw)), key=raw.__getitem__)
+        cleaned = [normalize_country_name(str(raw[i]), rules, aliases, strip_diacritics) for i in order]
+        rank = np.empty(len(raw), dtype="int64")
+        rank[order] = np.arange(len(raw))
+
+        codes = pc.fill_null(encoded.indices, 0).to_numpy().astype("int64")
+        if len(raw):
+            codes = rank[codes]
+        missing = encoded.indices.is_null().to_numpy(zero_copy_only=False)
+        if missing.any():
+            cleaned.append("")
+            codes[missing] = len(cleaned) - 1
+
+        new_codes, categories = pd.factorize(pd.Index(cleaned))
+        names = pa.DictionaryArray.from_arrays(
+            pa.array(new_codes[codes], pa.int32()), pa.array(list(categories), pa.string())
+        )
+        return merged.set_column(merged.column_names.index("cname"), "cname", names)
+
+    def summary_statistics(self, merged, vars_of_interest):
+        import pyarrow.compute as pc
+
+        missing_vars = set(vars_of_interest) - set(merged.column_names)
+        if missing_vars:
+            print("Warning: Missing columns:", missing_vars)
+        available_vars = [v for v in vars_of_interest if v in merged.column_names]
+
+        def describe(col):
+            values = _as_float(merged[col])
+            min_max = pc.min_max(values)
+            stats = [
+                pc.count(values).as_py(),
+                pc.mean(values).as_py(),
+                pc.stddev(values, ddof=1).as_py(),
+                min_max["min"].as_py(),
+                *pc.quantile(values, q=[0.25, 0.5, 0.75]).to_pylist(),
+                min_max["max"].as_py(),
+            ]
+            return [np.nan if s is None else s for s in stats]
+
+        rows = _map_columns(describe, available_vars)
+        return pd.DataFrame(rows, index=available_vars, columns=DESCRIBE_COLUMNS, dtype="float64")
+
+    def extreme_rank_countries(self, merged, rank_col1, rank_col2, top_n=5, label="cname"):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if rank_col2 not in merged.column_names:
+            raise ValueError(f"{rank_col2} not found in dataframe")
+
+        values = _as_float(merged[rank_col2])
+        # Average ranks of ties, as pandas computes by default
+        low = pc.rank(values, sort_keys="descending", tiebreaker="min")
+        high = pc.rank(values, sort_keys="descending", tiebreaker="max")
+        calc = pc.divide(pc.add(pc.cast(low, pa.float64()), pc.cast(high, pa.float64())), 2.0)
+        calc = pc.if_else(pc.is_valid(values), calc, pa.scalar(None, pa.float64()))
+        difference = pc.subtract(_as_float(merged[rank_col1]), calc)
+
+        # A stable descending sort keeps the first of tied rows, like nlargest
+        order = pc.array_sort_indices(difference, order="descending", null_placement="at_end")
+        order = order[:min(top_n, len(difference) - difference.null_count)]
+
+        result = self.to_pandas(merged.select([label, rank_col1]).take(order))
+        result["rank_col2_calc"] = calc.take(order).to_numpy(zero_copy_only=False)
+        result["rank_difference"] = difference.take(order).to_numpy(zero_copy_only=False)
+        result.index = order.to_numpy(zero_copy_only=False).astype("int64")
+        return result
+
+    def to_pandas(self, frame, columns=None):
+        import pyarrow as pa
+
+        if columns is not None:
+            frame = frame.select([c for c in columns if c in frame.column_names])
+        # Nullable booleans and integers keep the pandas types of
+        # HARVARD_DTYPES instead of becoming objects or plain integers
+        types = {pa.bool_(): pd.BooleanDtype(), pa.int16(): pd.Int16Dtype(), pa.int32(): pd.Int32Dtype()}
+        return frame.to_pandas(types_mapper=types.get)
+
+
+BACKENDS = {
+    "pandas": PandasBackend(),
+    "arrow": ArrowBackend(),
+}
+
+
+def register_backend(backend: Backend) -> None:
+    """
+    Make a backend available by name to :func:`get_backend`.
+
+    Parameters
+    ----------
+    backend : Backend
+        Backend instance; registered under its ``name``.
+    """
+    BACKENDS[backend.name] = backend
+
+
+def get_backend(name: str) -> Backend:
+    """
+    Look up a registered backend.
+
+    Parameters
+    ----------
+    name : str
+        Backend name, ``"pandas"`` (the default engine) or ``"arrow"``.
+
+    Returns
+    -------
+    Backend
+        The registered backend.
+
+    Raises
+    ------
+    ValueError
+        If no backend is registered under ``name``.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of {sorted(BACKENDS)}, got {name!r}")
+    return BACKENDS[name]
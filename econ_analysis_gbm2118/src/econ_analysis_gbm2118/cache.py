@@ -0,0 +1,299 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Names of the entries written by cached_frame and of stage outputs keyed
+# with StageCache.key
+_ENTRY_NAME = re.compile(r"(.+-[0-9a-f]{12}-[0-9a-f]{16}|[0-9a-f]{64})\.parquet")
+
+
+def _read_parquet(path, columns: list = None) -> pd.DataFrame:
+    # Parquet records string columns as "string" without their storage, so
+    # Arrow-backed strings would otherwise come back Python-backed
+    with pd.option_context("mode.string_storage", "pyarrow"):
+        return pd.read_parquet(path, columns=columns)
+
+
+def file_fingerprint(file_path: str) -> dict:
+    """
+    Compute an identity fingerprint for a source file.
+
+    The fingerprint combines the resolved path, the file size, the
+    modification time and a SHA-256 hash of the file contents, so a
+    cached copy is only reused when the source is genuinely unchanged.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the source file.
+
+    Returns
+    -------
+    dict
+        Dictionary with ``path``, ``size``, ``mtime_ns`` and ``sha256`` keys.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file path does not exist.
+    """
+    path = Path(file_path).resolve()
+    stat = path.stat()
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def cache_key(fingerprint: dict, **params) -> str:
+    """
+    Build a stable cache key from a fingerprint and reader parameters.
+
+    Parameters
+    ----------
+    fingerprint : dict
+        Source fingerprint as returned by :func:`file_fingerprint`.
+    **params
+        Additional JSON-serializable parameters that change the cached
+        content (for example the selected columns).
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest identifying the cache entry.
+    """
+    payload = json.dumps({"source": fingerprint, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_frame(file_path: str, cache_dir: str, reader, columns: list = None, **params) -> pd.DataFrame:
+    """
+    Load a DataFrame through an on-disk Parquet cache.
+
+    The cache entry is keyed by the source fingerprint and ``params``.
+    On a hit the Parquet file is read directly; on a miss ``reader`` is
+    called to parse the source, the result is written to the cache and
+    stale entries for the same source are removed.
+
+    The full parsed frame is always cached, so different ``columns``
+    selections share one entry and only the requested columns are read
+    back from it.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the source file.
+    cache_dir : str
+        Directory where cache files are stored. Created if missing.
+    reader : callable
+        Function called as ``reader(file_path)`` to parse the source
+        on a cache miss.
+    columns : list of str, optional
+        Columns to return, in source order. Names not present in the
+        source are ignored. ``None`` returns every column.
+    **params
+        Extra parameters folded into the cache key.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed (or cached) DataFrame.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    fingerprint = file_fingerprint(file_path)
+    # Entries for the same source and params share a prefix so that stale
+    # versions can be found and removed once the source changes
+    source_id = cache_key({"path": fingerprint["path"]}, **params)[:12]
+    prefix = f"{Path(file_path).stem}-{source_id}-"
+    entry = cache_dir / f"{prefix}{cache_key(fingerprint, **params)[:16]}.parquet"
+
+    if entry.exists():
+        if columns is not None:
+            import pyarrow.parquet as pq
+
+            columns = [c for c in pq.read_schema(entry).names if c in columns]
+        return _read_parquet(entry, columns=columns)
+
+    df = reader(file_path)
+
+    # Write to a temporary file first so readers never see a partial entry
+    tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, entry)
+
+    for stale in cache_dir.iterdir():
+        if stale.name.startswith(prefix) and stale.suffix == ".parquet" and stale != entry:
+            stale.unlink(missing_ok=True)
+
+    if columns is not None:
+        df = df.loc[:, [c for c in df.columns if c in columns]]
+    return df
+
+
+DEFAULT_STAGE_CACHE_BYTES = 1 << 30
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """
+    Hash the contents of a DataFrame.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame to hash.
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 digest of the values, index, column names
+        and dtypes.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([list(map(str, df.columns)), list(map(str, df.dtypes))]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    Content-addressed on-disk cache for pipeline stage outputs.
+
+    Each entry is a Parquet file named after its stage and a key that
+    hashes the stage name, the keys or fingerprints of its inputs, its
+    parameters and the package version, so any upstream change produces
+    a new key. Once the cache grows beyond ``max_bytes``, the least
+    recently used entries are evicted.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory where entries are stored. Created if missing.
+    max_bytes : int, default=DEFAULT_STAGE_CACHE_BYTES
+        Size bound of the cache, in bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_STAGE_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(self, stage: str, inputs: list, **params) -> str:
+        """
+        Build the key of a stage output.
+
+        Parameters
+        ----------
+        stage : str
+            Stage name.
+        inputs : list
+            Keys of upstream stages or source fingerprints.
+        **params
+            JSON-serializable stage parameters.
+
+        Returns
+        -------
+        str
+            Hex-encoded SHA-256 digest.
+        """
+        from econ_analysis_gbm2118 import __version__
+
+        return cache_key({"stage": stage, "inputs": inputs, "version": __version__}, **params)
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def get(self, key: str) -> pd.DataFrame:
+        """
+        Return a cached stage output.
+
+        Parameters
+        ----------
+        key : str
+            Entry key as returned by :meth:`key`.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            The cached frame, or ``None`` on a miss.
+        """
+        entry = self._entry(key)
+        if not entry.exists():
+            return None
+        # Touch the entry so that eviction sees it as recently used
+        os.utime(entry)
+        return _read_parquet(entry)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Store a stage output and evict old entries beyond the size bound.
+
+        Parameters
+        ----------
+        key : str
+            Entry key as returned by :meth:`key`.
+        df : pandas.DataFrame
+            Stage output to store.
+        """
+        entry = self._entry(key)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp)
+        os.replace(tmp, entry)
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for path in self.cache_dir.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+
+
+def remove_cache_entries(directory: str) -> None:
+    """
+    Remove the cache entries in a directory.
+
+    Only files named like the entries of :func:`cached_frame` or keys
+    from :meth:`StageCache.key` are deleted, so a directory shared with
+    other data, including other Parquet files, is safe to clear.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding cache entries. Ignored if missing.
+    """
+    directory = Path(directory)
+    if directory.is_dir():
+        for path in directory.glob("*.parquet"):
+            if _ENTRY_NAME.fullmatch(path.name):
+                path.unlink(missing_ok=True)
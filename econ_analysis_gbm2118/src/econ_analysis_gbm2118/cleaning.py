@@ -1,6 +1,62 @@
+import re
+import unicodedata
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
+from econ_analysis_gbm2118.streaming import TDigest
+
+# Ordered (pattern, replacement) rules applied to every distinct country
+# name; extend with extra suffix or spelling rules as needed
+COUNTRY_NAME_RULES = (
+    (r"\s*\(the\)$", ""),
+)
+
+# Columns present in both sources for which the QoG values win
+QOG_PREFERRED_COLUMNS = ["bti_ep", "bti_eos"]
+
+# Low-cardinality text columns repeated once per country-year
+CATEGORICAL_COLUMNS = ["country_iso3_code", "cname"]
+
+def index_qog(df_qog: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index the Quality of Governance dataset by ISO3 country code.
+
+    The result can be passed to :func:`merge_datasets` repeatedly (for
+    example once per year or partition) without rebuilding the lookup.
+    Rows with a missing ``ccodealp`` are dropped, since they can never
+    match a Harvard row.
+
+    Parameters
+    ----------
+    df_qog : pandas.DataFrame
+        Quality of Governance dataset containing ISO3 country codes
+        in the ``ccodealp`` column.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The QoG dataset indexed by ``ccodealp``.
+
+    Raises
+    ------
+    KeyError
+        If the ``ccodealp`` column is missing.
+    ValueError
+        If an ISO3 code appears more than once, which would silently
+        multiply the merged rows.
+    """
+    if df_qog.index.name == "ccodealp":
+        indexed = df_qog
+    else:
+        indexed = df_qog.dropna(subset=["ccodealp"]).set_index("ccodealp")
+
+    if not indexed.index.is_unique:
+        duplicated = indexed.index[indexed.index.duplicated()].unique().tolist()
+        raise ValueError(f"Duplicate ISO3 codes in QoG data: {duplicated}")
+    return indexed
+
 def merge_datasets(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.DataFrame:
     """
     Merge Harvard Atlas and Quality of Governance datasets using ISO3 country codes.
@@ -9,6 +65,12 @@ def merge_datasets(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.DataFra
     using a left join on ISO3 country codes. Redundant identifier columns are
     removed after merging when present.
 
+    Harvard codes are encoded as a categorical over the QoG index, so the
+    join is an integer take rather than a string hash merge, and the QoG
+    side is validated to be unique (many-to-one). Columns present in both
+    sources take the QoG values for :data:`QOG_PREFERRED_COLUMNS` and get
+    a ``_qog`` suffix otherwise.
+
     Parameters
     ----------
     df_harvard : pandas.DataFrame
@@ -16,7 +78,8 @@ def merge_datasets(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.DataFra
         in the ``country_iso3_code`` column.
     df_qog : pandas.DataFrame
         Quality of Governance dataset containing ISO3 country codes
-        in the ``ccodealp`` column.
+        in the ``ccodealp`` column, or already indexed by it with
+        :func:`index_qog`.
 
     Returns
     -------
@@ -27,23 +90,194 @@ def merge_datasets(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.DataFra
     ------
     KeyError
         If required merge columns are missing from the input DataFrames.
+    ValueError
+        If ISO3 codes in the QoG dataset are not unique.
     """
-    merged = df_harvard.merge(
-        df_qog,
-        left_on="country_iso3_code",
-        right_on="ccodealp",
-        how="left",
-        suffixes=("", "_qog")
-    )
-
-    # Prefer QOG versions if they exist
-    for col in ["bti_ep", "bti_eos"]:
-        if f"{col}_qog" in merged.columns:
-            merged[col] = merged[f"{col}_qog"]
-            merged.drop(columns=[f"{col}_qog"], inplace=True)
-
-    merged.drop(columns=["ccodealp"], errors="ignore", inplace=True)
-    return merged
+    qog = index_qog(df_qog)
+
+    codes = pd.Categorical(df_harvard["country_iso3_code"], categories=qog.index).codes
+    # Code -1 (no QoG match) is not a valid position and reindexes to NaN
+    right = qog.reset_index(drop=True).reindex(codes)
+    right.index = pd.RangeIndex(len(right))
+    merged = df_harvard.reset_index(drop=True)
+
+    preferred = [c for c in QOG_PREFERRED_COLUMNS if c in merged.columns and c in right.columns]
+    overlap = (set(merged.columns) & set(right.columns)) - set(preferred)
+    if preferred:
+        merged[preferred] = right[preferred]
+
+    right = right.drop(columns=preferred).rename(columns={c: f"{c}_qog" for c in overlap})
+    return pd.concat([merged, right], axis=1)
+
+class NumericImputer:
+    """
+    Median imputation and percentile clipping with stored, reusable bounds.
+
+    :meth:`fit` computes the median of every numeric column and the lower
+    and upper quantiles of the median-filled data in single vectorized
+    calls over the whole numeric block. :meth:`transform` then fills and
+    clips all columns in one block operation, so later batches or years
+    can be cleaned with the same bounds without recomputing them.
+    :meth:`fit_chunks` estimates the same medians and bounds from
+    quantile sketches when the data does not fit in memory.
+
+    Parameters
+    ----------
+    lower_quantile : float, default=0.01
+        Quantile used as the lower clipping bound.
+    upper_quantile : float, default=0.99
+        Quantile used as the upper clipping bound.
+
+    Attributes
+    ----------
+    medians : pandas.Series or None
+        Fitted median per numeric column.
+    lower : pandas.Series or None
+        Fitted lower clipping bound per numeric column.
+    upper : pandas.Series or None
+        Fitted upper clipping bound per numeric column.
+    """
+
+    def __init__(self, lower_quantile: float = 0.01, upper_quantile: float = 0.99):
+        self.lower_quantile = lower_quantile
+        self.upper_quantile = upper_quantile
+        self.medians = None
+        self.lower = None
+        self.upper = None
+
+    def fit(self, df: pd.DataFrame) -> "NumericImputer":
+        """
+        Compute medians and clipping bounds for every numeric column.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataset containing numeric and non-numeric variables.
+
+        Returns
+        -------
+        NumericImputer
+            The fitted imputer.
+        """
+        self._fit(df)
+        return self
+
+    def fit_chunks(self, chunks, compression: int = 200) -> "NumericImputer":
+        """
+        Fit on data too large for memory, one chunk at a time.
+
+        Every numeric column gets a :class:`~econ_analysis_gbm2118.streaming.TDigest`
+        of its observed values and a count of its missing values. Medians
+        are read from the digests; the missing values are then added to
+        each digest as a run of copies of the median, so the clipping
+        bounds are quantiles of the median-filled data, as in :meth:`fit`.
+        Only one chunk is held at a time.
+
+        Parameters
+        ----------
+        chunks : iterable of pandas.DataFrame
+            Chunks of the dataset, with the same numeric columns.
+        compression : int, default=200
+            Accuracy of the quantile sketches. Results equal those of
+            :meth:`fit` while a column has at most ``2 * compression``
+            values and are approximate beyond.
+
+        Returns
+        -------
+        NumericImputer
+            The fitted imputer.
+        """
+        digests, missing = {}, {}
+        for chunk in chunks:
+            numeric = chunk.select_dtypes(include="number")
+            for col in numeric.columns:
+                values = numeric[col].to_numpy(dtype="float64", na_value=np.nan)
+                digests.setdefault(col, TDigest(compression)).update(values)
+                missing[col] = missing.get(col, 0) + int(np.isnan(values).sum())
+
+        columns = list(digests)
+        medians = np.array([digests[col].quantile(0.5) for col in columns], dtype="float64")
+        bounds = np.full((2, len(columns)), np.nan)
+        for i, col in enumerate(columns):
+            digest = digests[col].update_constant(medians[i], missing[col])
+            bounds[:, i] = digest.quantile([self.lower_quantile, self.upper_quantile])
+
+        self.medians = pd.Series(medians, index=columns)
+        self.lower = pd.Series(bounds[0], index=columns)
+        self.upper = pd.Series(bounds[1], index=columns)
+        return self
+
+    def _fit(self, df: pd.DataFrame) -> np.ndarray:
+        # Returns the filled block so fit_transform does not rebuild it
+        numeric = df.select_dtypes(include="number")
+        self.medians = numeric.median()
+
+        # Bounds are taken after filling, matching the order of operations
+        # of the original per-column implementation
+        values = _fill_block(numeric, self.medians.to_numpy())
+        if len(values):
+            bounds = np.quantile(values, [self.lower_quantile, self.upper_quantile], axis=0)
+        else:
+            bounds = np.full((2, values.shape[1]), np.nan)
+        self.lower = pd.Series(bounds[0], index=numeric.columns)
+        self.upper = pd.Series(bounds[1], index=numeric.columns)
+        return values
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill and clip the fitted numeric columns present in ``df``.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataset to clean. Modified in place and returned.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with missing numeric values imputed and extreme
+            outliers clipped.
+
+        Raises
+        ------
+        ValueError
+            If the imputer has not been fitted.
+        """
+        if self.medians is None:
+            raise ValueError("NumericImputer must be fitted before transform")
+
+        cols = [c for c in self.medians.index if c in df.columns]
+        return self._apply(df, cols, _fill_block(df[cols], self.medians[cols].to_numpy()))
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fit on ``df`` and return it filled and clipped."""
+        values = self._fit(df)
+        return self._apply(df, list(self.medians.index), values)
+
+    def _apply(self, df: pd.DataFrame, cols: list, values: np.ndarray) -> pd.DataFrame:
+        if not cols:
+            return df
+
+        lower = self.lower[cols].to_numpy()
+        upper = self.upper[cols].to_numpy()
+        np.clip(values, lower, upper, out=values)
+
+        block = pd.DataFrame(values, index=df.index, columns=cols)
+        for i, col in enumerate(cols):
+            # Keep the original dtype wherever the result fits it, as a
+            # per-column clip would (e.g. ints clipped to whole bounds)
+            dtype = df[col].dtype
+            if dtype.kind in "iu" and float(lower[i]).is_integer() and float(upper[i]).is_integer():
+                block[col] = block[col].astype(dtype)
+        df[cols] = block
+        return df
+
+def _fill_block(numeric: pd.DataFrame, medians: np.ndarray) -> np.ndarray:
+    """Return ``numeric`` as a float64 array with NaNs replaced by ``medians``."""
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan, copy=True)
+    missing = np.isnan(values)
+    values[missing] = np.broadcast_to(medians, values.shape)[missing]
+    return values
 
 def fill_and_clip_numeric(merged: pd.DataFrame) -> pd.DataFrame:
     """
@@ -66,32 +300,85 @@ def fill_and_clip_numeric(merged: pd.DataFrame) -> pd.DataFrame:
 
     Notes
     -----
-    Non-numeric columns are left unchanged.
+    Non-numeric columns are left unchanged. Use :class:`NumericImputer`
+    directly to reuse the fitted bounds on other batches.
     """
-    numeric_cols = merged.select_dtypes(include="number").columns
+    return NumericImputer().fit_transform(merged)
 
-    for col in numeric_cols:
-       median = merged[col].median()
-       merged[col] = merged[col].fillna(median)
+def _strip_diacritics(name: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", name)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
 
-       lower = merged[col].quantile(0.01)
-       upper = merged[col].quantile(0.99)
+@lru_cache(maxsize=None)
+def _compile_name_rules(rules: tuple) -> list:
+    return [(re.compile(pattern), replacement) for pattern, replacement in rules]
 
-       merged[col] = merged[col].clip(lower=lower, upper=upper)
+def normalize_country_name(
+    name: str,
+    rules: tuple = COUNTRY_NAME_RULES,
+    aliases: dict = None,
+    strip_diacritics: bool = False,
+) -> str:
+    """
+    Normalize a single country name.
 
-    return merged
+    Diacritics are folded first (if requested), then each regex rule is
+    applied in order and finally exact-match aliases are resolved.
+    Compiled rule tables are cached, so repeated calls only pay for the
+    substitutions.
+
+    Parameters
+    ----------
+    name : str
+        Country name to normalize.
+    rules : tuple of (str, str), default=COUNTRY_NAME_RULES
+        Ordered ``(pattern, replacement)`` regular expression rules.
+    aliases : dict, optional
+        Mapping from normalized names to canonical names, for example
+        ``{"Turkiye": "Turkey"}``.
+    strip_diacritics : bool, default=False
+        Whether to fold accented characters to their ASCII base letter.
+
+    Returns
+    -------
+    str
+        The normalized country name.
+    """
+    if strip_diacritics:
+        name = _strip_diacritics(name)
+    for pattern, replacement in _compile_name_rules(tuple(map(tuple, rules))):
+        name = pattern.sub(replacement, name)
+    if aliases:
+        name = aliases.get(name, name)
+    return name
 
-def clean_country_names(merged: pd.DataFrame) -> pd.DataFrame:
+def clean_country_names(
+    merged: pd.DataFrame,
+    rules: tuple = COUNTRY_NAME_RULES,
+    aliases: dict = None,
+    strip_diacritics: bool = False,
+) -> pd.DataFrame:
     """
     Standardize country names by removing trailing ``(the)``.
 
     Country names ending with the suffix ``(the)`` are cleaned using a
     regular expression. Missing values are handled safely.
 
+    Names are normalized once per unique value on a categorical
+    representation and mapped back through the category codes, so panel
+    data with many repeated names costs no more than the ~200 distinct
+    names. The column is returned as a categorical.
+
     Parameters
     ----------
     merged : pandas.DataFrame
         Dataset containing a country name column named ``cname``.
+    rules : tuple of (str, str), default=COUNTRY_NAME_RULES
+        Ordered ``(pattern, replacement)`` regular expression rules.
+    aliases : dict, optional
+        Mapping from normalized names to canonical names.
+    strip_diacritics : bool, default=False
+        Whether to fold accented characters to their ASCII base letter.
 
     Returns
     -------
@@ -101,10 +388,25 @@ def clean_country_names(merged: pd.DataFrame) -> pd.DataFrame:
     Notes
     -----
     If the ``cname`` column is not present, the input DataFrame is
-    returned unchanged.
+    returned unchanged. Missing names become empty strings.
     """
     if 'cname' in merged.columns:
-        merged['cname'] = merged['cname'].fillna("").str.replace(r"\s*\(the\)$", "", regex=True)
+        names = merged['cname'].astype("category")
+        cleaned = [
+            normalize_country_name(str(name), rules, aliases, strip_diacritics)
+            for name in names.cat.categories
+        ]
+        codes = names.cat.codes.to_numpy().copy()
+        missing = codes == -1
+        if missing.any():
+            # Missing names map to an extra empty-string slot
+            cleaned.append("")
+            codes[missing] = len(cleaned) - 1
+
+        # Distinct raw names can normalize to the same value, so the
+        # cleaned categories are re-factorized before mapping back
+        new_codes, categories = pd.factorize(pd.Index(cleaned))
+        merged['cname'] = pd.Categorical.from_codes(new_codes[codes], categories=categories)
     return merged
 
 def clean_merged_data(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.DataFrame:
@@ -132,3 +434,77 @@ def clean_merged_data(df_harvard: pd.DataFrame, df_qog: pd.DataFrame) -> pd.Data
     merged = clean_country_names(merged)
     return merged
 
+def _narrow_float(series: pd.Series, rtol: float) -> pd.Series:
+    values = series.to_numpy()
+    if values.size and np.isfinite(values).all() and np.array_equal(values, np.trunc(values)):
+        return pd.to_numeric(series, downcast="integer")
+    narrowed = values.astype(np.float32)
+    if np.allclose(narrowed, values, rtol=rtol, atol=0, equal_nan=True):
+        return series.astype(np.float32)
+    return series
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    categorical_columns: list = CATEGORICAL_COLUMNS,
+    rtol: float = 0.0,
+) -> tuple:
+    """
+    Shrink a DataFrame to the smallest dtypes that hold its values.
+
+    Columns are converted as follows:
+
+    - ``categorical_columns`` become ``category``, storing each distinct
+      code or name once plus a small integer code per row, when values
+      repeat at least twice on average (for example across years).
+    - Integer columns, including nullable ones, are downcast to the
+      smallest integer type of the same kind.
+    - Complete ``float64`` columns of whole numbers (such as imputed
+      ranks) become the smallest integer type.
+    - Other ``float64`` columns become ``float32`` when every value
+      survives the round trip within ``rtol``.
+
+    Other columns are left unchanged.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataset to shrink. Ranks are only whole numbers, and codes only
+        repeat across years, before imputation and year filtering, so
+        the loaded multi-year Harvard panel shrinks the most.
+    categorical_columns : list of str, optional
+        Columns to store as categoricals. Names not in ``df`` are ignored.
+    rtol : float, default=0.0
+        Relative error allowed when narrowing floats to ``float32``. The
+        default only narrows columns whose values are exactly
+        representable, so analytical results are unchanged.
+
+    Returns
+    -------
+    tuple
+        ``(optimized, report)``: the converted DataFrame and a report
+        indexed by column with ``dtype_before``, ``dtype_after``,
+        ``bytes_before`` and ``bytes_after``, measured with
+        ``DataFrame.memory_usage(deep=True)``.
+    """
+    optimized = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if col in categorical_columns:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                codes, uniques = pd.factorize(series, sort=True)
+                # Plain object categories, as in clean_country_names, so
+                # the dtype survives a Parquet round trip unchanged
+                if len(uniques) <= len(series) // 2:
+                    optimized[col] = pd.Categorical.from_codes(codes, categories=uniques.astype(object))
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            optimized[col] = pd.to_numeric(series, downcast="integer")
+        elif series.dtype == np.float64:
+            optimized[col] = _narrow_float(series, rtol)
+
+    report = pd.DataFrame({
+        "dtype_before": df.dtypes.astype(str),
+        "dtype_after": optimized.dtypes.astype(str),
+        "bytes_before": df.memory_usage(deep=True, index=False),
+        "bytes_after": optimized.memory_usage(deep=True, index=False),
+    })
+    return optimized, report.rename_axis("column")
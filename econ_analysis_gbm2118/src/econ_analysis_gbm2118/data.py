@@ -1,7 +1,140 @@
+import numpy as np
 import pandas as pd
+from functools import partial
 from pathlib import Path
 
-def load_harvard_data(file_path: str) -> pd.DataFrame:
+from econ_analysis_gbm2118.cache import cached_frame
+
+# Explicit schema for the known Atlas columns. Declaring dtypes up front
+# skips type inference and keeps chunks consistent with each other. IDs
+# and years are nullable integers so a row with a missing value still
+# loads; ranks are float64 because they are missing for years a
+# classification does not cover.
+HARVARD_DTYPES = {
+    "country_id": "Int32",
+    "country_iso3_code": "object",
+    "year": "Int16",
+    "growth_proj": "float64",
+    "in_rankings": "boolean",
+    "eci_sitc": "float64",
+    "eci_rank_sitc": "float64",
+    "eci_hs92": "float64",
+    "eci_rank_hs92": "float64",
+    "eci_hs12": "float64",
+    "eci_rank_hs12": "float64",
+}
+
+# Arrow-backed string dtype for the text columns of the Atlas schema;
+# stores each value in one contiguous buffer instead of a Python object
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+# QoG columns used by the pipeline
+QOG_COLUMNS = ["ccodealp", "cname", "bti_ep", "bti_eos", "wef_gci", "pwt_hci", "mad_gdppc"]
+
+def _harvard_dtypes(string_dtype: str = None) -> dict:
+    if string_dtype is None:
+        return HARVARD_DTYPES
+    return {col: string_dtype if dtype == "object" else dtype for col, dtype in HARVARD_DTYPES.items()}
+
+def harvard_arrow_types() -> dict:
+    """
+    Arrow types matching :data:`HARVARD_DTYPES`.
+
+    Returns
+    -------
+    dict
+        :class:`pyarrow.DataType` of each known Atlas column; text
+        columns are strings and nullable pandas types map to their Arrow
+        counterparts.
+    """
+    import pyarrow as pa
+
+    # Arrow integers are nullable, so "Int32" maps to plain int32
+    return {
+        col: pa.string() if dtype == "object" else pa.bool_() if dtype == "boolean"
+        else pa.from_numpy_dtype(np.dtype(dtype.lower()))
+        for col, dtype in HARVARD_DTYPES.items()
+    }
+
+def _read_harvard_csv(file_path: str, dtypes: dict = HARVARD_DTYPES, **kwargs) -> pd.DataFrame:
+    return pd.read_csv(file_path, dtype=dtypes, **kwargs)
+
+def _filter_harvard(df: pd.DataFrame, year=None, iso3=None, columns=None) -> pd.DataFrame:
+    mask = None
+    if year is not None and 'year' in df.columns:
+        mask = df['year'] == year
+    if iso3 is not None and 'country_iso3_code' in df.columns:
+        iso3_mask = df['country_iso3_code'].isin(iso3)
+        mask = iso3_mask if mask is None else mask & iso3_mask
+    if columns is not None:
+        df = df.loc[:, [c for c in df.columns if c in columns]]
+    if mask is not None:
+        # take() builds the filtered frame directly, so no defensive
+        # .copy() of the result is needed
+        df = df.take(np.flatnonzero(mask.to_numpy()))
+    return df
+
+def iter_harvard_chunks(
+    file_path: str,
+    chunksize: int = 100_000,
+    year: int = 2023,
+    iso3: list = None,
+    columns: list = None,
+    string_dtype: str = None,
+):
+    """
+    Stream Harvard Atlas data in filtered chunks.
+
+    The CSV is parsed ``chunksize`` rows at a time with the explicit
+    :data:`HARVARD_DTYPES` schema. Column selection is pushed down into
+    the parser and the year/ISO3 filters are applied to each chunk before
+    it is yielded, so peak memory is bounded by the chunk size rather
+    than the file size.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file containing Harvard Atlas data.
+    chunksize : int, default=100_000
+        Number of CSV rows parsed per chunk.
+    year : int or None, default=2023
+        Year to keep. ``None`` keeps every year.
+    iso3 : list of str, optional
+        ISO3 country codes to keep. ``None`` keeps every country.
+    columns : list of str, optional
+        Columns to keep. ``None`` keeps every column.
+    string_dtype : str, optional
+        Dtype for the text columns, for example
+        :data:`ARROW_STRING_DTYPE`. ``None`` keeps them as ``object``.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Filtered chunk of the Harvard Atlas data. Chunks may be empty.
+    """
+    if isinstance(iso3, str):
+        iso3 = [iso3]
+
+    usecols = None
+    if columns is not None:
+        # Filter columns must be parsed even when they are not returned
+        wanted = set(columns) | {"year", "country_iso3_code"}
+        usecols = lambda col: col in wanted
+
+    dtypes = _harvard_dtypes(string_dtype)
+    with _read_harvard_csv(file_path, dtypes, usecols=usecols, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield _filter_harvard(chunk, year, iso3, columns)
+
+def load_harvard_data(
+    file_path: str,
+    cache_dir: str = None,
+    year: int = 2023,
+    iso3: list = None,
+    columns: list = None,
+    chunksize: int = None,
+    string_dtype: str = None,
+) -> pd.DataFrame:
     """
     Load Harvard Atlas of Economic Complexity data and filter for the year 2023.
 
@@ -13,6 +146,25 @@ def load_harvard_data(file_path: str) -> pd.DataFrame:
     ----------
     file_path : str
         Path to the CSV file containing Harvard Atlas data.
+    cache_dir : str, optional
+        Directory for an on-disk Parquet cache of the parsed CSV. When
+        given, later calls read the cached copy instead of re-parsing the
+        CSV; the cache is rebuilt whenever the source file changes.
+    year : int or None, default=2023
+        Year to keep. ``None`` keeps every year.
+    iso3 : list of str, optional
+        ISO3 country codes to keep. ``None`` keeps every country.
+    columns : list of str, optional
+        Columns to keep. ``None`` keeps every column.
+    chunksize : int, optional
+        If given, the CSV is streamed with :func:`iter_harvard_chunks` and
+        filtered chunk by chunk instead of being loaded whole. The cache
+        is not used in this mode.
+    string_dtype : str, optional
+        Dtype for the text columns, for example
+        :data:`ARROW_STRING_DTYPE`, which stores the ISO3 codes in Arrow
+        buffers rather than as one Python object per row. ``None`` keeps
+        them as ``object``.
 
     Returns
     -------
@@ -26,12 +178,137 @@ def load_harvard_data(file_path: str) -> pd.DataFrame:
     pandas.errors.EmptyDataError
         If the CSV file is empty.
     """
-    df = pd.read_csv(file_path)
-    if 'year' in df.columns:
-        df = df[df['year'] == 2023].copy()
-    return df
+    if isinstance(iso3, str):
+        iso3 = [iso3]
+
+    if chunksize is not None:
+        chunks = iter_harvard_chunks(
+            file_path, chunksize, year=year, iso3=iso3, columns=columns, string_dtype=string_dtype
+        )
+        parts = []
+        for chunk in chunks:
+            if not parts or not chunk.empty:
+                parts.append(chunk)
+        return pd.concat(parts)
+
+    dtypes = _harvard_dtypes(string_dtype)
+    if cache_dir is not None:
+        df = cached_frame(file_path, cache_dir, partial(_read_harvard_csv, dtypes=dtypes), dtypes=dtypes)
+    else:
+        df = _read_harvard_csv(file_path, dtypes)
+    return _filter_harvard(df, year, iso3, columns)
 
-def load_qog_data(file_path: str) -> pd.DataFrame:
+class HarvardPanel:
+    """
+    Year-partitioned, in-memory store of multi-year Harvard Atlas data.
+
+    Rows are sorted by year and indexed by ``(country_iso3_code, year)``.
+    Each year occupies a contiguous block of rows, so selecting one year,
+    a range of years or all years is a binary search plus a positional
+    slice and never re-parses the source.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Harvard Atlas data for all years, with ``country_iso3_code`` and
+        ``year`` columns.
+
+    Raises
+    ------
+    KeyError
+        If ``country_iso3_code`` or ``year`` is missing from ``df``.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        missing = {"country_iso3_code", "year"} - set(df.columns)
+        if missing:
+            raise KeyError(f"Panel data requires columns: {sorted(missing)}")
+
+        df = df.sort_values(["year", "country_iso3_code"], kind="stable")
+        self._year_values = df["year"].to_numpy()
+        self.frame = df.set_index(["country_iso3_code", "year"])
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def years(self) -> list:
+        """Sorted list of the years held in the panel."""
+        return pd.unique(self._year_values).tolist()
+
+    def select(self, year: int = None, start: int = None, end: int = None) -> pd.DataFrame:
+        """
+        Select one year or an inclusive range of years.
+
+        Parameters
+        ----------
+        year : int, optional
+            Single year to select. Takes precedence over ``start``/``end``.
+        start : int, optional
+            First year of the range. ``None`` means the earliest year.
+        end : int, optional
+            Last year of the range. ``None`` means the latest year.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Rows for the selected years, indexed by
+            ``(country_iso3_code, year)``. With no arguments the whole
+            panel is returned.
+        """
+        if year is not None:
+            start = end = year
+
+        lo = 0 if start is None else np.searchsorted(self._year_values, start, side="left")
+        hi = len(self._year_values) if end is None else np.searchsorted(self._year_values, end, side="right")
+        return self.frame.iloc[lo:hi]
+
+def load_harvard_panel(
+    file_path: str,
+    cache_dir: str = None,
+    iso3: list = None,
+    columns: list = None,
+    chunksize: int = None,
+) -> HarvardPanel:
+    """
+    Load every year of Harvard Atlas data into a :class:`HarvardPanel`.
+
+    The CSV is parsed once, with the same caching and streaming options
+    as :func:`load_harvard_data`, and later year selections are served
+    from memory.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the CSV file containing Harvard Atlas data.
+    cache_dir : str, optional
+        Directory for the on-disk Parquet cache of the parsed CSV.
+    iso3 : list of str, optional
+        ISO3 country codes to keep. ``None`` keeps every country.
+    columns : list of str, optional
+        Columns to keep in addition to ``country_iso3_code`` and ``year``.
+    chunksize : int, optional
+        Stream the CSV in chunks of this many rows.
+
+    Returns
+    -------
+    HarvardPanel
+        Year-partitioned panel of Harvard Atlas data.
+    """
+    if columns is not None:
+        columns = ["country_iso3_code", "year"] + [c for c in columns if c not in ("country_iso3_code", "year")]
+
+    df = load_harvard_data(
+        file_path,
+        cache_dir=cache_dir,
+        year=None,
+        iso3=iso3,
+        columns=columns,
+        chunksize=chunksize,
+    )
+    return HarvardPanel(df)
+
+def load_qog_data(file_path: str, columns: list = None, cache_dir: str = None) -> pd.DataFrame:
     """
     Load Quality of Governance (QoG) data from an Excel file.
 
@@ -44,6 +321,13 @@ def load_qog_data(file_path: str) -> pd.DataFrame:
     file_path : str
         Path to the local Excel file or URL of the Excel file containing
         Quality of Governance data.
+    columns : list of str, optional
+        Columns to return, for example :data:`QOG_COLUMNS`. Names not
+        present in the workbook are ignored. ``None`` returns every column.
+    cache_dir : str, optional
+        Directory for an on-disk Parquet copy of the workbook. The
+        workbook is converted once and later calls read only the
+        requested columns from the Parquet copy. Ignored for URLs.
 
     Returns
     -------
@@ -58,8 +342,15 @@ def load_qog_data(file_path: str) -> pd.DataFrame:
     path = Path(file_path)
 
     # If path has URL-like parts, just use the filename
-    if "://" in file_path:
+    if "://" in str(file_path):
         path = Path(file_path).name
+        cache_dir = None
+
+    if cache_dir is not None:
+        return cached_frame(file_path, cache_dir, pd.read_excel, columns=columns)
 
-    df = pd.read_excel(file_path)
+    usecols = None
+    if columns is not None:
+        usecols = lambda col: col in columns
+    df = pd.read_excel(file_path, usecols=usecols)
     return df
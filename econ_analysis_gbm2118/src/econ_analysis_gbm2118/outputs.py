@@ -0,0 +1,153 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from econ_analysis_gbm2118.cache import file_fingerprint
+
+OUTPUT_FORMATS = ("parquet", "csv")
+MANIFEST_NAME = "manifest.json"
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def write_frame(
+    df: pd.DataFrame,
+    path: str,
+    format: str = "parquet",
+    index: bool = False,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> None:
+    """
+    Write a DataFrame to Parquet or CSV in row-group sized chunks.
+
+    Only one chunk is converted at a time, so a large frame is never
+    held twice in memory (once in pandas and once as a full Arrow table
+    or CSV buffer). The Parquet schema is inferred once from the whole
+    frame, so a column that is empty in the first chunk keeps the type of
+    its later values. The file is written under a temporary name and
+    moved into place when complete; a failed write removes it.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Frame to write.
+    path : str
+        Destination file.
+    format : {"parquet", "csv"}, default="parquet"
+        Output format.
+    index : bool, default=False
+        Whether to write the index.
+    row_group_size : int, default=DEFAULT_ROW_GROUP_SIZE
+        Rows per Parquet row group or CSV write.
+
+    Raises
+    ------
+    ValueError
+        If ``format`` is not supported.
+    """
+    if format not in OUTPUT_FORMATS:
+        raise ValueError(f"format must be one of {OUTPUT_FORMATS}, got {format!r}")
+
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    starts = range(0, max(len(df), 1), row_group_size)
+
+    try:
+        if format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = pa.Schema.from_pandas(df, preserve_index=index)
+            with pq.ParquetWriter(tmp, schema) as writer:
+                for start in starts:
+                    chunk = df.iloc[start:start + row_group_size]
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=index))
+        else:
+            with open(tmp, "w", newline="", encoding="utf-8") as fh:
+                for start in starts:
+                    df.iloc[start:start + row_group_size].to_csv(fh, index=index, header=start == 0)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp, path)
+
+
+def write_outputs(
+    output_dir: str,
+    outputs: dict,
+    format: str = "parquet",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    timings: dict = None,
+    metadata: dict = None,
+) -> dict:
+    """
+    Persist pipeline outputs and a manifest describing them.
+
+    Each frame is written with :func:`write_frame` as ``<name>.<format>``
+    in ``output_dir``, followed by a ``manifest.json`` listing row and
+    column counts, file sizes, SHA-256 checksums and write times.
+
+    Parameters
+    ----------
+    output_dir : str
+        Destination directory. Created if missing.
+    outputs : dict of str to pandas.DataFrame
+        Frames to write, keyed by output name, for example
+        ``{"merged": merged, "summary": summary}``. The index is written
+        unless it is a default ``RangeIndex``.
+    format : {"parquet", "csv"}, default="parquet"
+        Output format.
+    row_group_size : int, default=DEFAULT_ROW_GROUP_SIZE
+        Rows per Parquet row group or CSV write.
+    timings : dict, optional
+        Extra timings (in seconds) recorded in the manifest, such as
+        per-stage wall times of the run.
+    metadata : dict, optional
+        Extra JSON-serializable entries added to the top level of the
+        manifest, such as the memory footprint of the run.
+
+    Returns
+    -------
+    dict
+        The manifest, as written to ``manifest.json``.
+    """
+    from econ_analysis_gbm2118 import __version__
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files = []
+    for name, df in outputs.items():
+        path = output_dir / f"{name}.{format}"
+        index = not isinstance(df.index, pd.RangeIndex)
+
+        start = time.perf_counter()
+        write_frame(df, path, format=format, index=index, row_group_size=row_group_size)
+        elapsed = time.perf_counter() - start
+
+        fingerprint = file_fingerprint(path)
+        files.append({
+            "name": name,
+            "path": path.name,
+            "format": format,
+            "rows": len(df),
+            "columns": df.shape[1],
+            "bytes": fingerprint["size"],
+            "sha256": fingerprint["sha256"],
+            "write_seconds": elapsed,
+        })
+
+    manifest = {
+        "package_version": __version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "files": files,
+        "timings": dict(timings or {}),
+    }
+    manifest.update(metadata or {})
+    with open(output_dir / MANIFEST_NAME, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+        fh.write("\n")
+    return manifest
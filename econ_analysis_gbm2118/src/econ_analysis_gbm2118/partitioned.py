@@ -0,0 +1,246 @@
+import tempfile
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.cleaning import NumericImputer, clean_country_names, index_qog, merge_datasets
+from econ_analysis_gbm2118.data import QOG_COLUMNS, harvard_arrow_types, iter_harvard_chunks, load_qog_data
+from econ_analysis_gbm2118.outputs import write_frame
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST
+from econ_analysis_gbm2118.streaming import StreamingSummary
+
+PARTITION_KEYS = ("year", "country")
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_COUNTRY_BLOCKS = 16
+# Clipping bounds sit in the tails, where heavy-tailed indicators repeated
+# per product need finer sketches than the streaming summaries' default
+DEFAULT_COMPRESSION = 1000
+
+
+def _partition_labels(chunk: pd.DataFrame, by: str, country_blocks: int) -> np.ndarray:
+    if by == "year":
+        return chunk["year"].to_numpy()
+    # Hashing the code keeps every row of a country in the same block
+    # without knowing the full list of countries in advance
+    codes, uniques = pd.factorize(chunk["country_iso3_code"], use_na_sentinel=False)
+    blocks = np.array([zlib.crc32(str(code).encode("utf-8")) % country_blocks for code in uniques])
+    return blocks[codes]
+
+
+def partition_harvard(
+    harvard_csv: str,
+    spill_dir: str,
+    by: str = "year",
+    country_blocks: int = DEFAULT_COUNTRY_BLOCKS,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    year: int = None,
+) -> dict:
+    """
+    Split the Harvard Atlas CSV into one Parquet file per partition.
+
+    The CSV is read ``chunksize`` rows at a time with
+    :func:`~econ_analysis_gbm2118.data.iter_harvard_chunks`, and the rows
+    of each chunk are appended to the file of their partition, so only
+    one chunk is held in memory. Every partition file shares one schema:
+    the columns of :data:`~econ_analysis_gbm2118.data.HARVARD_DTYPES`
+    take their declared types, so a column that is empty in the first
+    chunk is still typed correctly, and any other column takes the type
+    it has in the first chunk.
+
+    Parameters
+    ----------
+    harvard_csv : str
+        Path to the Harvard Atlas CSV.
+    spill_dir : str
+        Directory for the partition files. Created if missing.
+    by : {"year", "country"}, default="year"
+        Partition by year, or by blocks of countries assigned from a hash
+        of their ISO3 code.
+    country_blocks : int, default=DEFAULT_COUNTRY_BLOCKS
+        Number of country blocks when ``by="country"``.
+    chunksize : int, default=DEFAULT_CHUNKSIZE
+        Number of CSV rows parsed per chunk.
+    year : int, optional
+        Year to keep. ``None`` keeps every year.
+
+    Returns
+    -------
+    dict
+        Path of each partition file, keyed by partition label (the year
+        or block number) in sorted order.
+
+    Raises
+    ------
+    ValueError
+        If ``by`` is not a supported partition key.
+    """
+    if by not in PARTITION_KEYS:
+        raise ValueError(f"by must be one of {PARTITION_KEYS}, got {by!r}")
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    spill_dir = Path(spill_dir)
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    writers, paths = {}, {}
+    schema = None
+    try:
+        for chunk in iter_harvard_chunks(harvard_csv, chunksize=chunksize, year=year):
+            if chunk.empty:
+                continue
+            if schema is None:
+                inferred = pa.Schema.from_pandas(chunk, preserve_index=False)
+                types = harvard_arrow_types()
+                fields = [pa.field(f.name, types.get(f.name, f.type)) for f in inferred]
+                # The pandas metadata restores the nullable dtypes on read
+                schema = pa.schema(fields, metadata=inferred.metadata)
+            labels = _partition_labels(chunk, by, country_blocks)
+            for label, part in chunk.groupby(labels, sort=False):
+                label = label.item() if isinstance(label, np.generic) else label
+                if label not in writers:
+                    paths[label] = spill_dir / f"{by}={label}.parquet"
+                    writers[label] = pq.ParquetWriter(paths[label], schema)
+                writers[label].write_table(pa.Table.from_pandas(part, schema=schema, preserve_index=False))
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {label: paths[label] for label in sorted(paths)}
+
+
+def run_partitioned(
+    harvard_csv: str,
+    qog_source: str,
+    by: str = "year",
+    vars_of_interest: list = VARS_OF_INTEREST,
+    qog_columns: list = QOG_COLUMNS,
+    cache_dir: str = None,
+    year: int = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    country_blocks: int = DEFAULT_COUNTRY_BLOCKS,
+    compression: int = DEFAULT_COMPRESSION,
+    spill_dir: str = None,
+    output_dir: str = None,
+) -> dict:
+    """
+    Clean and summarize a Harvard export too large for memory.
+
+    This is the out-of-core counterpart of loading, cleaning and
+    summarizing the data in :func:`~econ_analysis_gbm2118.pipeline.run_pipeline`,
+    for product-level exports. It runs in three passes:
+
+    1. The CSV is split into partition files with :func:`partition_harvard`.
+    2. Each partition is merged with the QoG data, indexed once as a small
+       in-memory lookup table, and fed to
+       :meth:`~econ_analysis_gbm2118.cleaning.NumericImputer.fit_chunks`
+       to fit global medians and clipping bounds.
+    3. Each partition is merged again, filled and clipped with the fitted
+       imputer and its country names cleaned. Statistics are accumulated
+       per partition with :class:`~econ_analysis_gbm2118.streaming.StreamingSummary`
+       and merged into the overall summary; the cleaned partition can be
+       written out before it is released.
+
+    Peak memory is bounded by one CSV chunk while splitting and by one
+    merged partition afterwards. Use ``by="country"`` with more
+    ``country_blocks`` for smaller partitions than single years.
+
+    Parameters
+    ----------
+    harvard_csv : str
+        Path to the Harvard Atlas CSV.
+    qog_source : str
+        Path or URL of the QoG Excel file.
+    by : {"year", "country"}, default="year"
+        Partition key, see :func:`partition_harvard`.
+    vars_of_interest : list of str, optional
+        Variables to summarize. Defaults to the pipeline's variables of
+        interest.
+    qog_columns : list of str, optional
+        QoG columns to load. ``None`` loads all of them.
+    cache_dir : str, optional
+        Directory for the on-disk Parquet cache of the QoG source.
+    year : int, optional
+        Year to keep. ``None`` keeps every year.
+    chunksize : int, default=DEFAULT_CHUNKSIZE
+        Number of CSV rows parsed per chunk.
+    country_blocks : int, default=DEFAULT_COUNTRY_BLOCKS
+        Number of country blocks when ``by="country"``.
+    compression : int, default=DEFAULT_COMPRESSION
+        Accuracy of the quantile sketches for imputation and summaries.
+    spill_dir : str, optional
+        Parent directory for the temporary partition files. Defaults to
+        the system temporary directory.
+    output_dir : str, optional
+        Directory to write each cleaned partition to, as
+        ``<by>=<label>.parquet``.
+
+    Returns
+    -------
+    dict
+        ``"summary"``: statistics over all partitions, shaped like
+        :func:`~econ_analysis_gbm2118.analysis.summary_statistics`;
+        ``"partitions"``: the same statistics per partition, indexed by
+        partition label and variable; ``"imputer"``: the fitted
+        :class:`~econ_analysis_gbm2118.cleaning.NumericImputer`;
+        ``"rows"``: the number of rows processed.
+
+    Raises
+    ------
+    ValueError
+        If ``by`` is not a supported partition key.
+
+    Notes
+    -----
+    Medians, clipping bounds and quartiles are exact for small inputs and
+    approximate (from t-digest sketches) beyond ``2 * compression``
+    values per column. Counts, means, standard deviations and extremes
+    are exact. Variables never seen in the data are dropped, with a
+    warning printed to the console.
+    """
+    qog = index_qog(load_qog_data(qog_source, columns=qog_columns, cache_dir=cache_dir))
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(dir=spill_dir) as tmp:
+        partitions = partition_harvard(
+            harvard_csv, tmp, by=by, country_blocks=country_blocks, chunksize=chunksize, year=year
+        )
+
+        def merged_partitions():
+            for label, path in partitions.items():
+                yield label, merge_datasets(pd.read_parquet(path), qog)
+
+        imputer = NumericImputer().fit_chunks(
+            (merged for _, merged in merged_partitions()), compression=compression
+        )
+
+        summary = StreamingSummary(vars_of_interest, compression=compression)
+        per_partition, seen, rows = {}, set(), 0
+        for label, merged in merged_partitions():
+            cleaned = clean_country_names(imputer.transform(merged))
+            partial = StreamingSummary(vars_of_interest, compression=compression).update(cleaned)
+            summary.merge(partial)
+            per_partition[label] = partial.result()
+            seen.update(cleaned.columns)
+            rows += len(cleaned)
+            if output_dir is not None:
+                write_frame(cleaned, output_dir / f"{by}={label}.parquet")
+
+    missing_vars = set(vars_of_interest) - seen
+    if missing_vars:
+        print("Warning: Missing columns:", missing_vars)
+    present = [v for v in vars_of_interest if v in seen]
+
+    if per_partition:
+        partition_table = pd.concat(per_partition, names=[by, "variable"])
+        partition_table = partition_table[partition_table.index.get_level_values("variable").isin(present)]
+    else:
+        partition_table = summary.result().iloc[:0]
+    return {
+        "summary": summary.result().loc[present],
+        "partitions": partition_table,
+        "imputer": imputer,
+        "rows": rows,
+    }
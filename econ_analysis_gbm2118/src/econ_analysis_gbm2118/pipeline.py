@@ -1,12 +1,206 @@
-from econ_analysis_gbm2118.data import load_harvard_data, load_qog_data
-from econ_analysis_gbm2118.cleaning import clean_merged_data
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+
+from econ_analysis_gbm2118.cache import (
+    DEFAULT_STAGE_CACHE_BYTES,
+    StageCache,
+    cache_key,
+    file_fingerprint,
+    frame_digest,
+    remove_cache_entries,
+)
+from econ_analysis_gbm2118.data import load_harvard_data, load_qog_data, ARROW_STRING_DTYPE, QOG_COLUMNS
+from econ_analysis_gbm2118.cleaning import (
+    merge_datasets,
+    fill_and_clip_numeric,
+    clean_country_names,
+    optimize_dtypes,
+)
 from econ_analysis_gbm2118.analysis import summary_statistics, extreme_rank_countries
+from econ_analysis_gbm2118.backends import get_backend
 from econ_analysis_gbm2118.visualization import plot_eci_vs_gci
+from econ_analysis_gbm2118.profiling import StageProfiler, profiled_call
+from econ_analysis_gbm2118.outputs import write_outputs
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+# Stage outputs live in this subdirectory of ``cache_dir``, next to the
+# Parquet caches of the raw sources
+STAGE_CACHE_DIR = "stages"
+
+# Harvard year analysed by run_pipeline
+PIPELINE_YEAR = 2023
+
+VARS_OF_INTEREST = [
+    "growth_proj", "eci_sitc", "eci_rank_sitc",
+    "eci_hs92", "eci_rank_hs92",
+    "eci_hs12", "eci_rank_hs12",
+    "pwt_hci", "bti_eos", "bti_ep",
+    "wef_gci", "mad_gdppc",
+]
+
+
+def _run_stage(profiler: StageProfiler, stage: str, func, *args, **kwargs):
+    if profiler is None:
+        return func(*args, **kwargs)
+    return profiler.run(stage, func, *args, **kwargs)
+
+
+def load_sources(
+    harvard_csv: str,
+    qog_source: str,
+    cache_dir: str = None,
+    qog_columns: list = QOG_COLUMNS,
+    max_workers: int = 2,
+    executor: str = "thread",
+    profiler: StageProfiler = None,
+    year: int = PIPELINE_YEAR,
+    backend: str = "pandas",
+    string_dtype: str = None,
+):
+    """
+    Load the Harvard and QoG sources, concurrently when possible.
+
+    Neither source depends on the other, so both loads are submitted to a
+    pool at once and the function returns as soon as both frames are
+    available.
+
+    Parameters
+    ----------
+    harvard_csv : str
+        Path to the Harvard Atlas CSV.
+    qog_source : str
+        Path or URL of the QoG Excel file.
+    cache_dir : str, optional
+        Directory for the on-disk Parquet caches of both sources.
+    qog_columns : list of str, optional
+        QoG columns to load. ``None`` loads all of them.
+    max_workers : int, default=2
+        Pool size. Values below 2 load the sources serially in the
+        calling thread.
+    executor : {"thread", "process"}, default="thread"
+        Pool type. A process pool sidesteps the GIL for the pure-Python
+        Excel parse at the cost of pickling the loaded frames back.
+    profiler : StageProfiler, optional
+        Profiler that records the ``load_harvard`` and ``load_qog`` stages.
+    year : int or None, default=PIPELINE_YEAR
+        Harvard year to keep. ``None`` keeps every year.
+    backend : str, default="pandas"
+        Dataframe engine that loads the sources; see
+        :func:`~econ_analysis_gbm2118.backends.get_backend`.
+    string_dtype : str, optional
+        Dtype for the Harvard text columns with the pandas engine; see
+        :func:`~econ_analysis_gbm2118.data.load_harvard_data`. Other
+        engines keep their native string types.
+
+    Returns
+    -------
+    tuple
+        ``(df_harvard, df_qog)``, as pandas DataFrames or as the
+        backend's native frames.
+
+    Raises
+    ------
+    ValueError
+        If ``executor`` is not ``"thread"`` or ``"process"``, or
+        ``backend`` is unknown.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {sorted(_EXECUTORS)}, got {executor!r}")
+
+    engine = get_backend(backend)
+    load_harvard, load_qog = load_harvard_data, load_qog_data
+    harvard_kwargs = {"cache_dir": cache_dir, "year": year}
+    if engine.name != "pandas":
+        load_harvard, load_qog = engine.load_harvard, engine.load_qog
+    elif string_dtype is not None:
+        harvard_kwargs["string_dtype"] = string_dtype
+
+    harvard_job = ("load_harvard", load_harvard, (harvard_csv,), harvard_kwargs)
+    qog_job = ("load_qog", load_qog, (qog_source,), {"columns": qog_columns, "cache_dir": cache_dir})
+
+    if max_workers is None or max_workers < 2:
+        df_harvard = _run_stage(profiler, harvard_job[0], harvard_job[1], *harvard_job[2], **harvard_job[3])
+        df_qog = _run_stage(profiler, qog_job[0], qog_job[1], *qog_job[2], **qog_job[3])
+        return df_harvard, df_qog
+
+    with _EXECUTORS[executor](max_workers=max_workers) as pool:
+        # Submit the slower QoG parse first so it starts straight away
+        if profiler is None:
+            futures = [pool.submit(func, *args, **kwargs) for _, func, args, kwargs in (qog_job, harvard_job)]
+            df_qog, df_harvard = [future.result() for future in futures]
+            return df_harvard, df_qog
+
+        # Workers return their records, which are added here so that
+        # callbacks always run in the calling thread
+        futures = [
+            pool.submit(profiled_call, stage, func, args, kwargs, profiler.trace_memory)
+            for stage, func, args, kwargs in (qog_job, harvard_job)
+        ]
+        frames = []
+        for future in futures:
+            frame, record = future.result()
+            profiler.add(record)
+            frames.append(frame)
+        df_qog, df_harvard = frames
+        return df_harvard, df_qog
+
+
+def _source_key(source: str, **params) -> str:
+    # Remote sources cannot be fingerprinted without downloading them
+    if "://" in str(source):
+        return None
+    return cache_key(file_fingerprint(source), **params)
+
+
+def _cached_stage(cache: StageCache, key: str, compute, profiler: StageProfiler = None, stage: str = None):
+    if cache is None or key is None:
+        return compute()
+    if profiler is None:
+        df = cache.get(key)
+    else:
+        df, record = profiled_call(stage, cache.get, (key,), trace_memory=profiler.trace_memory, cached=True)
+        if df is not None:
+            profiler.add(record)
+    if df is None:
+        df = compute()
+        cache.put(key, df)
+    return df
+
+
+def clear_cache(cache_dir: str) -> None:
+    """
+    Remove the source and stage caches written by :func:`run_pipeline`.
+
+    Only files named like cache entries are deleted; other files in
+    ``cache_dir``, including other Parquet files, are left alone.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Cache directory passed to :func:`run_pipeline`.
+    """
+    cache_dir = Path(cache_dir)
+    for directory in [cache_dir, cache_dir / STAGE_CACHE_DIR]:
+        remove_cache_entries(directory)
 
 
 def run_pipeline(
     harvard_csv: str,
     qog_source: str,
+    cache_dir: str = None,
+    qog_columns: list = QOG_COLUMNS,
+    max_workers: int = 2,
+    executor: str = "thread",
+    max_cache_bytes: int = DEFAULT_STAGE_CACHE_BYTES,
+    profiler: StageProfiler = None,
+    output_dir: str = None,
+    output_format: str = "parquet",
+    backend: str = "pandas",
+    string_dtype: str = ARROW_STRING_DTYPE,
+    dtype_optimization: bool = False,
 ):
     """
     Run full data pipeline:
@@ -14,35 +208,148 @@ def run_pipeline(
     - merge & clean
     - generate summary statistics
     - produce plots
+
+    ``cache_dir`` enables the on-disk Parquet caches of both sources and
+    ``qog_columns`` limits the QoG columns that are loaded (``None`` loads
+    all of them). ``max_workers`` and ``executor`` control concurrent
+    loading of the two sources; see :func:`load_sources`.
+
+    With a ``cache_dir``, the outputs of the clean, summary and extremes
+    stages are also cached in a :class:`~econ_analysis_gbm2118.cache.StageCache`
+    bounded to ``max_cache_bytes``. Each stage is keyed by its inputs,
+    parameters and the package version, so a rerun on unchanged sources
+    skips straight to plotting. The clean stage is keyed by the source
+    fingerprints; when the QoG source is a URL it is recomputed and the
+    later stages are keyed by the content of the cleaned frame instead.
+
+    A :class:`~econ_analysis_gbm2118.profiling.StageProfiler` passed as
+    ``profiler`` records the ``load_harvard``, ``load_qog``, ``merge``,
+    ``fill_clip``, ``clean_names``, ``summary``, ``plot`` and ``extremes``
+    stages, and ``optimize_dtypes`` with ``dtype_optimization``. Stages served from the stage cache
+    are recorded once, under their cached stage name, with ``cached`` set.
+
+    With an ``output_dir``, the merged frame, summary and extremes are
+    written there as ``output_format`` (``"parquet"`` or ``"csv"``) by
+    :func:`~econ_analysis_gbm2118.outputs.write_outputs`, together with a
+    ``manifest.json`` of row counts, checksums and timings, and the
+    summary is no longer printed.
+
+    ``backend`` selects the dataframe engine (see
+    :func:`~econ_analysis_gbm2118.backends.get_backend`). The default
+    ``"pandas"`` runs the functions of this package; ``"arrow"`` runs
+    every stage on Arrow-native tables with multithreaded kernels and
+    returns the merged data as a :class:`pyarrow.Table`. Summary and
+    extremes are pandas DataFrames with either engine. Only their stages
+    are cached for engines other than pandas.
+
+    With the pandas engine, the Harvard text columns are read as
+    ``string_dtype``, Arrow-backed strings by default, which store the
+    ISO3 codes in contiguous buffers rather than as Python objects;
+    ``None`` keeps them as ``object``.
+
+    With ``dtype_optimization`` (pandas engine only), every year of the
+    Harvard data is also shrunk by
+    :func:`~econ_analysis_gbm2118.cleaning.optimize_dtypes` before the
+    :data:`PIPELINE_YEAR` filter and imputation, while ranks are still
+    whole numbers and ISO3 codes repeat across the panel, and the
+    footprint of the loaded data before and after is recorded in the
+    manifest when outputs are written. It is off by default: imputation
+    and clipping turn the ranks back into fractional floats, and codes
+    of a single year do not repeat, so the analysed frame does not
+    shrink further. Analytical results are unchanged either way.
     """
+    run_start = time.perf_counter()
+    engine = get_backend(backend)
+    native = engine.name != "pandas"
+    merge, fill_clip, clean_names = merge_datasets, fill_and_clip_numeric, clean_country_names
+    summarize, extremes_of = summary_statistics, extreme_rank_countries
+    if native:
+        merge, fill_clip, clean_names = engine.merge, engine.fill_and_clip, engine.clean_names
+        summarize, extremes_of = engine.summary_statistics, engine.extreme_rank_countries
+    cache = StageCache(Path(cache_dir) / STAGE_CACHE_DIR, max_cache_bytes) if cache_dir else None
+    optimize = dtype_optimization and not native
+    memory = {}
+
+    with profiler if profiler is not None else nullcontext():
+        # Load, clean & merge
+        def clean():
+            df_harvard, df_qog = load_sources(
+                harvard_csv,
+                qog_source,
+                cache_dir=cache_dir,
+                qog_columns=qog_columns,
+                max_workers=max_workers,
+                executor=executor,
+                profiler=profiler,
+                year=None if optimize else PIPELINE_YEAR,
+                backend=backend,
+                string_dtype=string_dtype,
+            )
+            if optimize:
+                # Ranks are still whole numbers and codes repeat across
+                # years only before imputation and the year filter
+                df_harvard, report = _run_stage(profiler, "optimize_dtypes", optimize_dtypes, df_harvard)
+                memory["bytes_before"] = int(report["bytes_before"].sum())
+                memory["bytes_after"] = int(report["bytes_after"].sum())
+                keep = df_harvard["year"].eq(PIPELINE_YEAR).to_numpy(dtype=bool, na_value=False)
+                df_harvard = df_harvard[keep]
+            merged = _run_stage(profiler, "merge", merge, df_harvard, df_qog)
+            merged = _run_stage(profiler, "fill_clip", fill_clip, merged)
+            return _run_stage(profiler, "clean_names", clean_names, merged)
+
+        clean_key = None
+        if cache is not None:
+            sources = [_source_key(harvard_csv), _source_key(qog_source, columns=qog_columns)]
+            if None not in sources:
+                params = {"backend": backend} if native else {}
+                if not native and string_dtype is not None:
+                    params["string_dtype"] = string_dtype
+                if optimize:
+                    params["dtype_optimization"] = True
+                clean_key = cache.key("clean", sources, **params)
+        # The stage cache stores DataFrames, so native frames are rebuilt
+        merged = clean() if native else _cached_stage(cache, clean_key, clean, profiler, "clean")
+        if cache is not None and clean_key is None:
+            clean_key = frame_digest(engine.to_pandas(merged))
+
+        # Summary stats
+        vars_of_interest = VARS_OF_INTEREST
+
+        summary = _cached_stage(
+            cache,
+            cache and cache.key("summary", [clean_key], vars_of_interest=vars_of_interest),
+            lambda: _run_stage(profiler, "summary", summarize, merged, vars_of_interest),
+            profiler,
+            "summary",
+        )
+        if output_dir is None:
+            print(summary)
+
+        # Plot
+        plot_frame = engine.to_pandas(merged, ["eci_sitc", "wef_gci"]) if native else merged
+        _run_stage(profiler, "plot", plot_eci_vs_gci, plot_frame)
+
+        # Extremes
+        rank_cols = {"rank_col1": "eci_rank_sitc", "rank_col2": "bti_ep"}
+        extremes = _cached_stage(
+            cache,
+            cache and cache.key("extremes", [clean_key], **rank_cols),
+            lambda: _run_stage(profiler, "extremes", extremes_of, merged, **rank_cols),
+            profiler,
+            "extremes",
+        )
 
-    # Load
-    df_harvard = load_harvard_data(harvard_csv)
-    df_qog = load_qog_data(qog_source)
-
-    # Clean & merge
-    merged = clean_merged_data(df_harvard, df_qog)
-
-    # Summary stats
-    vars_of_interest = [
-        "growth_proj", "eci_sitc", "eci_rank_sitc",
-        "eci_hs92", "eci_rank_hs92",
-        "eci_hs12", "eci_rank_hs12",
-        "pwt_hci", "bti_eos", "bti_ep",
-        "wef_gci", "mad_gdppc",
-    ]
-
-    summary = summary_statistics(merged, vars_of_interest)
-    print(summary)
-
-    # Plot
-    plot_eci_vs_gci(merged)
-
-    # Extremes
-    extremes = extreme_rank_countries(
-        merged,
-        rank_col1="eci_rank_sitc",
-        rank_col2="bti_ep",
-    )
+    # Persist
+    if output_dir is not None:
+        timings = {"pipeline": time.perf_counter() - run_start}
+        if profiler is not None:
+            timings.update((r["stage"], r["wall_time"]) for r in profiler.records)
+        write_outputs(
+            output_dir,
+            {"merged": engine.to_pandas(merged), "summary": summary, "extremes": extremes},
+            format=output_format,
+            timings=timings,
+            metadata={"memory": memory} if memory else None,
+        )
 
     return merged, summary, extremes
@@ -0,0 +1,235 @@
+import json
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+RECORD_FIELDS = [
+    "stage", "cached", "wall_time", "cpu_time", "peak_traced_bytes", "peak_rss_bytes",
+    "rows_in", "columns_in", "rows_out", "columns_out",
+]
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _frame_shape(frames) -> tuple:
+    frames = [f for f in frames if isinstance(f, pd.DataFrame)]
+    if not frames:
+        return None, None
+    return sum(f.shape[0] for f in frames), sum(f.shape[1] for f in frames)
+
+
+def profiled_call(
+    stage: str,
+    func,
+    args: tuple = (),
+    kwargs: dict = None,
+    trace_memory: bool = True,
+    cached: bool = False,
+) -> tuple:
+    """
+    Call a function and measure it as one pipeline stage.
+
+    This is the building block of :class:`StageProfiler`. It is a plain
+    module-level function returning its record, so it can also run in a
+    worker process and hand the record back to the parent.
+
+    Parameters
+    ----------
+    stage : str
+        Stage name stored in the record.
+    func : callable
+        Function to call as ``func(*args, **kwargs)``.
+    args : tuple, optional
+        Positional arguments.
+    kwargs : dict, optional
+        Keyword arguments.
+    trace_memory : bool, default=True
+        Whether to measure the peak of Python-visible allocations
+        (including NumPy buffers) with :mod:`tracemalloc`. Tracing is
+        started for the call if it is not already running.
+    cached : bool, default=False
+        Value of the record's ``cached`` field, set when the stage output
+        was read from a cache instead of computed.
+
+    Returns
+    -------
+    tuple
+        ``(result, record)``, where ``record`` is a dict with the fields
+        in ``RECORD_FIELDS``. ``rows_in`` and ``columns_in`` are summed
+        over the DataFrame arguments; shapes are ``None`` where no frame
+        is involved.
+    """
+    kwargs = kwargs or {}
+    own_trace = trace_memory and not tracemalloc.is_tracing()
+    if own_trace:
+        tracemalloc.start()
+    if trace_memory:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = func(*args, **kwargs)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    peak_traced = None
+    if trace_memory:
+        peak_traced = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+    if own_trace:
+        tracemalloc.stop()
+
+    rows_in, columns_in = _frame_shape(list(args) + list(kwargs.values()))
+    rows_out, columns_out = _frame_shape([result])
+    record = {
+        "stage": stage,
+        "cached": cached,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "peak_traced_bytes": peak_traced,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "rows_in": rows_in,
+        "columns_in": columns_in,
+        "rows_out": rows_out,
+        "columns_out": columns_out,
+    }
+    return result, record
+
+
+class StageProfiler:
+    """
+    Collect per-stage timing and memory records for a pipeline run.
+
+    Every stage run through the profiler produces a record with wall and
+    CPU time, peak traced and resident memory, and rows and columns in
+    and out. Records are kept in :attr:`records` and passed to each
+    callback as soon as the stage finishes, so they can be forwarded to
+    an external monitoring system.
+
+    Parameters
+    ----------
+    callbacks : list of callable, optional
+        Functions called as ``callback(record)`` after every stage.
+    trace_memory : bool, default=True
+        Whether to trace allocations with :mod:`tracemalloc`. Tracing
+        slows allocation-heavy Python code, so disable it when only
+        timings are needed.
+
+    Notes
+    -----
+    CPU time, traced memory and resident memory are process-wide. Stages
+    that run concurrently on a thread pool (the two source loads)
+    therefore overlap in those measurements. ``peak_rss_bytes`` is the
+    high-water mark of the process up to the end of the stage.
+    """
+
+    def __init__(self, callbacks: list = None, trace_memory: bool = True):
+        self.callbacks = list(callbacks or [])
+        self.trace_memory = trace_memory
+        self.records = []
+        self._own_trace = False
+
+    def __enter__(self) -> "StageProfiler":
+        # Trace once for the whole run so that stages on worker threads
+        # share one tracer instead of starting and stopping their own
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_trace = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._own_trace:
+            tracemalloc.stop()
+            self._own_trace = False
+
+    def run(self, stage: str, func, *args, **kwargs):
+        """
+        Run ``func(*args, **kwargs)`` as a profiled stage.
+
+        Parameters
+        ----------
+        stage : str
+            Stage name.
+        func : callable
+            Function implementing the stage.
+        *args, **kwargs
+            Arguments passed to ``func``.
+
+        Returns
+        -------
+        object
+            The return value of ``func``.
+        """
+        result, record = profiled_call(stage, func, args, kwargs, trace_memory=self.trace_memory)
+        self.add(record)
+        return result
+
+    def add(self, record: dict) -> None:
+        """
+        Add a record produced elsewhere, for example in a worker process.
+
+        Parameters
+        ----------
+        record : dict
+            Record as returned by :func:`profiled_call`.
+        """
+        self.records.append(record)
+        for callback in self.callbacks:
+            callback(record)
+
+    def report(self) -> dict:
+        """
+        Summarize the collected records.
+
+        Returns
+        -------
+        dict
+            JSON-serializable report with the per-stage ``stages`` records
+            and the ``wall_time`` and ``cpu_time`` summed over stages.
+        """
+        return {
+            "stages": list(self.records),
+            "wall_time": sum(r["wall_time"] for r in self.records),
+            "cpu_time": sum(r["cpu_time"] for r in self.records),
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the records as a DataFrame, one row per stage.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table with the columns in ``RECORD_FIELDS``.
+        """
+        return pd.DataFrame(self.records, columns=RECORD_FIELDS)
+
+    def to_json(self, path: str = None) -> str:
+        """
+        Serialize :meth:`report` as JSON.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to write the report to.
+
+        Returns
+        -------
+        str
+            The JSON document.
+        """
+        text = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(text + "\n")
+        return text
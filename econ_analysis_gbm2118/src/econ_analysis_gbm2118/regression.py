@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.data import HarvardPanel
+
+ECI_VARIANTS = ["eci_sitc", "eci_hs92", "eci_hs12"]
+GOVERNANCE_CONTROLS = ["bti_ep", "bti_eos", "wef_gci", "pwt_hci", "mad_gdppc"]
+
+RESULT_COLUMNS = [
+    "spec", "specification", "term", "coef", "std_error", "t_value",
+    "nobs", "r_squared", "adj_r_squared",
+]
+
+
+def specification_grid(
+    main: list = ECI_VARIANTS,
+    controls: list = GOVERNANCE_CONTROLS,
+    min_controls: int = 0,
+    max_controls: int = None,
+) -> list:
+    """
+    Build a grid of regression specifications.
+
+    Every main regressor is paired with every subset of ``controls``
+    whose size lies between ``min_controls`` and ``max_controls``.
+
+    Parameters
+    ----------
+    main : list of str, default=ECI_VARIANTS
+        Regressors of interest; each specification contains exactly one.
+    controls : list of str, default=GOVERNANCE_CONTROLS
+        Candidate control variables.
+    min_controls : int, default=0
+        Smallest number of controls per specification.
+    max_controls : int, optional
+        Largest number of controls per specification. ``None`` allows
+        all of them.
+
+    Returns
+    -------
+    list of tuple of str
+        Regressor lists, one per specification.
+    """
+    if max_controls is None:
+        max_controls = len(controls)
+
+    specs = []
+    for var in main:
+        for size in range(min_controls, max_controls + 1):
+            for subset in combinations(controls, size):
+                specs.append((var,) + subset)
+    return specs
+
+
+def _fit_specs(df: pd.DataFrame, specs: list, outcome: str, add_constant: bool, sample: str) -> pd.DataFrame:
+    variables = list(dict.fromkeys(v for spec in specs for v in spec))
+    data = df[[outcome] + variables].to_numpy(dtype="float64", na_value=np.nan)
+    y = data[:, 0]
+    X = data[:, 1:]
+    terms = variables
+    offset = 0
+    if add_constant:
+        X = np.column_stack([np.ones(len(X)), X])
+        terms = ["const"] + variables
+        offset = 1
+
+    position = {v: i + offset for i, v in enumerate(variables)}
+    spec_cols = [([0] if add_constant else []) + [position[v] for v in spec] for spec in specs]
+
+    # Specifications with the same estimation sample share one Gram matrix
+    valid = ~np.isnan(data)
+    if sample == "common":
+        masks = [valid.all(axis=1)] * len(specs)
+    else:
+        masks = [valid[:, [0] + [position[v] - offset + 1 for v in spec]].all(axis=1) for spec in specs]
+
+    groups = {}
+    for s, mask in enumerate(masks):
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(s)
+
+    rows = []
+    for mask, members in groups.values():
+        # Each Gram matrix only spans the columns its specifications use,
+        # so samples shared by few specifications stay cheap
+        cols = sorted({c for s in members for c in spec_cols[s]})
+        local = {c: i for i, c in enumerate(cols)}
+        Xm, ym = X[np.ix_(mask, cols)], y[mask]
+        n = len(ym)
+        gram = Xm.T @ Xm
+        xty = Xm.T @ ym
+        # Unit-diagonal scaling keeps the Gram matrix well conditioned when
+        # regressors differ in magnitude (e.g. mad_gdppc against indices)
+        scale = np.sqrt(np.diag(gram))
+        scale[scale == 0] = 1
+        gram = gram / np.outer(scale, scale)
+        xty = xty / scale
+        yty = ym @ ym
+        tss = yty - ym.sum() ** 2 / n if add_constant and n else yty
+
+        # Specifications of equal size are solved as one stacked batch
+        by_size = {}
+        for s in members:
+            by_size.setdefault(len(spec_cols[s]), []).append(s)
+
+        for k, batch in by_size.items():
+            idx = np.array([[local[c] for c in spec_cols[s]] for s in batch])
+            sub_gram = gram[idx[:, :, None], idx[:, None, :]]
+            sub_xty = xty[idx]
+            inv = np.linalg.pinv(sub_gram)
+            beta = np.einsum("sij,sj->si", inv, sub_xty)
+            rss = np.clip(yty - np.einsum("si,si->s", beta, sub_xty), 0, None)
+
+            # Undo the scaling on the coefficients and their covariance
+            sub_scale = scale[idx]
+            beta = beta / sub_scale
+            inv = inv / (sub_scale[:, :, None] * sub_scale[:, None, :])
+
+            dof = n - k
+            with np.errstate(invalid="ignore", divide="ignore"):
+                sigma2 = np.where(dof > 0, rss / dof, np.nan)
+                se = np.sqrt(sigma2[:, None] * np.diagonal(inv, axis1=1, axis2=2))
+                r2 = 1 - rss / tss
+                adj_r2 = 1 - (1 - r2) * (n - offset) / dof
+
+            for row, s in enumerate(batch):
+                label = f"{outcome} ~ " + " + ".join(specs[s])
+                for col, term_idx in enumerate(spec_cols[s]):
+                    rows.append((
+                        s, label, terms[term_idx], beta[row, col], se[row, col],
+                        beta[row, col] / se[row, col] if se[row, col] > 0 else np.nan,
+                        n, r2[row], adj_r2[row],
+                    ))
+
+    result = pd.DataFrame(rows, columns=RESULT_COLUMNS)
+    return result.sort_values("spec", kind="stable").reset_index(drop=True)
+
+
+def run_specifications(
+    df: pd.DataFrame,
+    specs: list,
+    outcome: str = "growth_proj",
+    add_constant: bool = True,
+    sample: str = "complete",
+    by: str = None,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """
+    Fit a grid of OLS specifications in batched form.
+
+    The Gram matrix ``X'X``, ``X'y`` and ``y'y`` are computed once per
+    estimation sample, over the regressors of the specifications that
+    share it. Each
+    specification is then solved from the relevant sub-blocks, with
+    equally sized specifications stacked into one batched solve, instead
+    of refitting every model from the raw data.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or HarvardPanel
+        Dataset containing the outcome and regressors. A
+        :class:`~econ_analysis_gbm2118.data.HarvardPanel` is fitted per
+        year unless ``by`` says otherwise.
+    specs : list of list of str
+        Regressors for each specification, for example from
+        :func:`specification_grid`.
+    outcome : str, default="growth_proj"
+        Dependent variable.
+    add_constant : bool, default=True
+        Whether to include an intercept (reported as term ``const``).
+    sample : {"complete", "common"}, default="complete"
+        ``"complete"`` uses the complete cases of each specification's
+        own variables; specifications with the same complete cases share
+        their Gram matrix. ``"common"`` uses the rows complete in every
+        variable of the grid, so all specifications share one matrix.
+    by : str, optional
+        Column or index level, such as ``"year"``, whose groups are
+        fitted separately.
+    n_jobs : int, default=1
+        Number of worker processes used to fit groups in parallel.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per (specification, term) with ``spec``,
+        ``specification``, ``term``, ``coef``, ``std_error``,
+        ``t_value``, ``nobs``, ``r_squared`` and ``adj_r_squared``
+        columns, preceded by the ``by`` column when grouped.
+
+    Raises
+    ------
+    KeyError
+        If the outcome or a regressor is missing from the DataFrame.
+    ValueError
+        If ``sample`` is not ``"complete"`` or ``"common"``.
+    """
+    if sample not in ("complete", "common"):
+        raise ValueError(f"sample must be 'complete' or 'common', got {sample!r}")
+
+    if isinstance(df, HarvardPanel):
+        df = df.frame
+        by = "year" if by is None else by
+
+    specs = [tuple(spec) for spec in specs]
+    if by is None:
+        return _fit_specs(df, specs, outcome, add_constant, sample)
+
+    keys, frames = zip(*df.groupby(by))
+    args = [(frame, specs, outcome, add_constant, sample) for frame in frames]
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_fit_specs, *zip(*args)))
+    else:
+        results = [_fit_specs(*a) for a in args]
+
+    for key, result in zip(keys, results):
+        result.insert(0, by, key)
+    return pd.concat(results, ignore_index=True)
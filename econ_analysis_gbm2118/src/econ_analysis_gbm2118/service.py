@@ -0,0 +1,281 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from econ_analysis_gbm2118.analysis import correlation_matrix, extreme_rank_countries, summary_statistics
+from econ_analysis_gbm2118.cleaning import clean_country_names, fill_and_clip_numeric, merge_datasets
+from econ_analysis_gbm2118.data import QOG_COLUMNS
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST, load_sources
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_QUERY_CACHE_SIZE = 256
+
+
+def _source_state(source: str) -> tuple:
+    # Size and modification time are enough to notice a replaced file
+    # without hashing it on every query; remote sources are not watched
+    if "://" in str(source):
+        return None
+    stat = os.stat(source)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _split(value: str) -> list:
+    return [v for v in value.split(",") if v]
+
+
+class QueryService:
+    """
+    Warm, in-memory query engine over the cleaned dataset.
+
+    Both sources are loaded, merged and cleaned once and kept in memory.
+    Queries are answered from the warm frames, and their JSON results are
+    kept in a least-recently-used cache. Before each query the sources
+    are checked with a cheap ``stat`` call; when a file has changed the
+    data is reloaded and the query cache is cleared. While a source file
+    is missing, for example mid-replacement, the last loaded data keeps
+    being served.
+
+    Parameters
+    ----------
+    harvard_csv : str
+        Path to the Harvard Atlas CSV.
+    qog_source : str
+        Path or URL of the QoG Excel file. URLs are loaded once and not
+        watched for changes.
+    cache_dir : str, optional
+        Directory for the on-disk Parquet caches of both sources.
+    qog_columns : list of str, optional
+        QoG columns to load. ``None`` loads all of them.
+    cache_size : int, default=DEFAULT_QUERY_CACHE_SIZE
+        Maximum number of query results kept in memory.
+
+    Notes
+    -----
+    Correlations are computed on the merged data before imputation, as
+    recommended by :func:`~econ_analysis_gbm2118.analysis.correlation_matrix`;
+    statistics and extremes use the fully cleaned frame, as in
+    :func:`~econ_analysis_gbm2118.pipeline.run_pipeline`.
+    """
+
+    def __init__(
+        self,
+        harvard_csv: str,
+        qog_source: str,
+        cache_dir: str = None,
+        qog_columns: list = QOG_COLUMNS,
+        cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+    ):
+        self.harvard_csv = harvard_csv
+        self.qog_source = qog_source
+        self.cache_dir = cache_dir
+        self.qog_columns = qog_columns
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._results = OrderedDict()
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._load()
+
+    def _load(self) -> None:
+        states = (_source_state(self.harvard_csv), _source_state(self.qog_source))
+        df_harvard, df_qog = load_sources(
+            self.harvard_csv, self.qog_source, cache_dir=self.cache_dir, qog_columns=self.qog_columns
+        )
+        self.raw = merge_datasets(df_harvard, df_qog)
+        # Both cleaning steps modify their input, so work on a copy to
+        # keep the raw merge (and its missing values) for correlations
+        self.frame = clean_country_names(fill_and_clip_numeric(self.raw.copy()))
+        self._states = states
+        self._generation += 1
+        self._results.clear()
+
+    def refresh(self) -> bool:
+        """
+        Reload the data if a source file changed since it was loaded.
+
+        Returns
+        -------
+        bool
+            Whether the data was reloaded. ``False`` also when a source
+            file is missing, in which case the loaded data is kept.
+        """
+        with self._lock:
+            try:
+                states = (_source_state(self.harvard_csv), _source_state(self.qog_source))
+                if states == self._states:
+                    return False
+                # _load only replaces the data once both sources are read
+                self._load()
+            except FileNotFoundError:
+                return False
+            self.reloads += 1
+            return True
+
+    def query(self, name: str, **params) -> str:
+        """
+        Answer a query, from the result cache when possible.
+
+        Parameters
+        ----------
+        name : {"stats", "extremes", "correlation"}
+            Query to run.
+        **params
+            Query parameters, as strings:
+
+            - ``stats``: ``variables`` (comma-separated, defaults to the
+              pipeline's variables of interest).
+            - ``extremes``: ``rank_col1``, ``rank_col2`` and ``top_n``.
+            - ``correlation``: ``columns`` (comma-separated, defaults to
+              every numeric column) and ``method``.
+
+        Returns
+        -------
+        str
+            JSON document with the result.
+
+        Raises
+        ------
+        KeyError
+            If the query name is unknown.
+        ValueError
+            If the parameters are invalid for the query.
+        """
+        if name not in _QUERIES:
+            raise KeyError(f"Unknown query: {name!r}")
+
+        with self._lock:
+            self.refresh()
+            key = (name, tuple(sorted(params.items())))
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+            frame, raw, generation = self.frame, self.raw, self._generation
+
+        # Queries run outside the lock so slow ones do not block cache hits
+        result = _QUERIES[name](frame, raw, **params)
+        with self._lock:
+            self.misses += 1
+            # Drop results computed on data that was reloaded meanwhile
+            if generation != self._generation:
+                return result
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return result
+
+
+def _stats_query(frame, raw, variables: str = None) -> str:
+    vars_of_interest = _split(variables) if variables else VARS_OF_INTEREST
+    return summary_statistics(frame, vars_of_interest).to_json(orient="split")
+
+
+def _extremes_query(
+    frame, raw, rank_col1: str = "eci_rank_sitc", rank_col2: str = "bti_ep", top_n: str = "5"
+) -> str:
+    for col in (rank_col1, "cname"):
+        if col not in frame.columns:
+            raise ValueError(f"{col} not found in dataframe")
+    extremes = extreme_rank_countries(frame, rank_col1, rank_col2, top_n=int(top_n))
+    return extremes.astype({"cname": str}).to_json(orient="split")
+
+
+def _correlation_query(frame, raw, columns: str = None, method: str = "pearson") -> str:
+    columns = _split(columns) if columns else None
+    if columns is not None:
+        missing = set(columns) - set(raw.columns)
+        if missing:
+            raise ValueError(f"Columns not found in dataframe: {sorted(missing)}")
+    corr, counts = correlation_matrix(raw, columns, method=method)
+    return json.dumps({
+        "corr": json.loads(corr.to_json(orient="split")),
+        "counts": json.loads(counts.to_json(orient="split")),
+    })
+
+
+_QUERIES = {
+    "stats": _stats_query,
+    "extremes": _extremes_query,
+    "correlation": _correlation_query,
+}
+
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        name = url.path.strip("/")
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if name == "health":
+            with self.service._lock:
+                body = json.dumps({
+                    "rows": len(self.service.frame),
+                    "hits": self.service.hits,
+                    "misses": self.service.misses,
+                    "reloads": self.service.reloads,
+                })
+            return self._send(200, body)
+
+        if name not in _QUERIES:
+            return self._send(404, json.dumps({"error": f"Unknown query: {name!r}"}))
+        try:
+            body = self.service.query(name, **params)
+        except (TypeError, ValueError) as exc:
+            return self._send(400, json.dumps({"error": str(exc)}))
+        except Exception as exc:
+            return self._send(500, json.dumps({"error": f"{type(exc).__name__}: {exc}"}))
+        self._send(200, body)
+
+    def _send(self, status: int, body: str) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _QueryServer(ThreadingHTTPServer):
+    # The socketserver default backlog of 5 makes concurrent clients wait
+    # for connection retries under load
+    request_queue_size = 128
+
+
+def make_server(service: QueryService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Create an HTTP server answering queries from a :class:`QueryService`.
+
+    Endpoints are ``GET /stats``, ``/extremes`` and ``/correlation`` with
+    the parameters of :meth:`QueryService.query` in the query string, and
+    ``GET /health`` for cache counters. Results are JSON; unknown
+    endpoints return 404, invalid parameters 400 and any other error
+    raised by a query 500.
+
+    Parameters
+    ----------
+    service : QueryService
+        Warm service answering the queries.
+    host : str, default=DEFAULT_HOST
+        Interface to bind.
+    port : int, default=DEFAULT_PORT
+        Port to bind. ``0`` picks a free port.
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        The bound server; call ``serve_forever()`` to start it.
+    """
+    handler = type("QueryHandler", (_QueryHandler,), {"service": service})
+    return _QueryServer((host, port), handler)
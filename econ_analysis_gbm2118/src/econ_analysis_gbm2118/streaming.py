@@ -0,0 +1,325 @@
+import numpy as np
+import pandas as pd
+
+DESCRIBE_COLUMNS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+class TDigest:
+    """
+    Mergeable t-digest sketch for approximate quantiles.
+
+    Values are summarized as weighted centroids. Clusters are sized with
+    the arcsine scale function, so centroids stay small (often single
+    points) in the tails and larger around the median. Compression is
+    done in one vectorized pass over the sorted centroids, and two
+    digests merge by pooling their centroids and compressing again.
+
+    Parameters
+    ----------
+    compression : int, default=200
+        Accuracy parameter. Larger values keep more centroids.
+
+    Notes
+    -----
+    Values are only clustered once more than ``2 * compression`` centroids
+    have accumulated, so small inputs give exact quantiles (using the same
+    linear interpolation as :meth:`pandas.Series.quantile`).
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.nan
+        self.max = np.nan
+
+    @property
+    def count(self) -> float:
+        """Total weight (number of values) summarized by the digest."""
+        return float(self.weights.sum())
+
+    def update(self, values) -> "TDigest":
+        """
+        Add an array of values. NaNs are ignored.
+
+        Parameters
+        ----------
+        values : array-like
+            Values to add.
+
+        Returns
+        -------
+        TDigest
+            The updated digest.
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if values.size:
+            self._absorb(values, np.ones(values.size), values.min(), values.max())
+        return self
+
+    def update_constant(self, value: float, count: int) -> "TDigest":
+        """
+        Add ``count`` copies of one value without materializing them.
+
+        The run is stored as a single-point centroid at each end and one
+        heavy centroid in between, so quantiles interpolate flat across
+        it exactly as they would over the individual copies.
+
+        Parameters
+        ----------
+        value : float
+            Value to add. Ignored if NaN.
+        count : int
+            Number of copies.
+
+        Returns
+        -------
+        TDigest
+            The updated digest.
+        """
+        if count > 0 and not np.isnan(value):
+            weights = np.array([1.0, count - 2.0, 1.0]) if count > 2 else np.ones(count)
+            self._absorb(np.full(weights.size, float(value)), weights, value, value)
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """
+        Merge another digest into this one.
+
+        Parameters
+        ----------
+        other : TDigest
+            Digest to merge. It is not modified.
+
+        Returns
+        -------
+        TDigest
+            The updated digest.
+        """
+        if other.weights.size:
+            self._absorb(other.means, other.weights, other.min, other.max)
+        return self
+
+    def _absorb(self, means, weights, lo, hi):
+        self.min = np.fmin(self.min, lo)
+        self.max = np.fmax(self.max, hi)
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        if means.size > 2 * self.compression:
+            means, weights = self._compress(means, weights)
+        self.means, self.weights = means, weights
+
+    def _compress(self, means, weights):
+        # Map the left edge of each centroid to k-space and start a new
+        # cluster whenever the integer part of k changes, which keeps each
+        # cluster within one unit of the scale function
+        total = weights.sum()
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        group = np.floor(k - k[0]).astype(np.int64)
+
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        new_weights = np.add.reduceat(weights, starts)
+        new_means = np.add.reduceat(means * weights, starts) / new_weights
+        return new_means, new_weights
+
+    def quantile(self, q):
+        """
+        Estimate one or more quantiles.
+
+        Parameters
+        ----------
+        q : float or array-like of float
+            Quantiles to estimate, between 0 and 1.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Estimated quantiles; NaN if the digest is empty.
+        """
+        q = np.asarray(q, dtype="float64")
+        if not self.weights.size:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+
+        # Centroid positions on the 0..n-1 rank scale used by pandas'
+        # linear interpolation, anchored to the exact min and max
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2 - 0.5
+        xp = np.r_[0.0, centers, total - 1]
+        fp = np.r_[self.min, self.means, self.max]
+        return np.interp(q * (total - 1), xp, fp)
+
+
+class StreamingSummary:
+    """
+    Mergeable streaming accumulator for descriptive statistics.
+
+    Count, mean, standard deviation, minimum and maximum are exact and
+    updated chunk by chunk with the parallel form of Welford's algorithm
+    (vectorized over columns). Quartiles come from one :class:`TDigest`
+    per column. Accumulators built on separate chunks, files or workers
+    can be combined with :meth:`merge`, and :meth:`result` returns a
+    table shaped like ``DataFrame.describe().T``.
+
+    Parameters
+    ----------
+    columns : list of str
+        Columns to summarize. Columns missing from a chunk are treated
+        as all-missing for that chunk.
+    compression : int, default=200
+        Compression passed to each column's :class:`TDigest`.
+    """
+
+    def __init__(self, columns: list, compression: int = 200):
+        self.columns = list(columns)
+        n_cols = len(self.columns)
+        self.n = np.zeros(n_cols)
+        self.mean = np.zeros(n_cols)
+        self.m2 = np.zeros(n_cols)
+        self.min = np.full(n_cols, np.nan)
+        self.max = np.full(n_cols, np.nan)
+        self.digests = [TDigest(compression) for _ in self.columns]
+
+    def update(self, df: pd.DataFrame) -> "StreamingSummary":
+        """
+        Consume one chunk of data.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Chunk containing some or all of the tracked columns.
+
+        Returns
+        -------
+        StreamingSummary
+            The updated accumulator.
+        """
+        values = (
+            df.reindex(columns=self.columns)
+            .to_numpy(dtype="float64", na_value=np.nan)
+        )
+        valid = ~np.isnan(values)
+        n = valid.sum(axis=0).astype("float64")
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(valid, values, 0).sum(axis=0) / n
+            m2 = np.where(valid, (values - mean) ** 2, 0).sum(axis=0)
+
+        has_data = n > 0
+        chunk_min = np.full(len(self.columns), np.nan)
+        chunk_max = np.full(len(self.columns), np.nan)
+        if values.shape[0]:
+            chunk_min[has_data] = np.nanmin(values[:, has_data], axis=0)
+            chunk_max[has_data] = np.nanmax(values[:, has_data], axis=0)
+
+        self._combine(n, np.where(has_data, mean, 0), np.where(has_data, m2, 0), chunk_min, chunk_max)
+        for i, digest in enumerate(self.digests):
+            digest.update(values[:, i])
+        return self
+
+    def merge(self, other: "StreamingSummary") -> "StreamingSummary":
+        """
+        Merge a partial accumulator for the same columns into this one.
+
+        Parameters
+        ----------
+        other : StreamingSummary
+            Accumulator to merge. It is not modified.
+
+        Returns
+        -------
+        StreamingSummary
+            The updated accumulator.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators track different columns.
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge summaries over different columns")
+
+        self._combine(other.n, other.mean, other.m2, other.min, other.max)
+        for digest, other_digest in zip(self.digests, other.digests):
+            digest.merge(other_digest)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b, min_b, max_b):
+        # Chan et al. pairwise update of count, mean and sum of squares
+        n = self.n + n_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean_b - self.mean
+            mean = np.where(n > 0, self.mean + delta * n_b / n, 0)
+            m2 = np.where(n > 0, self.m2 + m2_b + delta ** 2 * self.n * n_b / n, 0)
+        self.n, self.mean, self.m2 = n, mean, m2
+        self.min = np.fmin(self.min, min_b)
+        self.max = np.fmax(self.max, max_b)
+
+    def result(self) -> pd.DataFrame:
+        """
+        Return the accumulated statistics.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Variables as rows and ``count``, ``mean``, ``std``, ``min``,
+            ``25%``, ``50%``, ``75%`` and ``max`` as columns.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.where(self.n > 1, np.sqrt(self.m2 / (self.n - 1)), np.nan)
+        quartiles = np.array([d.quantile([0.25, 0.5, 0.75]) for d in self.digests]).reshape(-1, 3)
+
+        table = pd.DataFrame({
+            "count": self.n,
+            "mean": np.where(self.n > 0, self.mean, np.nan),
+            "std": std,
+            "min": self.min,
+            "25%": quartiles[:, 0],
+            "50%": quartiles[:, 1],
+            "75%": quartiles[:, 2],
+            "max": self.max,
+        }, index=self.columns)
+        return table[DESCRIBE_COLUMNS]
+
+
+def streaming_summary_statistics(chunks, vars_of_interest: list, compression: int = 200) -> pd.DataFrame:
+    """
+    Compute descriptive statistics over an iterable of chunks.
+
+    This is the streaming counterpart of
+    :func:`~econ_analysis_gbm2118.analysis.summary_statistics`, for data
+    that does not fit in memory, for example the output of
+    :func:`~econ_analysis_gbm2118.data.iter_harvard_chunks`. Variables
+    never seen in any chunk are dropped, with a warning printed to the
+    console.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        Chunks of the dataset.
+    vars_of_interest : list of str
+        List of column names for which descriptive statistics
+        should be computed.
+    compression : int, default=200
+        Accuracy of the quantile sketches.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A DataFrame of descriptive statistics with variables as rows
+        and summary measures as columns.
+    """
+    summary = StreamingSummary(vars_of_interest, compression=compression)
+    seen = set()
+    for chunk in chunks:
+        seen.update(chunk.columns)
+        summary.update(chunk)
+
+    missing_vars = set(vars_of_interest) - seen
+    if missing_vars:
+        print("Warning: Missing columns:", missing_vars)
+    return summary.result().loc[[v for v in vars_of_interest if v in seen]]
@@ -0,0 +1,196 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product, repeat
+from pathlib import Path
+
+import pandas as pd
+
+from econ_analysis_gbm2118.analysis import summary_statistics, extreme_rank_countries
+from econ_analysis_gbm2118.cleaning import clean_merged_data
+from econ_analysis_gbm2118.data import QOG_COLUMNS
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST, load_sources
+
+SWEEP_DEFAULTS = {
+    "year": None,
+    "vars_of_interest": VARS_OF_INTEREST,
+    "rank_col1": "eci_rank_sitc",
+    "rank_col2": "bti_ep",
+    "top_n": 5,
+}
+
+SWEEP_COLUMNS = [
+    "config", "year", "rank_col1", "rank_col2", "top_n",
+    "analysis", "label", "statistic", "value",
+]
+
+# Arrow IPC file of each cleaned year, set once per worker by _init_worker
+_SWEEP_PATHS = None
+# Year and frame most recently read by the current worker process
+_SWEEP_FRAME = (None, None)
+
+
+def sweep_grid(**axes) -> list:
+    """
+    Build a sweep spec from the Cartesian product of parameter values.
+
+    Parameters
+    ----------
+    **axes
+        Lists of values keyed by parameter name, for example
+        ``year=[2020, 2021]`` or ``rank_col2=["bti_ep", "wef_gci"]``.
+
+    Returns
+    -------
+    list of dict
+        One configuration per combination, in the order of ``axes``.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in product(*axes.values())]
+
+
+def _init_worker(paths: dict) -> None:
+    global _SWEEP_PATHS
+    _SWEEP_PATHS = paths
+
+
+def _worker_frame(year) -> pd.DataFrame:
+    import pyarrow.feather as feather
+
+    global _SWEEP_FRAME
+    if _SWEEP_FRAME[0] != year or _SWEEP_FRAME[1] is None:
+        # Only the memory-mapped file of this year is converted, so each
+        # worker holds a private copy of one year rather than the panel
+        table = feather.read_table(_SWEEP_PATHS[year], memory_map=True)
+        _SWEEP_FRAME = (year, table.to_pandas())
+    return _SWEEP_FRAME[1]
+
+
+def _clean_by_year(df_harvard: pd.DataFrame, df_qog: pd.DataFrame, years: list) -> dict:
+    frames = {}
+    for year in years:
+        part = df_harvard if year is None else df_harvard[df_harvard["year"] == year]
+        frames[year] = clean_merged_data(part, df_qog)
+    return frames
+
+
+def _analyze(index: int, config: dict, frames: dict = None, label: str = "cname") -> pd.DataFrame:
+    params = {**SWEEP_DEFAULTS, **config}
+    frame = _worker_frame(params["year"]) if frames is None else frames[params["year"]]
+
+    summary = summary_statistics(frame, params["vars_of_interest"])
+    summary = summary.rename_axis(index="label", columns="statistic").stack().rename("value").reset_index()
+    summary.insert(0, "analysis", "summary")
+
+    extremes = extreme_rank_countries(
+        frame, params["rank_col1"], params["rank_col2"], top_n=params["top_n"], label=label
+    )
+    extremes = (
+        extremes.set_index(label).rename_axis(index="label", columns="statistic")
+        .astype("float64").stack().rename("value").reset_index()
+    )
+    extremes.insert(0, "analysis", "extremes")
+
+    result = pd.concat([summary, extremes], ignore_index=True)
+    result["label"] = result["label"].astype(str)
+    result.insert(0, "config", index)
+    for offset, name in enumerate(["year", "rank_col1", "rank_col2", "top_n"], start=1):
+        result.insert(offset, name, params[name])
+    return result
+
+
+def run_sweep(
+    harvard_csv: str,
+    qog_source: str,
+    sweep: list,
+    cache_dir: str = None,
+    qog_columns: list = QOG_COLUMNS,
+    n_jobs: int = None,
+    label: str = "cname",
+) -> pd.DataFrame:
+    """
+    Run the analysis stages for many configurations over one loaded dataset.
+
+    Both sources are loaded once, for every year, and each year selected
+    by a configuration is cleaned once on its own, exactly as
+    :func:`run_pipeline` cleans it. Each configuration then only runs
+    :func:`summary_statistics` and :func:`extreme_rank_countries`. With
+    several workers every cleaned year is written once to its own
+    uncompressed Arrow IPC file, which the workers memory-map and convert
+    only for the year of the task at hand, so no frame is pickled per
+    task and no worker holds a copy of the whole panel.
+
+    Parameters
+    ----------
+    harvard_csv : str
+        Path to the Harvard Atlas CSV.
+    qog_source : str
+        Path or URL of the QoG Excel file.
+    sweep : list of dict
+        Configurations to run, for example from :func:`sweep_grid`. Each
+        may set ``year`` (``None`` for all years), ``vars_of_interest``,
+        ``rank_col1``, ``rank_col2`` and ``top_n``; missing keys take the
+        values in ``SWEEP_DEFAULTS``, which match :func:`run_pipeline`.
+    cache_dir : str, optional
+        Directory for the on-disk Parquet caches of both sources.
+    qog_columns : list of str, optional
+        QoG columns to load. ``None`` loads all of them.
+    n_jobs : int, optional
+        Number of worker processes. Values below 2 run serially in the
+        calling process; ``None`` uses one per CPU.
+    label : str, default="cname"
+        Column identifying each country in the extremes, passed to
+        :func:`extreme_rank_countries`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Long table with one row per (configuration, result value) and
+        the columns ``config`` (position in ``sweep``), ``year``,
+        ``rank_col1``, ``rank_col2``, ``top_n``, ``analysis``
+        (``"summary"`` or ``"extremes"``), ``label`` (variable or
+        country), ``statistic`` and ``value``.
+
+    Raises
+    ------
+    KeyError
+        If a configuration sets an unknown parameter.
+    ValueError
+        If a configuration's ``rank_col2`` is not in the cleaned data.
+
+    Notes
+    -----
+    Configurations with ``year=None`` use the whole panel cleaned at
+    once, so their imputation uses medians and quantiles of every year.
+    """
+    for config in sweep:
+        unknown = set(config) - set(SWEEP_DEFAULTS)
+        if unknown:
+            raise KeyError(f"Unknown sweep parameters: {sorted(unknown)}")
+
+    # Every year is loaded because configurations select their own
+    df_harvard, df_qog = load_sources(
+        harvard_csv, qog_source, cache_dir=cache_dir, qog_columns=qog_columns, year=None
+    )
+    years = list(dict.fromkeys(config.get("year", SWEEP_DEFAULTS["year"]) for config in sweep))
+    frames = _clean_by_year(df_harvard, df_qog, years)
+
+    workers = n_jobs or os.cpu_count() or 1
+    if workers < 2 or len(sweep) < 2:
+        results = [_analyze(i, config, frames, label) for i, config in enumerate(sweep)]
+    else:
+        import pyarrow.feather as feather
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for i, (year, frame) in enumerate(frames.items()):
+                paths[year] = str(Path(tmp) / f"cleaned-{i}.arrow")
+                feather.write_feather(frame, paths[year], compression="uncompressed")
+            del frames
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(paths,))
+            with pool:
+                results = list(pool.map(_analyze, range(len(sweep)), sweep, repeat(None), repeat(label)))
+
+    if not results:
+        return pd.DataFrame(columns=SWEEP_COLUMNS)
+    return pd.concat(results, ignore_index=True)[SWEEP_COLUMNS]
@@ -0,0 +1,193 @@
+from itertools import islice, product
+from pathlib import Path
+from string import ascii_uppercase
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.data import HARVARD_DTYPES
+
+LAST_YEAR = 2023
+# First year each Atlas classification is available; earlier values are missing
+CLASSIFICATION_START = {"sitc": 1962, "hs92": 1995, "hs12": 2012}
+# Growth projections only exist for the most recent years
+GROWTH_START = 2021
+
+
+def iso3_codes(n: int) -> list:
+    """
+    Generate ``n`` distinct three-letter country codes.
+
+    Parameters
+    ----------
+    n : int
+        Number of codes, at most 17,576.
+
+    Returns
+    -------
+    list of str
+        Codes ``"AAA"``, ``"AAB"``, ... in order.
+    """
+    return ["".join(c) for c in islice(product(ascii_uppercase, repeat=3), n)]
+
+
+def make_harvard(
+    countries: int = 150,
+    years: int = 29,
+    products: int = 0,
+    missing: float = 0.05,
+    seed: int = None,
+) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset with the Harvard Atlas schema.
+
+    Each country has a persistent complexity level that drifts from year
+    to year; the three ECI variants are noisy views of it and their ranks
+    are computed within each year. Classifications and growth projections
+    are missing before the years they became available, as in the real
+    export.
+
+    Parameters
+    ----------
+    countries : int, default=150
+        Number of countries.
+    years : int, default=29
+        Number of years, ending in 2023.
+    products : int, default=0
+        Number of products. When positive, every country-year row is
+        repeated per product with ``product_id``, ``export_value`` and
+        ``import_value`` columns, mimicking a product-level export.
+    missing : float, default=0.05
+        Share of ECI and growth values set to missing at random.
+    seed : int, optional
+        Seed for the random generator.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rows sorted by country and year (and product), with the dtypes of
+        ``HARVARD_DTYPES``.
+    """
+    rng = np.random.default_rng(seed)
+    year_values = np.arange(LAST_YEAR - years + 1, LAST_YEAR + 1)
+
+    level = rng.normal(size=(countries, 1))
+    drift = np.cumsum(rng.normal(scale=0.05, size=(countries, years)), axis=1)
+    complexity = level + drift
+
+    df = pd.DataFrame({
+        "country_id": np.repeat(np.arange(1, countries + 1), years),
+        "country_iso3_code": np.repeat(iso3_codes(countries), years),
+        "year": np.tile(year_values, countries),
+        "growth_proj": (2.5 + complexity + rng.normal(size=complexity.shape)).ravel(),
+        "in_rankings": rng.random(countries * years) > 0.05,
+    })
+    is_recent = df["year"].to_numpy() >= GROWTH_START
+    df.loc[~is_recent, "growth_proj"] = np.nan
+
+    for name, start in CLASSIFICATION_START.items():
+        eci = (complexity + rng.normal(scale=0.1, size=complexity.shape)).ravel()
+        eci[(df["year"].to_numpy() < start) | (rng.random(eci.size) < missing)] = np.nan
+        df[f"eci_{name}"] = eci
+        df[f"eci_rank_{name}"] = df.groupby("year")[f"eci_{name}"].rank(ascending=False, method="first")
+    df["growth_proj"] = df["growth_proj"].mask(rng.random(len(df)) < missing)
+
+    df = df.astype({col: dtype for col, dtype in HARVARD_DTYPES.items() if col in df.columns})
+    if products:
+        df = df.loc[df.index.repeat(products)].reset_index(drop=True)
+        df.insert(3, "product_id", np.tile(np.arange(products, dtype="int32"), countries * years))
+        df["export_value"] = rng.lognormal(mean=12, sigma=2, size=len(df)).round()
+        df["import_value"] = rng.lognormal(mean=12, sigma=2, size=len(df)).round()
+    return df
+
+
+def make_qog(
+    countries: int = 150,
+    extra_columns: int = 0,
+    missing: float = 0.1,
+    seed: int = None,
+) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset with the Quality of Governance schema.
+
+    Country codes match :func:`make_harvard` for the same ``countries``.
+    About one name in ten carries the ``" (the)"`` suffix removed by
+    :func:`~econ_analysis_gbm2118.cleaning.clean_country_names`.
+
+    Parameters
+    ----------
+    countries : int, default=150
+        Number of countries.
+    extra_columns : int, default=0
+        Number of additional numeric indicators (``ind_000``, ...), to
+        mimic the width of the full QoG export.
+    missing : float, default=0.1
+        Share of indicator values set to missing at random.
+    seed : int, optional
+        Seed for the random generator.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per country with the columns of ``QOG_COLUMNS`` followed
+        by the extra indicators.
+    """
+    rng = np.random.default_rng(seed)
+    codes = iso3_codes(countries)
+    names = [f"Country {code}" + (" (the)" if i % 10 == 0 else "") for i, code in enumerate(codes)]
+
+    df = pd.DataFrame({
+        "ccodealp": codes,
+        "cname": names,
+        "bti_ep": rng.uniform(1, 10, countries).round(2),
+        "bti_eos": rng.uniform(1, 10, countries).round(2),
+        "wef_gci": rng.uniform(2.5, 6, countries).round(2),
+        "pwt_hci": rng.uniform(1, 4, countries).round(3),
+        "mad_gdppc": rng.lognormal(mean=9, sigma=1, size=countries).round(),
+    })
+    extras = pd.DataFrame(
+        rng.normal(size=(countries, extra_columns)),
+        columns=[f"ind_{i:03d}" for i in range(extra_columns)],
+    )
+    df = pd.concat([df, extras], axis=1)
+
+    indicators = df.columns[2:]
+    df[indicators] = df[indicators].mask(rng.random((countries, len(indicators))) < missing)
+    return df
+
+
+def write_synthetic_sources(
+    directory: str,
+    countries: int = 150,
+    years: int = 29,
+    products: int = 0,
+    extra_columns: int = 0,
+    seed: int = None,
+) -> tuple:
+    """
+    Write a matching synthetic Harvard CSV and QoG workbook.
+
+    Parameters
+    ----------
+    directory : str
+        Destination directory. Created if missing.
+    countries, years, products : int
+        Passed to :func:`make_harvard`.
+    extra_columns : int, default=0
+        Passed to :func:`make_qog`.
+    seed : int, optional
+        Seed for both generators.
+
+    Returns
+    -------
+    tuple of pathlib.Path
+        ``(harvard_csv, qog_xlsx)``.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    harvard_csv = directory / "growth_proj_eci_rankings.csv"
+    qog_xlsx = directory / "qog_bas_cs.xlsx"
+
+    make_harvard(countries, years, products, seed=seed).to_csv(harvard_csv, index=False)
+    make_qog(countries, extra_columns, seed=seed).to_excel(qog_xlsx, index=False)
+    return harvard_csv, qog_xlsx
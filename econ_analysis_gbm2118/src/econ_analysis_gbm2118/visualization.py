@@ -1,14 +1,56 @@
-import seaborn as sns
-import matplotlib.pyplot as plt
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-def plot_eci_vs_gci(df, x_var='eci_sitc', y_var='wef_gci'):
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.data import HarvardPanel
+
+# matplotlib is imported inside the plotting functions so that importing
+# the package (and the CLI) does not pay for it until a plot is drawn
+
+MANIFEST_COLUMNS = ["x_var", "y_var", "year", "format", "path", "n_obs"]
+DENSITY_THRESHOLD = 50_000
+DENSITY_GRIDSIZE = 200
+
+def _draw_points(ax, x, y, density_threshold=DENSITY_THRESHOLD, gridsize=DENSITY_GRIDSIZE):
+    """
+    Draw ``y`` against ``x`` on ``ax`` as markers or as a density image.
+
+    Above ``density_threshold`` points the counts are binned on a
+    ``gridsize`` x ``gridsize`` grid with NumPy and drawn as a single
+    image, so drawing cost depends on the grid rather than the number of
+    points. Empty cells are left transparent.
+    """
+    if density_threshold is None or len(x) <= density_threshold:
+        ax.scatter(x, y)
+        return
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=gridsize)
+    image = ax.imshow(
+        np.ma.masked_equal(counts.T, 0),
+        origin="lower",
+        extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+        aspect="auto",
+        interpolation="nearest",
+    )
+    ax.figure.colorbar(image, ax=ax, label="count")
+
+def plot_eci_vs_gci(
+    df,
+    x_var='eci_sitc',
+    y_var='wef_gci',
+    density_threshold=DENSITY_THRESHOLD,
+    gridsize=DENSITY_GRIDSIZE,
+):
     """
     Plot a scatterplot comparing Economic Complexity Index (ECI) and
     Global Competitiveness Index (GCI).
 
     This function creates a scatterplot of two variables after dropping
     observations with missing values in either variable. The plot is
-    displayed using seaborn styling.
+    drawn on the current pyplot figure and displayed.
 
     Parameters
     ----------
@@ -18,6 +60,13 @@ def plot_eci_vs_gci(df, x_var='eci_sitc', y_var='wef_gci'):
         Name of the column to be plotted on the x-axis.
     y_var : str, default='wef_gci'
         Name of the column to be plotted on the y-axis.
+    density_threshold : int, optional
+        Number of complete observations above which the points are
+        aggregated into a 2-D histogram instead of drawn as markers,
+        which keeps large panels fast to render and readable. ``None``
+        always draws markers.
+    gridsize : int, default=DENSITY_GRIDSIZE
+        Number of histogram bins along each axis in density mode.
 
     Returns
     -------
@@ -33,13 +82,153 @@ def plot_eci_vs_gci(df, x_var='eci_sitc', y_var='wef_gci'):
     if x_var not in df.columns or y_var not in df.columns:
         return None
 
+    import matplotlib.pyplot as plt
+
     df_plot = df.dropna(subset=[x_var, y_var])
 
     if df_plot.empty:
         return None
 
-    plt.scatter(df_plot[x_var], df_plot[y_var])
+    _draw_points(plt.gca(), df_plot[x_var].to_numpy(), df_plot[y_var].to_numpy(), density_threshold, gridsize)
     plt.xlabel(x_var)
     plt.ylabel(y_var)
     plt.title("ECI vs GCI")
     plt.show()
+
+
+def _render_figure(job: tuple) -> list:
+    """Draw one scatter on an Agg canvas and save it in every format."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    x, y, x_var, y_var, year, paths, dpi, density_threshold, gridsize = job
+    fig = Figure(figsize=(6.4, 4.8), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    _draw_points(ax, x, y, density_threshold, gridsize)
+    ax.set_xlabel(x_var)
+    ax.set_ylabel(y_var)
+    ax.set_title(f"{y_var} vs {x_var}" + ("" if year is None else f" ({year})"))
+
+    for path in paths:
+        fig.savefig(path)
+    # The figure is never registered with pyplot, so clearing it is
+    # enough to release its artists once it has been written out
+    fig.clear()
+    return paths
+
+def _year_values(df: pd.DataFrame) -> np.ndarray:
+    if "year" in df.columns:
+        return df["year"].to_numpy()
+    return df.index.get_level_values("year").to_numpy()
+
+def render_plots(
+    df,
+    pairs: list,
+    output_dir: str,
+    years: tuple = None,
+    by_year: bool = False,
+    formats: tuple = ("png",),
+    dpi: int = 100,
+    max_workers: int = None,
+    density_threshold: int = DENSITY_THRESHOLD,
+    gridsize: int = DENSITY_GRIDSIZE,
+) -> pd.DataFrame:
+    """
+    Render a batch of scatterplots to image files without a display.
+
+    Each figure is drawn on its own object-oriented :class:`~matplotlib.figure.Figure`
+    with the Agg canvas, so no global pyplot state is touched and nothing
+    is shown. Figures are spread across a process pool, and only the two
+    columns each figure needs are sent to the workers.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or HarvardPanel
+        Input dataset. A ``year`` column or index level is required when
+        ``years`` or ``by_year`` is used.
+    pairs : list of tuple of str
+        ``(x_var, y_var)`` pairs to plot. Pairs with a missing column are
+        skipped with a warning printed to the console.
+    output_dir : str
+        Directory the files are written to. Created if missing.
+    years : tuple of int, optional
+        Inclusive ``(start, end)`` range of years to keep. Either bound
+        may be ``None``.
+    by_year : bool, default=False
+        Whether to draw one figure per year instead of one per pair.
+    formats : tuple of str, default=("png",)
+        Output formats, for example ``("png", "svg")``.
+    dpi : int, default=100
+        Resolution of raster outputs.
+    max_workers : int, optional
+        Number of worker processes. Values below 2 render serially in the
+        calling process; ``None`` uses one per CPU.
+    density_threshold : int, optional
+        Number of observations above which a figure is drawn as a 2-D
+        histogram instead of a scatter. ``None`` always draws markers.
+    gridsize : int, default=DENSITY_GRIDSIZE
+        Number of histogram bins along each axis in density mode.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Manifest of the files written, with ``x_var``, ``y_var``,
+        ``year``, ``format``, ``path`` and ``n_obs`` columns. Figures with
+        no complete observations are not written.
+    """
+    if isinstance(df, HarvardPanel):
+        start, end = years if years is not None else (None, None)
+        df = df.select(start=start, end=end)
+    elif years is not None:
+        start, end = years
+        year_values = _year_values(df)
+        keep = np.ones(len(df), dtype=bool)
+        if start is not None:
+            keep &= year_values >= start
+        if end is not None:
+            keep &= year_values <= end
+        df = df[keep]
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    year_values = _year_values(df) if by_year else None
+    jobs = []
+    rows = []
+    for x_var, y_var in pairs:
+        missing_vars = {x_var, y_var} - set(df.columns)
+        if missing_vars:
+            print("Warning: Missing columns:", missing_vars)
+            continue
+
+        values = df[[x_var, y_var]].to_numpy(dtype="float64", na_value=np.nan)
+        complete = ~np.isnan(values).any(axis=1)
+        if by_year:
+            groups = [(year, complete & (year_values == year)) for year in pd.unique(year_values)]
+        else:
+            groups = [(None, complete)]
+
+        for year, mask in groups:
+            n_obs = int(mask.sum())
+            if not n_obs:
+                continue
+            stem = f"{y_var}_vs_{x_var}" + ("" if year is None else f"_{year}")
+            paths = [str(output_dir / f"{stem}.{fmt}") for fmt in formats]
+            jobs.append((
+                values[mask, 0], values[mask, 1], x_var, y_var, year, paths,
+                dpi, density_threshold, gridsize,
+            ))
+            rows.extend((x_var, y_var, year, fmt, path, n_obs) for fmt, path in zip(formats, paths))
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers < 2 or len(jobs) < 2:
+        for job in jobs:
+            _render_figure(job)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Several figures per task keep the pickling overhead small
+            chunksize = max(1, len(jobs) // (4 * workers))
+            list(pool.map(_render_figure, jobs, chunksize=chunksize))
+
+    return pd.DataFrame(rows, columns=MANIFEST_COLUMNS)
@@ -1,7 +1,29 @@
+import warnings
+
 import pandas as pd
 import pytest
 
-from econ_analysis_gbm2118.analysis import summary_statistics, extreme_rank_countries
+import numpy as np
+
+from econ_analysis_gbm2118.analysis import (
+    summary_statistics,
+    extreme_rank_countries,
+    rank_divergences,
+    bootstrap_summary_statistics,
+    correlation_matrix,
+)
+from econ_analysis_gbm2118.data import HarvardPanel
+
+
+@pytest.fixture
+def panel():
+    return HarvardPanel(pd.DataFrame({
+        "country_iso3_code": ["A", "B", "C", "A", "B", "C"],
+        "year": [2023, 2023, 2023, 2022, 2022, 2022],
+        "cname": ["A", "B", "C", "A", "B", "C"],
+        "rank1": [1, 2, 3, 3, 2, 1],
+        "score2": [10, 20, 30, 10, 20, 30],
+    }))
 
 
 def test_summary_statistics_basic():
@@ -57,6 +79,20 @@ def test_extreme_rank_countries_basic():
     assert result["rank_difference"].iloc[0] >= result["rank_difference"].iloc[1]
 
 
+def test_extreme_rank_countries_does_not_modify_input():
+    df = pd.DataFrame({
+        "country": ["A", "B", "C"],
+        "rank1": [1, 2, 3],
+        "score2": [10, 20, 30]
+    })
+    original = df.copy()
+
+    result = extreme_rank_countries(df, "rank1", "score2", top_n=1, label="country")
+
+    pd.testing.assert_frame_equal(df, original)
+    assert result["country"].tolist() == ["C"]
+
+
 def test_extreme_rank_countries_missing_rank_col2():
     df = pd.DataFrame({
         "cname": ["A", "B"],
@@ -80,3 +116,172 @@ def test_extreme_rank_countries_top_n_limit():
     # top_n smaller
     result2 = extreme_rank_countries(df, "rank1", "score2", top_n=3)
     assert len(result2) == 3
+
+
+def test_summary_statistics_panel_per_year(panel):
+    result = summary_statistics(panel, ["rank1", "score2"])
+
+    # One row per (year, variable)
+    assert list(result.index) == [
+        (2022, "rank1"), (2022, "score2"), (2023, "rank1"), (2023, "score2"),
+    ]
+    assert result.loc[(2023, "rank1"), "mean"] == 2
+    assert result.loc[(2022, "rank1"), "count"] == 3
+
+
+def test_extreme_rank_countries_keeps_missing_differences_last():
+    df = pd.DataFrame({
+        "cname": ["A", "B", "C", "D"],
+        "rank1": [1, np.nan, 3, np.nan],
+        "score2": [1, 2, 3, 4],
+    })
+
+    result = extreme_rank_countries(df, "rank1", "score2", top_n=3)
+    expected = df.assign(rank_col2_calc=df["score2"].rank(ascending=False))
+    expected["rank_difference"] = expected["rank1"] - expected["rank_col2_calc"]
+    expected = expected.drop(columns="score2").sort_values("rank_difference", ascending=False).head(3)
+
+    assert result["cname"].tolist() == ["C", "A", "B"]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_extreme_rank_countries_panel_per_year(panel):
+    result = extreme_rank_countries(panel, "rank1", "score2", top_n=1)
+
+    # Ranks are computed within each year and the top country kept per year
+    assert result["year"].tolist() == [2022, 2023]
+    assert result["cname"].tolist() == ["A", "C"]
+    assert result["rank_difference"].tolist() == [0, 2]
+    assert "rank_col2_calc" not in panel.frame.columns
+
+
+def test_rank_divergences_all_pairs():
+    df = pd.DataFrame({
+        "cname": ["A", "B", "C", "D", "E"],
+        "eci_rank": [1, 2, 3, 4, 5],
+        "eci": [2.0, 1.0, 0.0, -1.0, -2.0],
+        "gov": [1.0, 5.0, np.nan, 2.0, 4.0],
+    })
+    original = df.copy()
+
+    result = rank_divergences(df, ["eci_rank", "eci", "gov"], top_n=2, ascending=["eci_rank"])
+
+    pd.testing.assert_frame_equal(df, original)
+    # Every ordered pair of the three indicators appears
+    pairs = set(zip(result["indicator_1"], result["indicator_2"]))
+    assert len(pairs) == 6
+    assert list(result.columns) == ["indicator_1", "indicator_2", "cname", "rank_1", "rank_2", "rank_difference"]
+
+    # eci and eci_rank agree exactly, so their divergences are zero
+    same = result[(result["indicator_1"] == "eci") & (result["indicator_2"] == "eci_rank")]
+    assert (same["rank_difference"] == 0).all()
+
+    # Largest divergence first within each pair, ties to the earlier row;
+    # missing values are skipped
+    gov = result[(result["indicator_1"] == "eci") & (result["indicator_2"] == "gov")]
+    assert gov["cname"].tolist() == ["E", "B"]
+    assert gov["rank_difference"].tolist() == [3.0, 1.0]
+    assert "C" not in result.loc[result["indicator_2"] == "gov", "cname"].tolist()
+
+
+def test_rank_divergences_matches_extreme_rank_countries():
+    df = pd.DataFrame({
+        "cname": ["A", "B", "C", "D", "E"],
+        "rank1": [5, 4, 3, 2, 1],
+        "score2": [1, 2, 3, 4, 5]
+    })
+
+    pair = rank_divergences(df, ["rank1", "score2"], top_n=3, ascending=["rank1"])
+    pair = pair[pair["indicator_1"] == "rank1"]
+    extremes = extreme_rank_countries(df, "rank1", "score2", top_n=3)
+
+    assert pair["cname"].tolist() == extremes["cname"].tolist()
+    assert pair["rank_difference"].tolist() == extremes["rank_difference"].tolist()
+
+
+def test_rank_divergences_missing_column():
+    df = pd.DataFrame({"cname": ["A"], "a": [1.0]})
+    with pytest.raises(ValueError):
+        rank_divergences(df, ["a", "b"])
+
+
+def test_bootstrap_summary_statistics_intervals():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.normal(10, 1, size=150),
+        "b": np.where(rng.random(150) < 0.2, np.nan, rng.normal(size=150)),
+    })
+
+    result = bootstrap_summary_statistics(df, ["a", "b"], n_boot=500, seed=1, block_size=200)
+
+    assert list(result.index) == [
+        (var, stat) for var in ["a", "b"] for stat in ["mean", "median", "25%", "75%"]
+    ]
+    # Point estimates match pandas and sit inside their intervals
+    assert result.loc[("a", "mean"), "estimate"] == pytest.approx(df["a"].mean())
+    assert result.loc[("b", "median"), "estimate"] == pytest.approx(df["b"].median())
+    assert result.loc[("b", "25%"), "estimate"] == pytest.approx(df["b"].quantile(0.25))
+    assert (result["ci_lower"] <= result["estimate"]).all()
+    assert (result["estimate"] <= result["ci_upper"]).all()
+
+
+def test_bootstrap_summary_statistics_deterministic_across_workers():
+    df = pd.DataFrame({"a": np.arange(50.0), "b": np.arange(50.0) ** 2})
+
+    serial = bootstrap_summary_statistics(df, ["a", "b"], n_boot=300, seed=7, block_size=100)
+    pooled = bootstrap_summary_statistics(df, ["a", "b"], n_boot=300, seed=7, block_size=100, n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_bootstrap_summary_statistics_rejects_unknown_statistic():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        bootstrap_summary_statistics(df, ["a"], statistics=("mode",))
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_correlation_matrix_matches_pandas_pairwise(method):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 5)), columns=list("abcde"))
+    df["b"] = 2 * df["a"] + rng.normal(size=200)
+    df["c"] = rng.integers(0, 5, size=200).astype(float)
+    df = df.mask(rng.random(df.shape) < 0.2)
+    df["const"] = 1.0
+
+    corr, counts = correlation_matrix(df, method=method)
+
+    pd.testing.assert_frame_equal(corr, df.corr(method=method), atol=1e-12)
+    expected_counts = df.notna().astype("int64").T @ df.notna().astype("int64")
+    pd.testing.assert_frame_equal(counts, expected_counts, check_names=False)
+
+
+def test_correlation_matrix_min_periods():
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0],
+        "b": [2.0, 4.0, np.nan, np.nan],
+    })
+    corr, counts = correlation_matrix(df, ["a", "b"], min_periods=3)
+
+    assert counts.loc["a", "b"] == 2
+    assert np.isnan(corr.loc["a", "b"])
+    assert corr.loc["a", "a"] == pytest.approx(1.0)
+
+
+def test_correlation_matrix_spearman_without_overlap():
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, np.nan, np.nan],
+        "b": [np.nan, np.nan, 3.0, 4.0],
+    })
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        corr, counts = correlation_matrix(df, method="spearman")
+
+    assert counts.loc["a", "b"] == 0
+    assert np.isnan(corr.loc["a", "b"])
+
+
+def test_correlation_matrix_rejects_unknown_method():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        correlation_matrix(df, method="kendall")
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+import matplotlib
+matplotlib.use("Agg")  # Prevent GUI windows from opening during tests
+
+from econ_analysis_gbm2118.backends import ArrowBackend, Backend, PandasBackend, get_backend
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST, run_pipeline
+
+SAMPLE_CSV = Path(__file__).parent / "growth_proj_eci_rankings.csv"
+
+
+@pytest.fixture
+def qog_file(tmp_path):
+    path = tmp_path / "qog.xlsx"
+    pd.DataFrame({
+        "ccodealp": ["AFG", "ALB", "DZA", "AGO", "XXX", None],
+        "cname": ["Afghanistan", "Albania (the)", "Algeria", None, "Nowhere", "Unknown"],
+        "bti_ep": [3.5, 7.0, 5.25, 4.0, 1.0, 2.0],
+        "wef_gci": [3.1, 4.2, 3.9, 3.3, 2.0, 1.0],
+        "mad_gdppc": [1800, 11000, 12500, 7000, 100, 200],
+    }).to_excel(path, index=False)
+    return str(path)
+
+
+def _run_stages(backend, harvard_csv, qog_file, year):
+    engine = get_backend(backend)
+    merged = engine.merge(engine.load_harvard(harvard_csv, year=year), engine.load_qog(qog_file))
+    merged = engine.clean_names(engine.fill_and_clip(merged))
+    return (
+        engine.to_pandas(merged),
+        engine.summary_statistics(merged, VARS_OF_INTEREST),
+        engine.extreme_rank_countries(merged, "eci_rank_sitc", "bti_ep", top_n=10),
+    )
+
+
+@pytest.mark.parametrize("year", [2023, None])
+def test_arrow_backend_matches_pandas(qog_file, year):
+    expected = _run_stages("pandas", str(SAMPLE_CSV), qog_file, year)
+    result = _run_stages("arrow", str(SAMPLE_CSV), qog_file, year)
+
+    for exp, res in zip(expected, result):
+        pd.testing.assert_frame_equal(res, exp)
+
+
+def test_arrow_backend_loads_like_pandas(qog_file):
+    pandas, arrow = PandasBackend(), ArrowBackend()
+
+    harvard = arrow.load_harvard(str(SAMPLE_CSV), year=None)
+    assert isinstance(harvard, pa.Table)
+    pd.testing.assert_frame_equal(arrow.to_pandas(harvard), pandas.load_harvard(str(SAMPLE_CSV), year=None))
+
+    with pytest.raises(ValueError, match="Duplicate ISO3"):
+        qog = arrow.load_qog(qog_file)
+        arrow.merge(harvard, pa.concat_tables([qog, qog]))
+
+
+def test_run_pipeline_arrow_backend(tmp_path, qog_file):
+    merged, summary, extremes = run_pipeline(str(SAMPLE_CSV), qog_file, string_dtype=None)
+    result = run_pipeline(str(SAMPLE_CSV), qog_file, backend="arrow", cache_dir=str(tmp_path / "cache"))
+
+    assert isinstance(result[0], pa.Table)
+    pd.testing.assert_frame_equal(get_backend("arrow").to_pandas(result[0]), merged)
+    pd.testing.assert_frame_equal(result[1], summary)
+    pd.testing.assert_frame_equal(result[2], extremes)
+
+    # Summary and extremes come back from the stage cache on a rerun
+    cached = run_pipeline(str(SAMPLE_CSV), qog_file, backend="arrow", cache_dir=str(tmp_path / "cache"))
+    pd.testing.assert_frame_equal(cached[1], summary)
+
+
+def test_get_backend_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_backend("spark")
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class LoadOnlyBackend(Backend):
+        name = "load-only"
+
+        def load_harvard(self, file_path, cache_dir=None, year=2023):
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        LoadOnlyBackend()
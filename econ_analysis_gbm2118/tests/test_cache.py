@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.cache import StageCache, frame_digest
+
+
+def test_stage_cache_round_trip(tmp_path):
+    cache = StageCache(tmp_path)
+    df = pd.DataFrame({
+        "cname": pd.Categorical(["France", "Chad"]),
+        "value": [1.5, np.nan],
+    }, index=[3, 7])
+    key = cache.key("summary", ["abc"], columns=["value"])
+
+    assert cache.get(key) is None
+    cache.put(key, df)
+    pd.testing.assert_frame_equal(cache.get(key), df)
+
+
+def test_stage_cache_key_depends_on_inputs_and_params(tmp_path):
+    cache = StageCache(tmp_path)
+    base = cache.key("extremes", ["abc"], rank_col1="a")
+
+    assert cache.key("extremes", ["abc"], rank_col1="a") == base
+    assert cache.key("extremes", ["abd"], rank_col1="a") != base
+    assert cache.key("extremes", ["abc"], rank_col1="b") != base
+    assert cache.key("summary", ["abc"], rank_col1="a") != base
+
+
+def test_stage_cache_evicts_least_recently_used(tmp_path):
+    df = pd.DataFrame({"value": np.arange(1000.0)})
+    cache = StageCache(tmp_path)
+    cache.put("first", df)
+    entry_size = (tmp_path / "first.parquet").stat().st_size
+    cache.put("second", df)
+    # Make "first" the most recently used entry
+    os.utime(tmp_path / "second.parquet", ns=(0, 0))
+    cache.get("first")
+
+    cache.max_bytes = int(2.5 * entry_size)
+    cache.put("third", df)
+
+    assert sorted(p.stem for p in tmp_path.glob("*.parquet")) == ["first", "third"]
+
+    cache.clear()
+    assert not list(tmp_path.glob("*.parquet"))
+
+
+def test_frame_digest_tracks_content():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+
+    assert frame_digest(df) == frame_digest(df.copy())
+    assert frame_digest(df) != frame_digest(df.assign(a=[1.0, 3.0]))
+    assert frame_digest(df) != frame_digest(df.rename(columns={"a": "b"}))
@@ -7,6 +7,9 @@ from econ_analysis_gbm2118.cleaning import (
     fill_and_clip_numeric,
     clean_country_names,
     clean_merged_data,
+    NumericImputer,
+    index_qog,
+    optimize_dtypes,
 )
 
 
@@ -36,6 +39,38 @@ def test_merge_datasets_left_join_and_drop_columns():
     assert pd.isna(merged.loc[merged["country_iso3_code"] == "FRA", "qog_score"]).iloc[0]
 
 
+def test_merge_datasets_prefers_qog_columns():
+    df_harvard = pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "USA"],
+        "bti_ep": [1.0, 2.0, 3.0],
+        "cname": ["a", "b", "c"],
+    })
+
+    df_qog = pd.DataFrame({
+        "ccodealp": ["FRA", "USA"],
+        "bti_ep": [7.5, 8.5],
+        "cname": ["France", "United States"],
+    })
+
+    merged = merge_datasets(df_harvard, df_qog)
+
+    # Preferred column keeps its position and takes the QoG values
+    assert list(merged.columns) == ["country_iso3_code", "bti_ep", "cname", "cname_qog"]
+    assert merged["bti_ep"].tolist() == [8.5, 7.5, 8.5]
+    assert merged["cname_qog"].tolist() == ["United States", "France", "United States"]
+
+    # A prebuilt index gives the same result
+    pd.testing.assert_frame_equal(merge_datasets(df_harvard, index_qog(df_qog)), merged)
+
+
+def test_merge_datasets_rejects_duplicate_qog_codes():
+    df_harvard = pd.DataFrame({"country_iso3_code": ["USA"]})
+    df_qog = pd.DataFrame({"ccodealp": ["USA", "USA"], "qog_score": [1.0, 2.0]})
+
+    with pytest.raises(ValueError, match="USA"):
+        merge_datasets(df_harvard, df_qog)
+
+
 def test_fill_and_clip_numeric_fills_nan_with_median():
     df = pd.DataFrame({
         "a": [1.0, 2.0, np.nan],
@@ -67,6 +102,59 @@ def test_fill_and_clip_numeric_clips_outliers():
     assert cleaned["x"].min() >= lower
 
 
+def test_numeric_imputer_reuses_fitted_bounds():
+    train = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, np.nan, 100.0],
+        "c": ["x", "y", "z", "w", "v"],
+    })
+    imputer = NumericImputer().fit(train)
+
+    assert imputer.medians["a"] == 2.5
+    assert list(imputer.lower.index) == ["a"]
+
+    # A later batch is filled and clipped with the training bounds
+    batch = pd.DataFrame({"a": [np.nan, -50.0, 500.0]})
+    result = imputer.transform(batch.copy())
+    assert result["a"].tolist() == [2.5, imputer.lower["a"], imputer.upper["a"]]
+
+
+def test_numeric_imputer_matches_fill_and_clip_numeric():
+    df = pd.DataFrame({
+        "a": [1.0, np.nan, 3.0, 4.0, 50.0],
+        "b": [10, 20, 30, 40, 1000],
+        "c": ["x", "y", "z", "w", "v"],
+    })
+
+    expected = df.copy()
+    for col in ["a", "b"]:
+        expected[col] = expected[col].fillna(expected[col].median())
+        expected[col] = expected[col].clip(
+            lower=expected[col].quantile(0.01), upper=expected[col].quantile(0.99)
+        )
+
+    pd.testing.assert_frame_equal(fill_and_clip_numeric(df.copy()), expected)
+    pd.testing.assert_frame_equal(NumericImputer().fit_transform(df.copy()), expected)
+
+
+def test_numeric_imputer_fit_chunks_matches_fit():
+    df = pd.DataFrame({
+        "a": [1.0, np.nan, 3.0, 4.0, 50.0, np.nan, -7.0],
+        "b": [10, 20, 30, 40, 1000, 5, 15],
+        "c": ["x", "y", "z", "w", "v", "u", "t"],
+    })
+
+    expected = NumericImputer().fit(df)
+    chunked = NumericImputer().fit_chunks([df.iloc[:3], df.iloc[3:]])
+
+    for attr in ["medians", "lower", "upper"]:
+        pd.testing.assert_series_equal(getattr(chunked, attr), getattr(expected, attr))
+
+
+def test_numeric_imputer_transform_requires_fit():
+    with pytest.raises(ValueError):
+        NumericImputer().transform(pd.DataFrame({"a": [1.0]}))
+
+
 def test_clean_country_names_removes_the_suffix():
     df = pd.DataFrame({
         "cname": ["Bahamas (the)", "Netherlands (the)", "France"],
@@ -77,6 +165,34 @@ def test_clean_country_names_removes_the_suffix():
     assert cleaned["cname"].tolist() == ["Bahamas", "Netherlands", "France"]
 
 
+def test_clean_country_names_categorical_output():
+    df = pd.DataFrame({
+        "cname": ["Bahamas (the)", "Bahamas", None, "Bahamas (the)"],
+    })
+
+    cleaned = clean_country_names(df.copy())
+
+    # Names are cleaned per category and stay categorical
+    assert isinstance(cleaned["cname"].dtype, pd.CategoricalDtype)
+    assert cleaned["cname"].tolist() == ["Bahamas", "Bahamas", "", "Bahamas"]
+    assert list(cleaned["cname"].cat.categories) == ["Bahamas", ""]
+
+
+def test_clean_country_names_extra_rules():
+    df = pd.DataFrame({
+        "cname": ["Türkiye", "Korea (the Republic of)", "Côte d'Ivoire"],
+    })
+
+    cleaned = clean_country_names(
+        df.copy(),
+        rules=[(r"\s*\(the\)$", ""), (r"\s*\(the Republic of\)$", "")],
+        aliases={"Turkiye": "Turkey", "Korea": "South Korea"},
+        strip_diacritics=True,
+    )
+
+    assert cleaned["cname"].tolist() == ["Turkey", "South Korea", "Cote d'Ivoire"]
+
+
 def test_clean_country_names_handles_missing_column():
     df = pd.DataFrame({
         "country": ["USA", "FRA"]
@@ -112,3 +228,50 @@ def test_clean_merged_data_full_pipeline():
 
     # Country names cleaned
     assert cleaned.loc[cleaned["country_iso3_code"] == "USA", "cname"].iloc[0] == "United States"
+
+
+def test_optimize_dtypes_shrinks_without_changing_values():
+    df = pd.DataFrame({
+        "country_id": pd.array([840, 250, 840, None], dtype="Int32"),
+        "country_iso3_code": ["USA", "FRA", "USA", "FRA"],
+        "cname": pd.Categorical(["United States", "France", "United States", "France"]),
+        "year": np.array([2022, 2022, 2023, 2023], dtype="int64"),
+        "eci_rank_sitc": [1.0, 2.0, 2.0, 1.0],
+        "eci_rank_hs92": [1.0, np.nan, 2.0, 1.5],
+        "eci_sitc": [0.1, 0.2, 0.3, 0.4],
+        "in_rankings": pd.array([True, False, True, None], dtype="boolean"),
+    })
+
+    optimized, report = optimize_dtypes(df)
+
+    assert optimized.dtypes.astype(str).to_dict() == {
+        "country_id": "Int16",
+        "country_iso3_code": "category",
+        "cname": "category",
+        "year": "int16",
+        "eci_rank_sitc": "int8",
+        "eci_rank_hs92": "float32",
+        "eci_sitc": "float64",
+        "in_rankings": "boolean",
+    }
+    pd.testing.assert_frame_equal(optimized, df, check_dtype=False, check_categorical=False)
+    assert report.loc["year", "dtype_before"] == "int64"
+    assert (report["bytes_after"] <= report["bytes_before"]).all()
+    assert report["bytes_after"].sum() < report["bytes_before"].sum()
+    # The input is left unchanged
+    assert df["year"].dtype == "int64"
+
+
+def test_optimize_dtypes_float32_tolerance():
+    df = pd.DataFrame({"wef_gci": [4.18, 3.6, 5.25]})
+
+    assert optimize_dtypes(df)[0]["wef_gci"].dtype == "float64"
+    assert optimize_dtypes(df, rtol=1e-6)[0]["wef_gci"].dtype == "float32"
+
+
+def test_optimize_dtypes_keeps_unique_codes_as_strings():
+    df = pd.DataFrame({"country_iso3_code": pd.array(["USA", "FRA", "DEU"], dtype="string[pyarrow]")})
+
+    optimized, _ = optimize_dtypes(df)
+
+    assert optimized["country_iso3_code"].dtype == "string[pyarrow]"
@@ -2,7 +2,15 @@ import pandas as pd
 from pathlib import Path
 import pytest
 
-from econ_analysis_gbm2118.data import load_harvard_data, load_qog_data
+from econ_analysis_gbm2118.data import (
+    ARROW_STRING_DTYPE,
+    load_harvard_data,
+    load_qog_data,
+    iter_harvard_chunks,
+    load_harvard_panel,
+)
+
+SAMPLE_CSV = Path(__file__).parent / "growth_proj_eci_rankings.csv"
 
 
 def test_load_harvard_data_filters_2023(tmp_path):
@@ -51,3 +59,150 @@ def test_load_qog_data_from_excel(tmp_path):
     result = load_qog_data(file_path)
 
     pd.testing.assert_frame_equal(result, df)
+
+
+def test_load_harvard_data_cache_round_trip(tmp_path):
+    """Warm loads from the cache should match a plain CSV load."""
+    df = pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "DEU"],
+        "year": [2022, 2023, 2023],
+        "eci_sitc": [1.5, None, 0.3]
+    })
+
+    file_path = tmp_path / "growth_proj_eci_rankings.csv"
+    df.to_csv(file_path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    cold = load_harvard_data(file_path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    warm = load_harvard_data(file_path, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(warm, load_harvard_data(file_path))
+    pd.testing.assert_frame_equal(warm, cold)
+
+
+def test_load_harvard_data_missing_country_id(tmp_path):
+    """A row without a country ID should load on every read path."""
+    file_path = tmp_path / "growth_proj_eci_rankings.csv"
+    pd.DataFrame({
+        "country_id": [840, None, 276],
+        "country_iso3_code": ["USA", "FRA", "DEU"],
+        "year": [2023, 2023, 2023],
+    }).to_csv(file_path, index=False)
+
+    full = load_harvard_data(file_path)
+    chunked = load_harvard_data(file_path, chunksize=2)
+
+    assert full["country_id"].dtype == "Int32"
+    assert full["country_id"].isna().tolist() == [False, True, False]
+    pd.testing.assert_frame_equal(chunked, full)
+
+
+def test_load_harvard_data_cache_rebuilds_on_change(tmp_path):
+    """Changing the source file should invalidate the cached copy."""
+    file_path = tmp_path / "growth_proj_eci_rankings.csv"
+    pd.DataFrame({"year": [2023], "value": [1]}).to_csv(file_path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    load_harvard_data(file_path, cache_dir=cache_dir)
+    pd.DataFrame({"year": [2023, 2023], "value": [1, 2]}).to_csv(file_path, index=False)
+    result = load_harvard_data(file_path, cache_dir=cache_dir)
+
+    assert result["value"].tolist() == [1, 2]
+    # The stale entry is replaced rather than left behind
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+
+def test_load_harvard_data_chunked_matches_full_read():
+    """Streaming in small chunks should give the same result as a full read."""
+    full = load_harvard_data(SAMPLE_CSV)
+    chunked = load_harvard_data(SAMPLE_CSV, chunksize=250)
+
+    pd.testing.assert_frame_equal(chunked, full)
+    assert (chunked["year"] == 2023).all()
+
+
+def test_load_harvard_data_arrow_strings(tmp_path):
+    """Text columns should be Arrow-backed on every read path, values unchanged."""
+    plain = load_harvard_data(SAMPLE_CSV)
+    cold = load_harvard_data(SAMPLE_CSV, cache_dir=tmp_path, string_dtype=ARROW_STRING_DTYPE)
+    warm = load_harvard_data(SAMPLE_CSV, cache_dir=tmp_path, string_dtype=ARROW_STRING_DTYPE)
+    chunked = load_harvard_data(SAMPLE_CSV, chunksize=250, string_dtype=ARROW_STRING_DTYPE)
+
+    for df in [cold, warm, chunked]:
+        assert df["country_iso3_code"].dtype == ARROW_STRING_DTYPE
+        pd.testing.assert_frame_equal(df.astype({"country_iso3_code": object}), plain)
+    assert (
+        warm["country_iso3_code"].memory_usage(deep=True)
+        < plain["country_iso3_code"].memory_usage(deep=True)
+    )
+
+
+def test_iter_harvard_chunks_applies_filters_per_chunk():
+    """Year, ISO3 and column selections should be applied to every chunk."""
+    chunks = list(iter_harvard_chunks(
+        SAMPLE_CSV,
+        chunksize=500,
+        year=2020,
+        iso3=["USA", "FRA"],
+        columns=["country_iso3_code", "eci_sitc"],
+    ))
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    result = pd.concat(chunks)
+    assert sorted(result["country_iso3_code"]) == ["FRA", "USA"]
+    assert list(result.columns) == ["country_iso3_code", "eci_sitc"]
+
+
+def test_load_qog_data_column_projection(tmp_path):
+    """Only requested columns that exist in the workbook should be returned."""
+    df = pd.DataFrame({
+        "ccodealp": ["USA", "FRA"],
+        "bti_ep": [7.5, 8.25],
+        "unused": [0, 1]
+    })
+
+    file_path = tmp_path / "qog.xlsx"
+    df.to_excel(file_path, index=False)
+
+    result = load_qog_data(str(file_path), columns=["ccodealp", "bti_ep", "wef_gci"])
+
+    assert list(result.columns) == ["ccodealp", "bti_ep"]
+
+
+def test_load_qog_data_cache_serves_projected_columns(tmp_path):
+    """The workbook is converted once and later loads read from the cache."""
+    df = pd.DataFrame({
+        "ccodealp": ["USA", "FRA"],
+        "bti_ep": [7.5, 8.25],
+        "unused": [0, 1]
+    })
+
+    file_path = tmp_path / "qog.xlsx"
+    df.to_excel(file_path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    full = load_qog_data(str(file_path), cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(full, df)
+
+    projected = load_qog_data(str(file_path), columns=["ccodealp", "bti_ep"], cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(projected, df[["ccodealp", "bti_ep"]])
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+
+def test_load_harvard_panel_selects_years_without_reparsing():
+    """The panel holds every year and serves single years and ranges."""
+    panel = load_harvard_panel(SAMPLE_CSV)
+    full = pd.read_csv(SAMPLE_CSV)
+
+    assert len(panel) == len(full)
+    assert panel.years == sorted(full["year"].unique().tolist())
+    assert list(panel.frame.index.names) == ["country_iso3_code", "year"]
+
+    one_year = panel.select(2023)
+    assert len(one_year) == (full["year"] == 2023).sum()
+    assert set(one_year.index.get_level_values("year")) == {2023}
+
+    span = panel.select(start=2020, end=2022)
+    assert set(span.index.get_level_values("year")) == {2020, 2021, 2022}
+    assert len(panel.select()) == len(full)
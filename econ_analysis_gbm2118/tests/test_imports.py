@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(*args):
+    """Top-level modules imported by a fresh interpreter, via ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    names = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            names.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return names
+
+
+def test_cli_help_does_not_import_heavy_dependencies():
+    modules = imported_modules("-m", "econ_analysis_gbm2118", "--help")
+
+    assert "econ_analysis_gbm2118" in modules
+    assert not modules & {"pandas", "numpy", "matplotlib", "pyarrow", "importlib_metadata"}
+
+
+@pytest.mark.parametrize("module", ["econ_analysis_gbm2118", "econ_analysis_gbm2118.pipeline"])
+def test_package_import_skips_plotting_libraries(module):
+    modules = imported_modules("-c", f"import {module}")
+
+    assert not modules & {"matplotlib", "seaborn"}
+
+
+def test_package_version_is_resolved_lazily():
+    import econ_analysis_gbm2118
+
+    assert isinstance(econ_analysis_gbm2118.__version__, str)
+    with pytest.raises(AttributeError):
+        econ_analysis_gbm2118.missing_attribute
@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from econ_analysis_gbm2118.outputs import write_frame, write_outputs
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "country_iso3_code": [f"C{i:02d}" for i in range(25)],
+        "cname": pd.Categorical(["France", "Chad", "Peru", "Chile", "Oman"] * 5),
+        "eci_sitc": np.linspace(-1, 1, 25),
+    })
+
+
+def test_write_frame_parquet_in_row_groups(frame, tmp_path):
+    path = tmp_path / "merged.parquet"
+    write_frame(frame, path, row_group_size=10)
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(path), frame)
+
+
+def test_write_frame_parquet_column_empty_in_first_row_group(tmp_path):
+    # Countries without a QoG match come first, so the first row group
+    # of this column holds only missing values
+    frame = pd.DataFrame({
+        "country_iso3_code": [f"C{i:02d}" for i in range(10)],
+        "cname": [None] * 5 + ["France", "Chad", "Peru", "Chile", "Oman"],
+    })
+    path = tmp_path / "merged.parquet"
+    write_frame(frame, path, row_group_size=5)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(path), frame)
+
+
+def test_write_frame_removes_partial_file_on_failure(tmp_path):
+    class Unwritable:
+        def __str__(self):
+            raise RuntimeError("cannot format value")
+
+    # The first chunk is written before the second one fails
+    frame = pd.DataFrame({"value": ["ok", Unwritable()]})
+    with pytest.raises(RuntimeError):
+        write_frame(frame, tmp_path / "merged.csv", format="csv", row_group_size=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_frame_csv_in_chunks(frame, tmp_path):
+    path = tmp_path / "merged.csv"
+    write_frame(frame, path, format="csv", row_group_size=10)
+
+    result = pd.read_csv(path)
+    assert len(result) == 25
+    assert result["country_iso3_code"].tolist() == frame["country_iso3_code"].tolist()
+
+
+def test_write_frame_rejects_unknown_format(frame, tmp_path):
+    with pytest.raises(ValueError):
+        write_frame(frame, tmp_path / "merged.xlsx", format="xlsx")
+
+
+def test_write_outputs_manifest(frame, tmp_path):
+    summary = frame.describe().T
+    manifest = write_outputs(tmp_path, {"merged": frame, "summary": summary}, timings={"pipeline": 1.5})
+
+    on_disk = json.loads((tmp_path / "manifest.json").read_text())
+    assert on_disk == manifest
+    assert manifest["timings"] == {"pipeline": 1.5}
+
+    files = {f["name"]: f for f in manifest["files"]}
+    assert files["merged"]["rows"] == 25
+    assert files["summary"]["rows"] == len(summary)
+    digest = hashlib.sha256((tmp_path / "merged.parquet").read_bytes()).hexdigest()
+    assert files["merged"]["sha256"] == digest
+    # The summary's variable index is kept
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "summary.parquet"), summary)
@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from econ_analysis_gbm2118.analysis import summary_statistics
+from econ_analysis_gbm2118.cleaning import clean_merged_data
+from econ_analysis_gbm2118.data import load_harvard_data, load_qog_data
+from econ_analysis_gbm2118.partitioned import partition_harvard, run_partitioned
+from econ_analysis_gbm2118.pipeline import VARS_OF_INTEREST
+from econ_analysis_gbm2118.synthetic import write_synthetic_sources
+
+
+@pytest.fixture
+def sources(tmp_path):
+    harvard_csv, qog_xlsx = write_synthetic_sources(tmp_path / "src", countries=12, years=6, seed=0)
+    return str(harvard_csv), str(qog_xlsx)
+
+
+def test_partition_harvard_splits_by_year_and_country_block(sources, tmp_path):
+    harvard_csv, _ = sources
+    full = load_harvard_data(harvard_csv, year=None)
+
+    by_year = partition_harvard(harvard_csv, tmp_path / "year", by="year", chunksize=10)
+    assert list(by_year) == list(range(2018, 2024))
+    assert all(pd.read_parquet(p)["year"].eq(y).all() for y, p in by_year.items())
+
+    by_country = partition_harvard(harvard_csv, tmp_path / "country", by="country", country_blocks=3, chunksize=10)
+    parts = [pd.read_parquet(p) for p in by_country.values()]
+    assert sum(len(p) for p in parts) == len(full)
+    # Every country lands in exactly one block
+    codes = [set(p["country_iso3_code"]) for p in parts]
+    assert sum(len(c) for c in codes) == len(set().union(*codes)) == 12
+
+    with pytest.raises(ValueError):
+        partition_harvard(harvard_csv, tmp_path / "bad", by="product")
+
+
+def test_partition_harvard_types_columns_empty_in_first_chunk(tmp_path):
+    harvard_csv = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_id": [None, None, 3, 4],
+        "country_iso3_code": [None, None, "FRA", "DEU"],
+        "year": [2023] * 4,
+        "growth_proj": [1.0, 2.0, 3.0, 4.0],
+    }).to_csv(harvard_csv, index=False)
+
+    paths = partition_harvard(str(harvard_csv), tmp_path / "year", chunksize=2)
+
+    part = pd.read_parquet(paths[2023])
+    assert part["country_iso3_code"].tolist() == [None, None, "FRA", "DEU"]
+    assert str(part["country_id"].dtype) == "Int32"
+
+
+@pytest.mark.parametrize("by", ["year", "country"])
+def test_run_partitioned_matches_in_memory_cleaning(sources, tmp_path, by):
+    harvard_csv, qog_xlsx = sources
+    cleaned = clean_merged_data(load_harvard_data(harvard_csv, year=None), load_qog_data(qog_xlsx))
+
+    result = run_partitioned(
+        harvard_csv, qog_xlsx, by=by, chunksize=7, country_blocks=4, output_dir=tmp_path / "out"
+    )
+
+    pd.testing.assert_frame_equal(
+        result["summary"], summary_statistics(cleaned, VARS_OF_INTEREST), check_names=False
+    )
+    assert result["rows"] == len(cleaned)
+    assert set(result["partitions"].index.get_level_values("variable")) == set(result["summary"].index)
+
+    written = pd.concat(pd.read_parquet(p) for p in sorted((tmp_path / "out").iterdir()))
+    written = written.sort_values(["country_iso3_code", "year"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        written[["country_iso3_code", "year", "eci_sitc", "wef_gci"]],
+        cleaned[["country_iso3_code", "year", "eci_sitc", "wef_gci"]],
+    )
+
+
+def test_run_partitioned_warns_on_missing_variables(sources, capfd):
+    harvard_csv, qog_xlsx = sources
+
+    result = run_partitioned(harvard_csv, qog_xlsx, vars_of_interest=["eci_sitc", "nope"])
+
+    assert list(result["summary"].index) == ["eci_sitc"]
+    assert "Missing columns" in capfd.readouterr().out
@@ -1,10 +1,14 @@
+import json
+
 import pandas as pd
 import pytest
 from pathlib import Path
 import matplotlib
 matplotlib.use("Agg")  # Prevent GUI windows from opening during tests
 
-from econ_analysis_gbm2118.pipeline import run_pipeline
+from econ_analysis_gbm2118 import pipeline
+from econ_analysis_gbm2118.pipeline import run_pipeline, load_sources, clear_cache
+from econ_analysis_gbm2118.profiling import StageProfiler
 
 
 def test_pipeline_runs_end_to_end(tmp_path):
@@ -98,3 +102,176 @@ def test_pipeline_handles_missing_columns(tmp_path):
     assert "cname" in merged.columns
     # Check summary includes only existing columns
     assert "wef_gci" not in summary.index
+
+
+def test_load_sources_concurrent_matches_serial(tmp_path):
+    """
+    Thread, process and serial loading should return the same frames.
+    """
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA"],
+        "year": [2023, 2022],
+        "eci_sitc": [0.5, 0.7],
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({"ccodealp": ["USA"], "bti_ep": [7.5]}).to_excel(qog_file, index=False)
+
+    serial = load_sources(str(harvard_file), str(qog_file), max_workers=1)
+    for executor in ["thread", "process"]:
+        harvard, qog = load_sources(str(harvard_file), str(qog_file), executor=executor)
+        pd.testing.assert_frame_equal(harvard, serial[0])
+        pd.testing.assert_frame_equal(qog, serial[1])
+
+    with pytest.raises(ValueError):
+        load_sources(str(harvard_file), str(qog_file), executor="fiber")
+
+
+def test_run_pipeline_reuses_cached_stages(tmp_path, monkeypatch):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "DEU"],
+        "year": [2023, 2023, 2023],
+        "growth_proj": [1.1, 2.2, 3.3],
+        "eci_sitc": [0.5, 0.7, 0.9],
+        "eci_rank_sitc": [3, 2, 1],
+        "cname": ["United States (the)", "France", "Germany"],
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({
+        "ccodealp": ["USA", "FRA", "DEU"],
+        "bti_ep": [7.5, 8.25, 9.5],
+    }).to_excel(qog_file, index=False)
+
+    cache_dir = tmp_path / "cache"
+    first = run_pipeline(str(harvard_file), str(qog_file), cache_dir=str(cache_dir))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stage should have been served from the cache")
+
+    monkeypatch.setattr(pipeline, "load_sources", fail)
+    monkeypatch.setattr(pipeline, "summary_statistics", fail)
+    monkeypatch.setattr(pipeline, "extreme_rank_countries", fail)
+    second = run_pipeline(str(harvard_file), str(qog_file), cache_dir=str(cache_dir))
+
+    for expected, cached in zip(first, second):
+        pd.testing.assert_frame_equal(cached, expected)
+
+    # Clearing the cache forces every stage to run again
+    clear_cache(cache_dir)
+    with pytest.raises(AssertionError):
+        run_pipeline(str(harvard_file), str(qog_file), cache_dir=str(cache_dir))
+
+
+def test_clear_cache_keeps_unrelated_files(tmp_path):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA"],
+        "year": [2023, 2023],
+        "eci_sitc": [0.5, 0.7],
+        "eci_rank_sitc": [1, 2],
+        "cname": ["United States", "France"],
+    }).to_csv(harvard_file, index=False)
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({"ccodealp": ["USA", "FRA"], "bti_ep": [7.5, 8.25]}).to_excel(qog_file, index=False)
+
+    # A cache directory shared with the user's own data
+    cache_dir = tmp_path / "data"
+    (cache_dir / "stages").mkdir(parents=True)
+    user_files = [cache_dir / "survey.parquet", cache_dir / "stages" / "notes.parquet", cache_dir / "readme.txt"]
+    for path in user_files:
+        path.write_text("user data")
+
+    run_pipeline(str(harvard_file), str(qog_file), cache_dir=str(cache_dir))
+    assert len(list(cache_dir.rglob("*.parquet"))) > len(user_files)
+    clear_cache(cache_dir)
+
+    assert sorted(cache_dir.rglob("*.*")) == sorted(user_files)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_pipeline_profiles_every_stage(tmp_path, max_workers):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA"],
+        "year": [2023, 2023],
+        "eci_sitc": [0.5, 0.7],
+        "eci_rank_sitc": [1, 2],
+        "cname": ["United States (the)", "France"],
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({"ccodealp": ["USA", "FRA"], "bti_ep": [7.5, 8.25]}).to_excel(qog_file, index=False)
+
+    stages = []
+    profiler = StageProfiler(callbacks=[lambda record: stages.append(record["stage"])])
+    merged, _, _ = run_pipeline(str(harvard_file), str(qog_file), max_workers=max_workers, profiler=profiler)
+
+    assert sorted(stages) == sorted([
+        "load_harvard", "load_qog", "merge", "fill_clip",
+        "clean_names", "summary", "plot", "extremes",
+    ])
+    records = {r["stage"]: r for r in profiler.records}
+    assert records["merge"]["rows_in"] == 4
+    assert records["clean_names"]["rows_out"] == len(merged)
+
+
+def test_run_pipeline_writes_outputs(tmp_path, capfd):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA"],
+        "year": [2023, 2023],
+        "eci_sitc": [0.5, 0.7],
+        "eci_rank_sitc": [1, 2],
+        "cname": ["United States (the)", "France"],
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({"ccodealp": ["USA", "FRA"], "bti_ep": [7.5, 8.25]}).to_excel(qog_file, index=False)
+
+    output_dir = tmp_path / "out"
+    merged, summary, extremes = run_pipeline(str(harvard_file), str(qog_file), output_dir=str(output_dir))
+
+    assert "count" not in capfd.readouterr().out
+    manifest = json.loads((output_dir / "manifest.json").read_text())
+    assert [f["name"] for f in manifest["files"]] == ["merged", "summary", "extremes"]
+    assert manifest["files"][0]["rows"] == len(merged)
+    assert "pipeline" in manifest["timings"]
+    # Text columns are read as Arrow-backed strings by the pipeline
+    with pd.option_context("mode.string_storage", "pyarrow"):
+        pd.testing.assert_frame_equal(pd.read_parquet(output_dir / "merged.parquet"), merged)
+    pd.testing.assert_frame_equal(pd.read_parquet(output_dir / "extremes.parquet"), extremes)
+
+
+def test_run_pipeline_dtype_optimization_keeps_results(tmp_path, capfd):
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({
+        "ccodealp": ["AFG", "ALB", "DZA", "AGO"],
+        "cname": ["Afghanistan", "Albania", "Algeria", "Angola"],
+        "bti_ep": [3.5, 7.25, 5.0, 4.75],
+        "wef_gci": [None, 3.9, 3.6, 3.1],
+    }).to_excel(qog_file, index=False)
+    harvard_csv = str(Path(__file__).parent / "growth_proj_eci_rankings.csv")
+
+    plain = run_pipeline(harvard_csv, str(qog_file), string_dtype=None)
+    plain_out = capfd.readouterr().out
+    merged, summary, extremes = run_pipeline(harvard_csv, str(qog_file))
+
+    # The default pipeline holds less memory and prints the same results
+    assert capfd.readouterr().out == plain_out
+    assert merged["country_iso3_code"].dtype == "string[pyarrow]"
+    assert merged.memory_usage(deep=True).sum() < plain[0].memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(merged, plain[0], check_dtype=False)
+
+    output_dir = tmp_path / "out"
+    optimized = run_pipeline(harvard_csv, str(qog_file), dtype_optimization=True, output_dir=str(output_dir))
+
+    memory = json.loads((output_dir / "manifest.json").read_text())["memory"]
+    assert memory["bytes_after"] < memory["bytes_before"]
+    pd.testing.assert_frame_equal(optimized[0], plain[0], check_dtype=False, check_categorical=False)
+    for result in (summary, optimized[1]):
+        pd.testing.assert_frame_equal(result, plain[1])
+    for result in (extremes, optimized[2]):
+        pd.testing.assert_frame_equal(result, plain[2])
\ No newline at end of file
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")  # Prevent GUI windows from opening during tests
+
+import numpy as np
+import pandas as pd
+
+from econ_analysis_gbm2118.__main__ import main
+from econ_analysis_gbm2118.profiling import RECORD_FIELDS, StageProfiler, profiled_call
+
+
+def test_profiled_call_records_shapes_and_memory():
+    df = pd.DataFrame({"a": np.arange(10.0), "b": np.arange(10.0)})
+
+    result, record = profiled_call("double", lambda frame: pd.concat([frame, frame]), (df,))
+
+    assert len(result) == 20
+    assert set(record) == set(RECORD_FIELDS)
+    assert record["stage"] == "double"
+    assert (record["rows_in"], record["columns_in"]) == (10, 2)
+    assert (record["rows_out"], record["columns_out"]) == (20, 2)
+    assert record["wall_time"] >= 0
+    assert record["peak_traced_bytes"] > 0
+
+
+def test_stage_profiler_callbacks_and_report(tmp_path):
+    seen = []
+    profiler = StageProfiler(callbacks=[seen.append], trace_memory=False)
+
+    with profiler:
+        total = profiler.run("sum", sum, [1, 2, 3])
+
+    assert total == 6
+    assert [r["stage"] for r in seen] == ["sum"]
+    assert seen[0]["rows_in"] is None
+    assert seen[0]["peak_traced_bytes"] is None
+
+    report_path = tmp_path / "profile.json"
+    profiler.to_json(report_path)
+    report = json.loads(report_path.read_text())
+    assert report["stages"][0]["stage"] == "sum"
+    assert list(profiler.to_frame().columns) == RECORD_FIELDS
+
+
+def test_cli_profile_to_stdout_is_valid_json(tmp_path, capsys):
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({
+        "ccodealp": ["AFG", "ALB"],
+        "cname": ["Afghanistan", "Albania"],
+        "bti_ep": [3.5, 7.25],
+    }).to_excel(qog_file, index=False)
+    harvard_csv = Path(__file__).parent / "growth_proj_eci_rankings.csv"
+
+    main(["--harvard", str(harvard_csv), "--qog", str(qog_file), "--no-cache", "--profile"])
+
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert "summary" in {record["stage"] for record in report["stages"]}
+    # The summary table and warnings still reach the console
+    assert "Warning: Missing columns" in captured.err
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from econ_analysis_gbm2118.regression import run_specifications, specification_grid
+
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(0)
+    n = 120
+    df = pd.DataFrame({
+        "eci_sitc": rng.normal(size=n),
+        "eci_hs92": rng.normal(size=n),
+        "bti_ep": rng.normal(5, 2, size=n),
+        "mad_gdppc": rng.normal(30000, 10000, size=n),
+        "year": np.repeat([2022, 2023], n // 2),
+    })
+    df["growth_proj"] = 1 + 0.5 * df["eci_sitc"] - 0.2 * df["bti_ep"] + rng.normal(size=n)
+    df.loc[rng.random(n) < 0.15, "bti_ep"] = np.nan
+    return df
+
+
+def lstsq_fit(df, regressors):
+    data = df[["growth_proj"] + regressors].dropna()
+    X = np.column_stack([np.ones(len(data)), data[regressors].to_numpy()])
+    y = data["growth_proj"].to_numpy()
+    beta = np.linalg.lstsq(X, y, rcond=None)[0]
+    resid = y - X @ beta
+    sigma2 = resid @ resid / (len(y) - X.shape[1])
+    se = np.sqrt(np.diag(sigma2 * np.linalg.inv(X.T @ X)))
+    r2 = 1 - resid @ resid / ((y - y.mean()) @ (y - y.mean()))
+    return beta, se, r2, len(y)
+
+
+def test_specification_grid_size():
+    specs = specification_grid(["a", "b"], ["c", "d", "e"], max_controls=2)
+
+    # 2 main regressors x (1 + 3 + 3) control subsets
+    assert len(specs) == 14
+    assert ("a",) in specs
+    assert ("b", "c", "e") in specs
+
+
+def test_run_specifications_matches_lstsq(regression_data):
+    specs = specification_grid(["eci_sitc", "eci_hs92"], ["bti_ep", "mad_gdppc"])
+    result = run_specifications(regression_data, specs)
+
+    assert result["spec"].nunique() == len(specs)
+    for spec_id, spec in enumerate(specs):
+        fitted = result[result["spec"] == spec_id]
+        beta, se, r2, nobs = lstsq_fit(regression_data, list(spec))
+
+        assert fitted["term"].tolist() == ["const"] + list(spec)
+        np.testing.assert_allclose(fitted["coef"], beta, rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(fitted["std_error"], se, rtol=1e-8)
+        assert fitted["r_squared"].iloc[0] == pytest.approx(r2)
+        assert fitted["nobs"].iloc[0] == nobs
+
+
+def test_run_specifications_mixed_missing_patterns(regression_data):
+    # Independent gaps in two controls give most specifications their
+    # own estimation sample and Gram matrix
+    rng = np.random.default_rng(1)
+    df = regression_data.copy()
+    df.loc[rng.random(len(df)) < 0.2, "mad_gdppc"] = np.nan
+    df.loc[rng.random(len(df)) < 0.1, "eci_hs92"] = np.nan
+    specs = specification_grid(["eci_sitc", "eci_hs92"], ["bti_ep", "mad_gdppc"])
+    result = run_specifications(df, specs)
+
+    assert result.groupby("spec")["nobs"].first().nunique() > 4
+    for spec_id, spec in enumerate(specs):
+        fitted = result[result["spec"] == spec_id]
+        beta, se, r2, nobs = lstsq_fit(df, list(spec))
+
+        np.testing.assert_allclose(fitted["coef"], beta, rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(fitted["std_error"], se, rtol=1e-8)
+        assert fitted["nobs"].iloc[0] == nobs
+
+
+def test_run_specifications_common_sample(regression_data):
+    specs = [["eci_sitc"], ["eci_sitc", "bti_ep"]]
+    result = run_specifications(regression_data, specs, sample="common")
+
+    complete = regression_data[["growth_proj", "eci_sitc", "bti_ep"]].dropna()
+    assert (result["nobs"] == len(complete)).all()
+
+    with pytest.raises(ValueError):
+        run_specifications(regression_data, specs, sample="pairwise")
+
+
+def test_run_specifications_by_year(regression_data):
+    specs = [["eci_sitc"], ["eci_hs92", "mad_gdppc"]]
+    serial = run_specifications(regression_data, specs, by="year")
+    parallel = run_specifications(regression_data, specs, by="year", n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial["year"].unique().tolist() == [2022, 2023]
+
+    year_2023 = serial[(serial["year"] == 2023) & (serial["spec"] == 0)]
+    beta, _, _, _ = lstsq_fit(regression_data[regression_data["year"] == 2023], ["eci_sitc"])
+    np.testing.assert_allclose(year_2023["coef"], beta, rtol=1e-8)
@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pandas as pd
+import pytest
+
+from econ_analysis_gbm2118 import service as service_module
+from econ_analysis_gbm2118.service import QueryService, make_server
+
+
+def write_sources(tmp_path, growth=(1.0, 2.0, 3.0)):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "DEU"],
+        "year": [2023, 2023, 2023],
+        "growth_proj": list(growth),
+        "eci_sitc": [0.5, 0.7, 0.9],
+        "eci_rank_sitc": [3, 2, 1],
+        "cname": ["United States (the)", "France", "Germany"],
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    if not qog_file.exists():
+        pd.DataFrame({
+            "ccodealp": ["USA", "FRA", "DEU"],
+            "bti_ep": [7.5, 8.25, None],
+        }).to_excel(qog_file, index=False)
+    return str(harvard_file), str(qog_file)
+
+
+def test_query_service_caches_results(tmp_path):
+    service = QueryService(*write_sources(tmp_path))
+
+    first = json.loads(service.query("stats", variables="growth_proj,eci_sitc"))
+    second = json.loads(service.query("stats", variables="growth_proj,eci_sitc"))
+
+    assert first == second
+    assert first["index"] == ["growth_proj", "eci_sitc"]
+    assert (service.hits, service.misses) == (1, 1)
+
+    corr = json.loads(service.query("correlation", columns="growth_proj,bti_ep"))
+    # Correlations use the raw merge, so the missing governance value
+    # leaves only two complete pairs
+    assert corr["counts"]["data"] == [[3, 2], [2, 2]]
+    assert service.raw["bti_ep"].isna().sum() == 1
+    assert service.frame["bti_ep"].notna().all()
+    extremes = json.loads(service.query("extremes", top_n="2"))
+    assert len(extremes["data"]) == 2
+
+
+def test_query_service_reloads_changed_sources(tmp_path):
+    harvard_file, qog_file = write_sources(tmp_path)
+    service = QueryService(harvard_file, qog_file, cache_size=1)
+    before = json.loads(service.query("stats", variables="growth_proj"))
+
+    write_sources(tmp_path, growth=(10.0, 20.0, 30.0))
+    stat = os.stat(harvard_file)
+    os.utime(harvard_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    after = json.loads(service.query("stats", variables="growth_proj"))
+
+    assert service.reloads == 1
+    assert after["data"][0][1] == pytest.approx(20.0)
+    assert after != before
+
+
+def test_query_service_keeps_data_while_source_is_missing(tmp_path):
+    harvard_file, qog_file = write_sources(tmp_path)
+    service = QueryService(harvard_file, qog_file)
+    before = service.query("stats", variables="growth_proj")
+
+    os.remove(harvard_file)
+
+    assert service.refresh() is False
+    assert service.query("stats", variables="growth_proj") == before
+    assert service.reloads == 0
+
+
+def test_query_service_rejects_bad_queries(tmp_path):
+    service = QueryService(*write_sources(tmp_path))
+
+    with pytest.raises(KeyError):
+        service.query("regression")
+    with pytest.raises(ValueError):
+        service.query("extremes", rank_col1="missing")
+    with pytest.raises(ValueError):
+        service.query("correlation", columns="missing")
+
+
+def test_http_server_answers_queries(tmp_path, monkeypatch):
+    service = QueryService(*write_sources(tmp_path))
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with urllib.request.urlopen(f"{base}/stats?variables=growth_proj") as response:
+            assert json.load(response)["index"] == ["growth_proj"]
+        with urllib.request.urlopen(f"{base}/health") as response:
+            assert json.load(response)["rows"] == 3
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base}/unknown")
+        assert excinfo.value.code == 404
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base}/extremes?top_n=many")
+        assert excinfo.value.code == 400
+
+        def failing_query(frame, raw, **params):
+            raise KeyError("eci_sitc")
+
+        monkeypatch.setitem(service_module._QUERIES, "stats", failing_query)
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base}/stats?variables=eci_sitc")
+        assert excinfo.value.code == 500
+        assert "KeyError" in json.load(excinfo.value)["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import pytest
+
+from econ_analysis_gbm2118.data import iter_harvard_chunks
+from econ_analysis_gbm2118.streaming import (
+    StreamingSummary,
+    TDigest,
+    streaming_summary_statistics,
+)
+
+SAMPLE_CSV = Path(__file__).parent / "growth_proj_eci_rankings.csv"
+
+
+def test_streaming_summary_matches_describe_on_small_data():
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, np.nan, 4.0, 10.0],
+        "b": [5, 4, 3, 2, 1],
+    })
+
+    chunks = [df.iloc[:2], df.iloc[2:]]
+    result = streaming_summary_statistics(chunks, ["a", "b"])
+
+    # Small inputs stay below the compression threshold, so even the
+    # quartiles are exact
+    pd.testing.assert_frame_equal(result, df.describe().T)
+
+
+def test_streaming_summary_from_chunked_harvard_reader():
+    cols = ["growth_proj", "eci_sitc", "eci_hs12"]
+    chunks = iter_harvard_chunks(SAMPLE_CSV, chunksize=400, year=None)
+    result = streaming_summary_statistics(chunks, cols)
+    expected = pd.read_csv(SAMPLE_CSV)[cols].describe().T
+
+    assert list(result.columns) == list(expected.columns)
+    exact = ["count", "mean", "std", "min", "max"]
+    np.testing.assert_allclose(result[exact], expected[exact], rtol=1e-10)
+    # Quartiles come from the sketch and are approximate
+    np.testing.assert_allclose(result[["25%", "50%", "75%"]], expected[["25%", "50%", "75%"]], atol=0.05)
+
+
+def test_streaming_summary_merge_matches_single_pass():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=5000), "y": rng.exponential(size=5000)})
+
+    single = StreamingSummary(["x", "y"]).update(df).result()
+
+    # Partial accumulators, as built by separate workers
+    parts = [StreamingSummary(["x", "y"]).update(df.iloc[i:i + 1000]) for i in range(0, 5000, 1000)]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    merged = merged.result()
+
+    exact = ["count", "mean", "std", "min", "max"]
+    np.testing.assert_allclose(merged[exact], single[exact], rtol=1e-10)
+    np.testing.assert_allclose(merged[["25%", "50%", "75%"]], df.quantile([0.25, 0.5, 0.75]).T, atol=0.05)
+
+
+def test_streaming_summary_missing_columns(capfd):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    result = streaming_summary_statistics([df], ["a", "x"])
+
+    assert list(result.index) == ["a"]
+    assert "x" in capfd.readouterr().out
+
+
+def test_tdigest_empty_and_mismatched_merges():
+    digest = TDigest().update([np.nan])
+    assert np.isnan(digest.quantile(0.5))
+
+    digest.merge(TDigest().update([1.0, 2.0, 3.0]))
+    assert digest.quantile(0.5) == 2.0
+
+    with pytest.raises(ValueError):
+        StreamingSummary(["a"]).merge(StreamingSummary(["b"]))
+
+
+def test_tdigest_update_constant_matches_repeated_values():
+    values = np.array([1.0, 2.0, 8.0, 9.0])
+    expected = np.quantile(np.r_[values, np.full(5, 4.0)], [0.01, 0.3, 0.5, 0.7, 0.99])
+
+    digest = TDigest().update(values).update_constant(4.0, 5)
+
+    np.testing.assert_allclose(digest.quantile([0.01, 0.3, 0.5, 0.7, 0.99]), expected)
+    assert digest.count == 9
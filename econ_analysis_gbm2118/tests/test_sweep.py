@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from econ_analysis_gbm2118.pipeline import run_pipeline
+from econ_analysis_gbm2118.sweep import SWEEP_COLUMNS, run_sweep, sweep_grid
+
+
+@pytest.fixture
+def sources(tmp_path):
+    harvard_file = tmp_path / "harvard.csv"
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "DEU", "USA", "FRA", "DEU"],
+        "year": [2022, 2022, 2022, 2023, 2023, 2023],
+        "growth_proj": [1.0, 2.0, 3.0, 1.5, 2.5, 3.5],
+        "eci_sitc": [0.5, 0.7, 0.9, 0.6, 0.8, 1.0],
+        "eci_rank_sitc": [3, 2, 1, 1, 2, 3],
+        "cname": ["United States (the)", "France", "Germany"] * 2,
+    }).to_csv(harvard_file, index=False)
+
+    qog_file = tmp_path / "qog.xlsx"
+    pd.DataFrame({
+        "ccodealp": ["USA", "FRA", "DEU"],
+        "bti_ep": [7.5, 8.25, 9.5],
+        "wef_gci": [5.5, 4.5, 6.5],
+    }).to_excel(qog_file, index=False)
+    return str(harvard_file), str(qog_file)
+
+
+def test_sweep_grid_is_cartesian_product():
+    grid = sweep_grid(year=[2022, 2023], rank_col2=["bti_ep", "wef_gci"])
+
+    assert grid == [
+        {"year": 2022, "rank_col2": "bti_ep"},
+        {"year": 2022, "rank_col2": "wef_gci"},
+        {"year": 2023, "rank_col2": "bti_ep"},
+        {"year": 2023, "rank_col2": "wef_gci"},
+    ]
+
+
+def test_run_sweep_consolidates_configurations(sources):
+    sweep = sweep_grid(year=[2022, 2023], rank_col2=["bti_ep", "wef_gci"])
+    sweep.append({"vars_of_interest": ["growth_proj"], "top_n": 1})
+
+    result = run_sweep(*sources, sweep, n_jobs=1)
+
+    assert list(result.columns) == SWEEP_COLUMNS
+    assert sorted(result["config"].unique()) == list(range(5))
+
+    # Each year is clipped to its own 1st-99th percentile
+    growth_mean = result.query("analysis == 'summary' and label == 'growth_proj' and statistic == 'mean'")
+    assert growth_mean.set_index("config")["value"].to_dict() == pytest.approx(
+        {0: 2.0, 1: 2.0, 2: 2.5, 3: 2.5, 4: 2.25}, abs=0.01
+    )
+
+    top = result.query("config == 4 and analysis == 'extremes' and statistic == 'rank_difference'")
+    assert len(top) == 1
+
+
+def test_run_sweep_cleans_each_year_like_run_pipeline(tmp_path, sources):
+    harvard_file, qog_file = sources
+    # The 2023 median differs from the panel-wide one, so imputing with
+    # the panel would change the 2023 mean
+    pd.DataFrame({
+        "country_iso3_code": ["USA", "FRA", "DEU", "USA", "FRA", "DEU"],
+        "year": [2022, 2022, 2022, 2023, 2023, 2023],
+        "growth_proj": [10.0, 20.0, 30.0, 1.0, 2.0, None],
+        "eci_sitc": [0.5, 0.7, 0.9, 0.6, 0.8, 1.0],
+        "eci_rank_sitc": [3, 2, 1, 1, 2, 3],
+        "cname": ["United States (the)", "France", "Germany"] * 2,
+    }).to_csv(harvard_file, index=False)
+
+    _, summary, extremes = run_pipeline(harvard_file, qog_file, max_workers=1)
+    result = run_sweep(harvard_file, qog_file, [{"year": 2023}, {"year": None}], n_jobs=1)
+
+    means = result.query("analysis == 'summary' and statistic == 'mean'")
+    yearly = means[means["config"] == 0].set_index("label")["value"]
+    pd.testing.assert_series_equal(
+        yearly, summary["mean"].astype("float64").rename("value").rename_axis("label"), check_index_type=False
+    )
+    assert means.query("config == 1 and label == 'growth_proj'")["value"].item() != pytest.approx(yearly["growth_proj"])
+
+    ranked = result.query("config == 0 and analysis == 'extremes' and statistic == 'rank_difference'")
+    assert ranked["label"].tolist() == extremes["cname"].tolist()
+
+
+def test_run_sweep_pool_matches_serial(sources):
+    sweep = sweep_grid(year=[2022, 2023], top_n=[1, 3])
+
+    serial = run_sweep(*sources, sweep, n_jobs=1)
+    pooled = run_sweep(*sources, sweep, n_jobs=2)
+
+    pd.testing.assert_frame_equal(pooled, serial)
+
+
+def test_run_sweep_rejects_unknown_parameters(sources):
+    with pytest.raises(KeyError):
+        run_sweep(*sources, [{"years": 2023}])
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from econ_analysis_gbm2118.cleaning import clean_merged_data
+from econ_analysis_gbm2118.data import HARVARD_DTYPES, QOG_COLUMNS, load_harvard_data, load_qog_data
+from econ_analysis_gbm2118.synthetic import iso3_codes, make_harvard, make_qog, write_synthetic_sources
+
+
+def test_make_harvard_matches_schema():
+    df = make_harvard(countries=20, years=5, seed=0)
+
+    assert len(df) == 100
+    assert df.dtypes.astype(str).to_dict() == HARVARD_DTYPES
+    assert df["year"].min() == 2019 and df["year"].max() == 2023
+    # Ranks are a permutation within each year, ignoring missing values
+    ranks = df.dropna(subset=["eci_sitc"]).groupby("year")["eci_rank_sitc"]
+    assert (ranks.max() == ranks.count()).all()
+
+
+def test_make_harvard_is_reproducible_and_masks_early_years():
+    df = make_harvard(countries=10, years=30, seed=1)
+
+    pd.testing.assert_frame_equal(df, make_harvard(countries=10, years=30, seed=1))
+    assert df.loc[df["year"] < 2012, "eci_hs12"].isna().all()
+    assert df.loc[df["year"] < 2021, "growth_proj"].isna().all()
+
+
+def test_make_harvard_product_level():
+    df = make_harvard(countries=3, years=2, products=4, seed=0)
+
+    assert len(df) == 24
+    assert {"product_id", "export_value", "import_value"} <= set(df.columns)
+    assert df.groupby(["country_iso3_code", "year"])["product_id"].nunique().eq(4).all()
+
+
+def test_make_qog_matches_harvard_codes():
+    qog = make_qog(countries=12, extra_columns=3, seed=0)
+
+    assert list(qog.columns) == QOG_COLUMNS + ["ind_000", "ind_001", "ind_002"]
+    assert qog["ccodealp"].tolist() == iso3_codes(12)
+    assert qog["cname"].str.endswith(" (the)").sum() == 2
+
+
+def test_write_synthetic_sources_round_trip_through_pipeline(tmp_path):
+    harvard_csv, qog_xlsx = write_synthetic_sources(tmp_path, countries=15, years=3, seed=0)
+
+    harvard = load_harvard_data(str(harvard_csv), year=None)
+    merged = clean_merged_data(harvard, load_qog_data(str(qog_xlsx)))
+
+    assert len(merged) == 45
+    assert merged["cname"].notna().all()
+    assert not merged["cname"].str.contains(r"\(the\)").any()
@@ -1,11 +1,15 @@
+from pathlib import Path
+
 import pandas as pd
 import matplotlib
+import numpy as np
 import pytest
 
 # Use a non-interactive backend to prevent GUI windows
 matplotlib.use("Agg")
+import matplotlib.pyplot as plt
 
-from econ_analysis_gbm2118.visualization import plot_eci_vs_gci
+from econ_analysis_gbm2118.visualization import plot_eci_vs_gci, render_plots
 
 
 def test_plot_runs_with_basic_data():
@@ -46,3 +50,74 @@ def test_plot_empty_dataframe():
 
     # Should not crash on empty data
     plot_eci_vs_gci(df)
+
+
+def test_plot_switches_to_density_above_threshold():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "eci_sitc": rng.normal(size=1000),
+        "wef_gci": rng.normal(size=1000),
+    })
+
+    plt.close("all")
+    plot_eci_vs_gci(df, density_threshold=500, gridsize=20)
+    ax = plt.gca()
+    assert len(ax.images) == 1
+    assert ax.images[0].get_array().sum() == 1000
+    assert not ax.collections
+
+    plt.close("all")
+    plot_eci_vs_gci(df, density_threshold=None)
+    assert len(plt.gca().collections) == 1
+    plt.close("all")
+
+
+@pytest.fixture
+def panel_frame():
+    return pd.DataFrame({
+        "year": [2020, 2020, 2021, 2021, 2022],
+        "eci_sitc": [1.0, 2.0, 3.0, None, 5.0],
+        "wef_gci": [10.0, 20.0, 30.0, 40.0, 50.0],
+        "bti_ep": [4.0, 5.0, 6.0, 7.0, 8.0],
+    })
+
+
+def test_render_plots_writes_manifest(panel_frame, tmp_path):
+    manifest = render_plots(
+        panel_frame,
+        [("eci_sitc", "wef_gci"), ("eci_sitc", "bti_ep")],
+        tmp_path,
+        formats=("png", "svg"),
+        max_workers=1,
+    )
+
+    assert len(manifest) == 4
+    assert set(manifest["format"]) == {"png", "svg"}
+    assert (manifest["n_obs"] == 4).all()
+    for path in manifest["path"]:
+        assert Path(path).stat().st_size > 0
+
+
+def test_render_plots_by_year_in_range(panel_frame, tmp_path):
+    manifest = render_plots(
+        panel_frame,
+        [("eci_sitc", "wef_gci")],
+        tmp_path,
+        years=(2021, None),
+        by_year=True,
+        max_workers=2,
+    )
+
+    assert manifest["year"].tolist() == [2021, 2022]
+    assert manifest["n_obs"].tolist() == [1, 1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "wef_gci_vs_eci_sitc_2021.png",
+        "wef_gci_vs_eci_sitc_2022.png",
+    ]
+
+
+def test_render_plots_skips_missing_columns(panel_frame, tmp_path, capfd):
+    manifest = render_plots(panel_frame, [("eci_sitc", "missing")], tmp_path)
+
+    assert manifest.empty
+    assert "Warning: Missing columns" in capfd.readouterr().out